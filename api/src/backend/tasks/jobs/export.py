@@ -53,6 +53,7 @@ from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_m365
 from prowler.lib.outputs.csv.csv import CSV
 from prowler.lib.outputs.html.html import HTML
 from prowler.lib.outputs.ocsf.ocsf import OCSF
+from prowler.providers.aws.lib.s3.s3 import S3
 
 logger = get_task_logger(__name__)
 
@@ -178,7 +179,7 @@ def _upload_to_s3(tenant_id: str, zip_path: str, scan_id: str) -> str:
         scan_id (str): The scan identifier, used as part of the S3 key prefix.
     Returns:
         str: The S3 URI of the uploaded file (e.g., "s3://<bucket>/<key>") if successful.
-        None: If the required environment variables for the S3 bucket are not set.
+        None: If the required environment variables for the S3 bucket are not set or any upload fails.
     Raises:
         botocore.exceptions.ClientError: If the upload attempt to S3 fails for any reason.
     """
@@ -189,22 +190,28 @@ def _upload_to_s3(tenant_id: str, zip_path: str, scan_id: str) -> str:
     try:
         s3 = get_s3_client()
 
-        # Upload the ZIP file (outputs) to the S3 bucket
+        # The ZIP file (outputs) and the compliance directory are uploaded concurrently
         zip_key = f"{tenant_id}/{scan_id}/{os.path.basename(zip_path)}"
-        s3.upload_file(
-            Filename=zip_path,
-            Bucket=bucket,
-            Key=zip_key,
-        )
+        objects = [{"Filename": zip_path, "Key": zip_key}]
 
-        # Upload the compliance directory to the S3 bucket
         compliance_dir = os.path.join(os.path.dirname(zip_path), "compliance")
         for filename in os.listdir(compliance_dir):
             local_path = os.path.join(compliance_dir, filename)
             if not os.path.isfile(local_path):
                 continue
             file_key = f"{tenant_id}/{scan_id}/compliance/{filename}"
-            s3.upload_file(Filename=local_path, Bucket=bucket, Key=file_key)
+            objects.append({"Filename": local_path, "Key": file_key})
+
+        upload_errors = {
+            key: error
+            for key, error in S3.upload_objects(s3, bucket, objects).items()
+            if error
+        }
+        # Any failed upload makes the whole export fail
+        if upload_errors:
+            for key, error in upload_errors.items():
+                logger.error(f"S3 upload failed for {key}: {str(error)}")
+            return None
 
         return f"s3://{base.DJANGO_OUTPUT_S3_AWS_OUTPUT_BUCKET}/{zip_key}"
     except (ClientError, NoCredentialsError, ParamValidationError, ValueError) as e:
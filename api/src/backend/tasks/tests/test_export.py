@@ -76,6 +76,61 @@ class TestOutputs:
         assert result == expected_uri
         assert client_mock.upload_file.call_count == 2
 
+    @patch("tasks.jobs.export.get_s3_client")
+    @patch("tasks.jobs.export.base")
+    @patch("tasks.jobs.export.logger.error")
+    def test_upload_to_s3_zip_failure(
+        self, mock_logger, mock_base, mock_get_client, tmpdir
+    ):
+        mock_base.DJANGO_OUTPUT_S3_AWS_OUTPUT_BUCKET = "test-bucket"
+
+        base_tmp = Path(str(tmpdir.mkdir("upload_zip_failure")))
+        zip_path = base_tmp / "outputs.zip"
+        zip_path.write_bytes(b"dummy")
+
+        compliance_dir = base_tmp / "compliance"
+        compliance_dir.mkdir()
+        (compliance_dir / "report.csv").write_text("ok")
+
+        def upload_file(Filename, Bucket, Key, **kwargs):
+            if Key.endswith("outputs.zip"):
+                raise ClientError({"Error": {}}, "PutObject")
+
+        client_mock = MagicMock()
+        client_mock.upload_file.side_effect = upload_file
+        mock_get_client.return_value = client_mock
+
+        assert _upload_to_s3("tenant-id", str(zip_path), "scan-id") is None
+        assert client_mock.upload_file.call_count == 2
+        mock_logger.assert_called()
+
+    @patch("tasks.jobs.export.get_s3_client")
+    @patch("tasks.jobs.export.base")
+    @patch("tasks.jobs.export.logger.error")
+    def test_upload_to_s3_compliance_failure(
+        self, mock_logger, mock_base, mock_get_client, tmpdir
+    ):
+        mock_base.DJANGO_OUTPUT_S3_AWS_OUTPUT_BUCKET = "test-bucket"
+
+        base_tmp = Path(str(tmpdir.mkdir("upload_compliance_failure")))
+        zip_path = base_tmp / "outputs.zip"
+        zip_path.write_bytes(b"dummy")
+
+        compliance_dir = base_tmp / "compliance"
+        compliance_dir.mkdir()
+        (compliance_dir / "report.csv").write_text("ok")
+
+        def upload_file(Filename, Bucket, Key, **kwargs):
+            if Key.endswith("report.csv"):
+                raise ClientError({"Error": {}}, "PutObject")
+
+        client_mock = MagicMock()
+        client_mock.upload_file.side_effect = upload_file
+        mock_get_client.return_value = client_mock
+
+        assert _upload_to_s3("tenant-id", str(zip_path), "scan-id") is None
+        mock_logger.assert_called()
+
     @patch("tasks.jobs.export.get_s3_client")
     @patch("tasks.jobs.export.base")
     def test_upload_to_s3_missing_bucket(self, mock_base, mock_get_client):
@@ -0,0 +1,89 @@
+import glob
+import os
+
+import pandas as pd
+
+from prowler.lib.logger import logger
+
+
+class CSVDataStore:
+    """
+    CSVDataStore keeps the CSV files of an output folder loaded in memory.
+
+    Every file is read just once, refreshing the store only reads the files that are new or changed since the last refresh, so the callbacks filter the cached data instead of reading the CSV files again.
+    """
+
+    def __init__(self, folder_path: str, **read_csv_options) -> None:
+        """
+        Args:
+            folder_path (str): The folder with the CSV files.
+            read_csv_options: The options used to read the CSV files with pandas.read_csv.
+        """
+        self._folder_path = folder_path
+        self._read_csv_options = read_csv_options
+        # {file: ((mtime, size), data)}, data is None if the file could not be read
+        self._files = {}
+
+    def refresh(self) -> bool:
+        """
+        Reads the new and changed CSV files of the folder and forgets the removed ones.
+
+        Returns:
+            bool: True if any file was added, changed or removed.
+        """
+        changed = False
+        files = glob.glob(os.path.join(self._folder_path, "*.csv"))
+        for file in set(self._files) - set(files):
+            del self._files[file]
+            changed = True
+
+        files_read = {}
+        for file in files:
+            try:
+                file_stat = os.stat(file)
+            except OSError:
+                continue
+            signature = (file_stat.st_mtime_ns, file_stat.st_size)
+            if file in self._files and self._files[file][0] == signature:
+                files_read[file] = self._files[file]
+                continue
+            try:
+                data = pd.read_csv(file, **self._read_csv_options)
+            except Exception as error:
+                logger.error(
+                    f"Error reading file {file} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+                data = None
+            files_read[file] = (signature, data)
+            changed = True
+        # Keep the files in the same order they are listed in the folder
+        self._files = files_read
+        return changed
+
+    def get_files(self, min_rows: int = 1) -> list[str]:
+        """
+        Returns the files read with at least the given number of rows.
+
+        Args:
+            min_rows (int): The minimum number of rows of the files.
+
+        Returns:
+            list[str]: The files.
+        """
+        return [
+            file
+            for file, (_, data) in self._files.items()
+            if data is not None and len(data) >= min_rows
+        ]
+
+    def get_data(self, file: str) -> pd.DataFrame:
+        """
+        Returns a copy of the data of a file, so the cached data is not modified by the caller.
+
+        Args:
+            file (str): The file.
+
+        Returns:
+            pd.DataFrame: The data of the file.
+        """
+        return self._files[file][1].copy()
@@ -1,8 +1,5 @@
 # Standard library imports
-import csv
-import glob
 import importlib
-import os
 import re
 import warnings
 
@@ -23,6 +20,7 @@ from dashboard.config import (
     manual_color,
     pass_color,
 )
+from dashboard.lib.data_store import CSVDataStore
 from dashboard.lib.dropdowns import (
     create_account_dropdown_compliance,
     create_compliance_dropdown,
@@ -30,7 +28,6 @@ from dashboard.lib.dropdowns import (
     create_region_dropdown_compliance,
 )
 from dashboard.lib.layouts import create_layout_compliance
-from prowler.lib.logger import logger
 
 # Suppress warnings
 warnings.filterwarnings("ignore")
@@ -38,18 +35,16 @@ warnings.filterwarnings("ignore")
 # Global variables
 # TODO: Create a flag to let the user put a custom path
 
-csv_files = []
-for file in glob.glob(os.path.join(folder_path_compliance, "*.csv")):
-    try:
-        with open(
-            file, "r", newline="", encoding=encoding_format, errors=error_action
-        ) as csvfile:
-            reader = csv.reader(csvfile)
-            num_rows = sum(1 for row in reader)
-            if num_rows > 1:
-                csv_files.append(file)
-    except UnicodeDecodeError:
-        logger.error(f"Error decoding file: {file}")
+compliance_data_store = CSVDataStore(
+    folder_path_compliance,
+    sep=";",
+    on_bad_lines="skip",
+    encoding=encoding_format,
+    encoding_errors=error_action,
+    dtype=str,
+)
+compliance_data_store.refresh()
+csv_files = compliance_data_store.get_files()
 
 
 def load_csv_files(csv_files):
@@ -57,7 +52,7 @@ def load_csv_files(csv_files):
     dfs = []
     results = []
     for file in csv_files:
-        df = pd.read_csv(file, sep=";", on_bad_lines="skip", encoding=encoding_format)
+        df = compliance_data_store.get_data(file)
         if "CHECKID" in df.columns:
             dfs.append(df)
             result = file
@@ -240,16 +235,17 @@ def display_data(
     is_level_1 = "level_1" in analytics_input
     analytics_input = analytics_input.replace("_level_1", "").replace("_level_2", "")
 
-    # Filter the data based on the compliance selected
-    files = [file for file in csv_files if analytics_input in file]
+    # Filter the data based on the compliance selected, including the files written since the dashboard started
+    compliance_data_store.refresh()
+    files = [
+        file for file in compliance_data_store.get_files() if analytics_input in file
+    ]
 
     def load_csv_files(files):
         """Load CSV files into a single pandas DataFrame."""
         dfs = []
         for file in files:
-            df = pd.read_csv(
-                file, sep=";", on_bad_lines="skip", encoding=encoding_format, dtype=str
-            )
+            df = compliance_data_store.get_data(file)
             df = df.astype(str).fillna("nan")
             df.columns = df.columns.astype(str)
             dfs.append(df)
@@ -1,7 +1,5 @@
 # Standard library imports
-import glob
 import json
-import os
 import warnings
 from datetime import datetime, timedelta
 from itertools import product
@@ -33,6 +31,7 @@ from dashboard.config import (
     pass_color,
 )
 from dashboard.lib.cards import create_provider_card
+from dashboard.lib.data_store import CSVDataStore
 from dashboard.lib.dropdowns import (
     create_account_dropdown,
     create_date_dropdown,
@@ -44,23 +43,21 @@ from dashboard.lib.dropdowns import (
     create_table_row_dropdown,
 )
 from dashboard.lib.layouts import create_layout_overview
-from prowler.lib.logger import logger
 
 # Suppress warnings
 warnings.filterwarnings("ignore")
 
 # Global variables
 # TODO: Create a flag to let the user put a custom path
-csv_files = []
-
-for file in glob.glob(os.path.join(folder_path_overview, "*.csv")):
-    try:
-        df = pd.read_csv(file, sep=";")
-        num_rows = len(df)
-        if num_rows > 1:
-            csv_files.append(file)
-    except Exception:
-        logger.error(f"Error reading file {file}")
+# The account columns are read as strings to keep their leading zeros
+overview_data_store = CSVDataStore(
+    folder_path_overview,
+    sep=";",
+    on_bad_lines="skip",
+    dtype={column: str for column in ["ACCOUNT_ID", "ACCOUNT_UID", "SUBSCRIPTION"]},
+)
+overview_data_store.refresh()
+csv_files = overview_data_store.get_files(min_rows=2)
 
 
 # Import logos providers
@@ -85,17 +82,7 @@ def load_csv_files(csv_files):
     """Load CSV files into a single pandas DataFrame."""
     dfs = []
     for file in csv_files:
-        account_columns = ["ACCOUNT_ID", "ACCOUNT_UID", "SUBSCRIPTION"]
-
-        df_sample = pd.read_csv(file, sep=";", on_bad_lines="skip", nrows=1)
-
-        dtype_dict = {}
-        for col in account_columns:
-            if col in df_sample.columns:
-                dtype_dict[col] = str
-
-        # Read the full file with proper dtypes
-        df = pd.read_csv(file, sep=";", on_bad_lines="skip", dtype=dtype_dict)
+        df = overview_data_store.get_data(file)
 
         if "CHECK_ID" in df.columns:
             if "TIMESTAMP" in df.columns or df["PROVIDER"].unique() == "aws":
@@ -108,6 +95,34 @@ def load_csv_files(csv_files):
     return data
 
 
+# {file: assessment date}, the files do not change while the dashboard is running
+files_assessment_dates = {}
+
+
+def get_file_assessment_date(file):
+    """Return the assessment date of the findings of a CSV file, None if it is not a findings file."""
+    if file not in files_assessment_dates:
+        assessment_date = None
+        df = overview_data_store.get_data(file)
+        if "CHECK_ID" in df.columns:
+            if "TIMESTAMP" in df.columns or df["PROVIDER"].unique() == "aws":
+                # This handles the case where we are using v3 outputs
+                if "TIMESTAMP" not in df.columns and df["PROVIDER"].unique() == "aws":
+                    # Rename the column 'ASSESSMENT_START_TIME' to 'TIMESTAMP'
+                    df["ASSESSMENT_START_TIME"] = df[
+                        "ASSESSMENT_START_TIME"
+                    ].str.replace("T", " ")
+                    df.rename(
+                        columns={"ASSESSMENT_START_TIME": "TIMESTAMP"}, inplace=True
+                    )
+                    df["TIMESTAMP"] = df["TIMESTAMP"].str.replace("T", " ")
+                df["TIMESTAMP"] = pd.to_datetime(df["TIMESTAMP"])
+                df["TIMESTAMP"] = df["TIMESTAMP"].dt.strftime("%Y-%m-%d")
+                assessment_date = df["TIMESTAMP"][0]
+        files_assessment_dates[file] = assessment_date
+    return files_assessment_dates[file]
+
+
 data = load_csv_files(csv_files)
 
 if data is None:
@@ -683,25 +698,11 @@ def filter_data(
     ]
 
     # Select the files in the list_files that have the same date as the selected date
-    list_files = []
-    for file in csv_files:
-        df = pd.read_csv(file, sep=";", on_bad_lines="skip")
-        if "CHECK_ID" in df.columns:
-            if "TIMESTAMP" in df.columns or df["PROVIDER"].unique() == "aws":
-                # This handles the case where we are using v3 outputs
-                if "TIMESTAMP" not in df.columns and df["PROVIDER"].unique() == "aws":
-                    # Rename the column 'ASSESSMENT_START_TIME' to 'TIMESTAMP'
-                    df["ASSESSMENT_START_TIME"] = df[
-                        "ASSESSMENT_START_TIME"
-                    ].str.replace("T", " ")
-                    df.rename(
-                        columns={"ASSESSMENT_START_TIME": "TIMESTAMP"}, inplace=True
-                    )
-                    df["TIMESTAMP"] = df["TIMESTAMP"].str.replace("T", " ")
-                df["TIMESTAMP"] = pd.to_datetime(df["TIMESTAMP"])
-                df["TIMESTAMP"] = df["TIMESTAMP"].dt.strftime("%Y-%m-%d")
-                if df["TIMESTAMP"][0] == updated_assessment_value:
-                    list_files.append(file)
+    list_files = [
+        file
+        for file in csv_files
+        if get_file_assessment_date(file) == updated_assessment_value
+    ]
     # append all the names of the files
     files_names = []
     for file in list_files:
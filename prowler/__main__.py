@@ -43,66 +43,17 @@ from prowler.lib.check.custom_checks_metadata import (
 from prowler.lib.check.models import CheckMetadata
 from prowler.lib.cli.parser import ProwlerArgumentParser
 from prowler.lib.logger import logger, set_logging_config
-from prowler.lib.outputs.asff.asff import ASFF
-from prowler.lib.outputs.compliance.aws_well_architected.aws_well_architected import (
-    AWSWellArchitected,
-)
-from prowler.lib.outputs.compliance.cis.cis_aws import AWSCIS
-from prowler.lib.outputs.compliance.cis.cis_azure import AzureCIS
-from prowler.lib.outputs.compliance.cis.cis_gcp import GCPCIS
-from prowler.lib.outputs.compliance.cis.cis_github import GithubCIS
-from prowler.lib.outputs.compliance.cis.cis_kubernetes import KubernetesCIS
-from prowler.lib.outputs.compliance.cis.cis_m365 import M365CIS
 from prowler.lib.outputs.compliance.compliance import display_compliance_table
-from prowler.lib.outputs.compliance.ens.ens_aws import AWSENS
-from prowler.lib.outputs.compliance.ens.ens_azure import AzureENS
-from prowler.lib.outputs.compliance.ens.ens_gcp import GCPENS
-from prowler.lib.outputs.compliance.generic.generic import GenericCompliance
-from prowler.lib.outputs.compliance.iso27001.iso27001_aws import AWSISO27001
-from prowler.lib.outputs.compliance.iso27001.iso27001_azure import AzureISO27001
-from prowler.lib.outputs.compliance.iso27001.iso27001_gcp import GCPISO27001
-from prowler.lib.outputs.compliance.iso27001.iso27001_kubernetes import (
-    KubernetesISO27001,
-)
-from prowler.lib.outputs.compliance.iso27001.iso27001_m365 import M365ISO27001
-from prowler.lib.outputs.compliance.iso27001.iso27001_nhn import NHNISO27001
-from prowler.lib.outputs.compliance.kisa_ismsp.kisa_ismsp_aws import AWSKISAISMSP
-from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_aws import AWSMitreAttack
-from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_azure import (
-    AzureMitreAttack,
-)
-from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_gcp import GCPMitreAttack
-from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_aws import (
-    ProwlerThreatScoreAWS,
-)
-from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_azure import (
-    ProwlerThreatScoreAzure,
-)
-from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_gcp import (
-    ProwlerThreatScoreGCP,
-)
-from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_m365 import (
-    ProwlerThreatScoreM365,
-)
-from prowler.lib.outputs.csv.csv import CSV
-from prowler.lib.outputs.finding import Finding
-from prowler.lib.outputs.html.html import HTML
-from prowler.lib.outputs.ocsf.ocsf import OCSF
+from prowler.lib.outputs.finding import Finding, FindingOutputContext
 from prowler.lib.outputs.outputs import extract_findings_statistics
-from prowler.lib.outputs.slack.slack import Slack
+from prowler.lib.outputs.statistics import FindingsColumns
+from prowler.lib.outputs.registry import (
+    get_compliance_output_class,
+    get_output_format_class,
+    get_output_options_class,
+)
 from prowler.lib.outputs.summary_table import display_summary_table
-from prowler.providers.aws.lib.s3.s3 import S3
-from prowler.providers.aws.lib.security_hub.security_hub import SecurityHub
-from prowler.providers.aws.models import AWSOutputOptions
-from prowler.providers.azure.models import AzureOutputOptions
 from prowler.providers.common.provider import Provider
-from prowler.providers.common.quick_inventory import run_provider_quick_inventory
-from prowler.providers.gcp.models import GCPOutputOptions
-from prowler.providers.github.models import GithubOutputOptions
-from prowler.providers.iac.models import IACOutputOptions
-from prowler.providers.kubernetes.models import KubernetesOutputOptions
-from prowler.providers.m365.models import M365OutputOptions
-from prowler.providers.nhn.models import NHNOutputOptions
 
 
 def prowler():
@@ -276,39 +227,21 @@ def prowler():
         checks_to_execute = sorted(checks_to_execute)
 
     # Setup Output Options
-    if provider == "aws":
-        output_options = AWSOutputOptions(
-            args, bulk_checks_metadata, global_provider.identity
-        )
-    elif provider == "azure":
-        output_options = AzureOutputOptions(
-            args, bulk_checks_metadata, global_provider.identity
-        )
-    elif provider == "gcp":
-        output_options = GCPOutputOptions(
-            args, bulk_checks_metadata, global_provider.identity
-        )
-    elif provider == "kubernetes":
-        output_options = KubernetesOutputOptions(
-            args, bulk_checks_metadata, global_provider.identity
-        )
-    elif provider == "github":
-        output_options = GithubOutputOptions(
-            args, bulk_checks_metadata, global_provider.identity
-        )
-    elif provider == "m365":
-        output_options = M365OutputOptions(
-            args, bulk_checks_metadata, global_provider.identity
-        )
-    elif provider == "nhn":
-        output_options = NHNOutputOptions(
+    # Only the output options of the requested provider are imported
+    output_options_class = get_output_options_class(provider)
+    if provider == "iac":
+        output_options = output_options_class(args, bulk_checks_metadata)
+    else:
+        output_options = output_options_class(
             args, bulk_checks_metadata, global_provider.identity
         )
-    elif provider == "iac":
-        output_options = IACOutputOptions(args, bulk_checks_metadata)
 
     # Run the quick inventory for the provider if available
     if hasattr(args, "quick_inventory") and args.quick_inventory:
+        from prowler.providers.common.quick_inventory import (
+            run_provider_quick_inventory,
+        )
+
         run_provider_quick_inventory(global_provider, args)
         sys.exit()
 
@@ -353,16 +286,22 @@ def prowler():
     # TODO: this part is needed since the checks generates a Check_Report_XXX and the output uses Finding
     # This will be refactored for the outputs generate directly the Finding
     finding_outputs = []
+    # The statistics columns are filled while the outputs are generated to avoid another pass over them
+    finding_outputs_columns = FindingsColumns()
+    # The provider data and checks compliance are computed once for all the findings
+    finding_output_context = FindingOutputContext(global_provider, output_options)
     for finding in findings:
         try:
-            finding_outputs.append(
-                Finding.generate_output(global_provider, finding, output_options)
+            finding_output = Finding.generate_output(
+                global_provider, finding, output_options, finding_output_context
             )
         except Exception:
             continue
+        finding_outputs.append(finding_output)
+        finding_outputs_columns.add(finding_output)
 
     # Extract findings stats
-    stats = extract_findings_statistics(finding_outputs)
+    stats = extract_findings_statistics(finding_outputs_columns)
 
     if args.slack:
         # TODO: this should be also in a config file
@@ -375,6 +314,8 @@ def prowler():
                 if "SLACK_CHANNEL_NAME" in environ
                 else environ["SLACK_CHANNEL_ID"]
             )
+            from prowler.lib.outputs.slack.slack import Slack
+
             prowler_args = " ".join(sys.argv[1:])
             slack = Slack(token, channel, global_provider)
             _ = slack.send(stats, prowler_args)
@@ -393,7 +334,7 @@ def prowler():
                 f"{output_options.output_directory}/{output_options.output_filename}"
             )
             if mode == "csv":
-                csv_output = CSV(
+                csv_output = get_output_format_class("csv")(
                     findings=finding_outputs,
                     file_path=f"{filename}{csv_file_suffix}",
                 )
@@ -402,7 +343,7 @@ def prowler():
                 csv_output.batch_write_data_to_file()
 
             if mode == "json-asff":
-                asff_output = ASFF(
+                asff_output = get_output_format_class("json-asff")(
                     findings=finding_outputs,
                     file_path=f"{filename}{json_asff_file_suffix}",
                 )
@@ -411,14 +352,14 @@ def prowler():
                 asff_output.batch_write_data_to_file()
 
             if mode == "json-ocsf":
-                json_output = OCSF(
+                json_output = get_output_format_class("json-ocsf")(
                     findings=finding_outputs,
                     file_path=f"{filename}{json_ocsf_file_suffix}",
                 )
                 generated_outputs["regular"].append(json_output)
                 json_output.batch_write_data_to_file()
             if mode == "html":
-                html_output = HTML(
+                html_output = get_output_format_class("html")(
                     findings=finding_outputs,
                     file_path=f"{filename}{html_file_suffix}",
                 )
@@ -431,424 +372,26 @@ def prowler():
     input_compliance_frameworks = set(output_options.output_modes).intersection(
         get_available_compliance_frameworks(provider)
     )
-    if provider == "aws":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("cis_"):
-                # Generate CIS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                cis = AWSCIS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(cis)
-                cis.batch_write_data_to_file()
-            elif compliance_name == "mitre_attack_aws":
-                # Generate MITRE ATT&CK Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                mitre_attack = AWSMitreAttack(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(mitre_attack)
-                mitre_attack.batch_write_data_to_file()
-            elif compliance_name.startswith("ens_"):
-                # Generate ENS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                ens = AWSENS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(ens)
-                ens.batch_write_data_to_file()
-            elif compliance_name.startswith("aws_well_architected_framework"):
-                # Generate AWS Well-Architected Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                aws_well_architected = AWSWellArchitected(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(aws_well_architected)
-                aws_well_architected.batch_write_data_to_file()
-            elif compliance_name.startswith("iso27001_"):
-                # Generate ISO27001 Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                iso27001 = AWSISO27001(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(iso27001)
-                iso27001.batch_write_data_to_file()
-            elif compliance_name.startswith("kisa"):
-                # Generate KISA-ISMS-P Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                kisa_ismsp = AWSKISAISMSP(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(kisa_ismsp)
-                kisa_ismsp.batch_write_data_to_file()
-            elif compliance_name == "prowler_threatscore_aws":
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                prowler_threatscore = ProwlerThreatScoreAWS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(prowler_threatscore)
-                prowler_threatscore.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
-
-    elif provider == "azure":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("cis_"):
-                # Generate CIS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                cis = AzureCIS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(cis)
-                cis.batch_write_data_to_file()
-            elif compliance_name == "mitre_attack_azure":
-                # Generate MITRE ATT&CK Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                mitre_attack = AzureMitreAttack(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(mitre_attack)
-                mitre_attack.batch_write_data_to_file()
-            elif compliance_name.startswith("ens_"):
-                # Generate ENS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                ens = AzureENS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(ens)
-                ens.batch_write_data_to_file()
-            elif compliance_name.startswith("iso27001_"):
-                # Generate ISO27001 Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                iso27001 = AzureISO27001(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(iso27001)
-                iso27001.batch_write_data_to_file()
-            elif compliance_name == "prowler_threatscore_azure":
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                prowler_threatscore = ProwlerThreatScoreAzure(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(prowler_threatscore)
-                prowler_threatscore.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
-
-    elif provider == "gcp":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("cis_"):
-                # Generate CIS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                cis = GCPCIS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(cis)
-                cis.batch_write_data_to_file()
-            elif compliance_name == "mitre_attack_gcp":
-                # Generate MITRE ATT&CK Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                mitre_attack = GCPMitreAttack(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(mitre_attack)
-                mitre_attack.batch_write_data_to_file()
-            elif compliance_name.startswith("ens_"):
-                # Generate ENS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                ens = GCPENS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(ens)
-                ens.batch_write_data_to_file()
-            elif compliance_name.startswith("iso27001_"):
-                # Generate ISO27001 Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                iso27001 = GCPISO27001(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(iso27001)
-                iso27001.batch_write_data_to_file()
-            elif compliance_name == "prowler_threatscore_gcp":
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                prowler_threatscore = ProwlerThreatScoreGCP(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(prowler_threatscore)
-                prowler_threatscore.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
-
-    elif provider == "kubernetes":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("cis_"):
-                # Generate CIS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                cis = KubernetesCIS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(cis)
-                cis.batch_write_data_to_file()
-            elif compliance_name.startswith("iso27001_"):
-                # Generate ISO27001 Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                iso27001 = KubernetesISO27001(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(iso27001)
-                iso27001.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
-
-    elif provider == "m365":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("cis_"):
-                # Generate CIS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                cis = M365CIS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(cis)
-                cis.batch_write_data_to_file()
-            elif compliance_name == "prowler_threatscore_m365":
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                prowler_threatscore = ProwlerThreatScoreM365(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(prowler_threatscore)
-                prowler_threatscore.batch_write_data_to_file()
-            elif compliance_name.startswith("iso27001_"):
-                # Generate ISO27001 Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                iso27001 = M365ISO27001(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(iso27001)
-                iso27001.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
-
-    elif provider == "nhn":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("iso27001_"):
-                # Generate ISO27001 Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                iso27001 = NHNISO27001(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(iso27001)
-                iso27001.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
-
-    elif provider == "github":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("cis_"):
-                # Generate CIS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                cis = GithubCIS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(cis)
-                cis.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    create_file_descriptor=True,
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
+    for compliance_name in input_compliance_frameworks:
+        filename = (
+            f"{output_options.output_directory}/compliance/"
+            f"{output_options.output_filename}_{compliance_name}.csv"
+        )
+        # Only the compliance outputs of the requested frameworks are imported
+        compliance_output = get_compliance_output_class(provider, compliance_name)(
+            findings=finding_outputs,
+            compliance=bulk_compliance_frameworks[compliance_name],
+            file_path=filename,
+        )
+        generated_outputs["compliance"].append(compliance_output)
+        compliance_output.batch_write_data_to_file()
 
     # AWS Security Hub Integration
     if provider == "aws":
         # Send output to S3 if needed (-B / -D) for all the output formats
         if args.output_bucket or args.output_bucket_no_assume:
+            from prowler.providers.aws.lib.s3.s3 import S3
+
             output_bucket = args.output_bucket
             bucket_session = global_provider.session.current_session
             # Check if -D was input
@@ -862,6 +405,10 @@ def prowler():
             )
             s3.send_to_bucket(generated_outputs)
         if args.security_hub:
+            from prowler.providers.aws.lib.security_hub.security_hub import (
+                SecurityHub,
+            )
+
             print(
                 f"{Style.BRIGHT}\nSending findings to AWS Security Hub, please wait...{Style.RESET_ALL}"
             )
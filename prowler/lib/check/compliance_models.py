@@ -1,9 +1,9 @@
 import os
 import sys
 from enum import Enum
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
-from pydantic.v1 import BaseModel, ValidationError, root_validator
+from pydantic.v1 import BaseModel, PrivateAttr, ValidationError, root_validator
 
 from prowler.lib.check.utils import list_compliance_modules
 from prowler.lib.logger import logger
@@ -236,6 +236,8 @@ class Compliance(BaseModel):
             Compliance_Requirement,
         ]
     ]
+    # Requirements index built by the compliance outputs, it lives as long as the framework
+    _requirements_index: Any = PrivateAttr(default=None)
 
     @root_validator(pre=True)
     # noqa: F841 - since vulture raises unused variable 'cls'
@@ -3,8 +3,10 @@ import os
 import re
 import sys
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import asdict, dataclass, is_dataclass
 from enum import Enum
+from threading import Lock
 from typing import Any, Dict, Optional, Set
 
 from checkov.common.output.record import Record
@@ -442,9 +444,85 @@ class Check(ABC, CheckMetadata):
         """Execute the check's logic"""
 
 
+# Maximum number of resource snapshots shared between the findings of the same resource
+RESOURCE_SNAPSHOTS_CACHE_SIZE = 100000
+# {id(resource): (resource, snapshot)}, the resource is kept so its id is not reused while cached
+_resource_snapshots = OrderedDict()
+# The snapshots are shared by the scans running in threads of the same process
+_resource_snapshots_lock = Lock()
+
+
+def get_resource_snapshot(resource: Any, check_id: str = "") -> dict:
+    """
+    Returns the metadata of a resource as a dict, the same snapshot is shared by all the findings of the resource so it must not be modified.
+
+    Args:
+        resource: The resource. Only accepted dict, list, BaseModels (dict attribute), custom models (with to_dict attribute) and dataclasses.
+        check_id: The check reporting the resource, used in the error message.
+
+    Returns:
+        dict: The resource metadata, an empty dict if the resource could not be converted to dict.
+    """
+    if isinstance(resource, dict):
+        return resource
+    resource_key = id(resource)
+    with _resource_snapshots_lock:
+        cached = _resource_snapshots.get(resource_key)
+        if cached and cached[0] is resource:
+            _resource_snapshots.move_to_end(resource_key)
+            return cached[1]
+
+    if hasattr(resource, "dict"):
+        snapshot = resource.dict()
+    elif hasattr(resource, "to_dict"):
+        snapshot = resource.to_dict()
+    elif is_dataclass(resource):
+        snapshot = asdict(resource)
+    elif hasattr(resource, "__dict__"):
+        # The object attributes are not copied, as before
+        return resource.__dict__
+    else:
+        logger.error(
+            f"Resource metadata {type(resource)} in {check_id} could not be converted to dict"
+        )
+        return {}
+
+    with _resource_snapshots_lock:
+        _resource_snapshots[resource_key] = (resource, snapshot)
+        if len(_resource_snapshots) > RESOURCE_SNAPSHOTS_CACHE_SIZE:
+            _resource_snapshots.popitem(last=False)
+    return snapshot
+
+
+def clear_resource_snapshots() -> None:
+    """Forgets the shared resource snapshots, so the resources of a finished scan are released."""
+    with _resource_snapshots_lock:
+        _resource_snapshots.clear()
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_check_metadata(metadata: str) -> "CheckMetadata":
+    return CheckMetadata.parse_raw(metadata)
+
+
 @dataclass
 class Check_Report:
-    """Contains the Check's finding information."""
+    """Contains the Check's finding information.
+
+    The reports use __slots__ to keep the memory of big scans low, the resource metadata snapshot is shared by all the findings of the same resource.
+    """
+
+    __slots__ = (
+        "status",
+        "status_extended",
+        "check_metadata",
+        "resource",
+        "resource_details",
+        "resource_tags",
+        "muted",
+        # Keeps the attributes set by custom checks out of the declared ones, it is only allocated when used
+        "__dict__",
+    )
 
     status: str
     status_extended: str
@@ -463,22 +541,12 @@ class Check_Report:
                       Only accepted dict, list, BaseModels (dict attribute), custom models (with to_dict attribute) and dataclasses.
         """
         self.status = ""
-        self.check_metadata = CheckMetadata.parse_raw(metadata)
-        if isinstance(resource, dict):
-            self.resource = resource
-        elif hasattr(resource, "dict"):
-            self.resource = resource.dict()
-        elif hasattr(resource, "to_dict"):
-            self.resource = resource.to_dict()
-        elif is_dataclass(resource):
-            self.resource = asdict(resource)
-        elif hasattr(resource, "__dict__"):
-            self.resource = resource.__dict__
+        if isinstance(metadata, str):
+            # The metadata is parsed once per check, every report gets a shallow copy since checks can change its Severity
+            self.check_metadata = _parse_check_metadata(metadata).copy()
         else:
-            logger.error(
-                f"Resource metadata {type(resource)} in {self.check_metadata.CheckID} could not be converted to dict"
-            )
-            self.resource = {}
+            self.check_metadata = CheckMetadata.parse_raw(metadata)
+        self.resource = get_resource_snapshot(resource, self.check_metadata.CheckID)
         self.status_extended = ""
         self.resource_details = ""
         self.resource_tags = getattr(resource, "tags", []) if resource else []
@@ -489,6 +557,8 @@ class Check_Report:
 class Check_Report_AWS(Check_Report):
     """Contains the AWS Check's finding information."""
 
+    __slots__ = ("resource_id", "resource_arn", "region")
+
     resource_id: str
     resource_arn: str
     region: str
@@ -506,6 +576,8 @@ class Check_Report_AWS(Check_Report):
 class Check_Report_Azure(Check_Report):
     """Contains the Azure Check's finding information."""
 
+    __slots__ = ("resource_name", "resource_id", "subscription", "location")
+
     resource_name: str
     resource_id: str
     subscription: str
@@ -531,6 +603,8 @@ class Check_Report_Azure(Check_Report):
 class Check_Report_GCP(Check_Report):
     """Contains the GCP Check's finding information."""
 
+    __slots__ = ("resource_name", "resource_id", "project_id", "location")
+
     resource_name: str
     resource_id: str
     project_id: str
@@ -570,6 +644,8 @@ class Check_Report_Kubernetes(Check_Report):
     # TODO change class name to CheckReportKubernetes
     """Contains the Kubernetes Check's finding information."""
 
+    __slots__ = ("resource_name", "resource_id", "namespace")
+
     resource_name: str
     resource_id: str
     namespace: str
@@ -589,6 +665,8 @@ class Check_Report_Kubernetes(Check_Report):
 class CheckReportGithub(Check_Report):
     """Contains the GitHub Check's finding information."""
 
+    __slots__ = ("resource_name", "resource_id", "owner")
+
     resource_name: str
     resource_id: str
     owner: str
@@ -624,6 +702,8 @@ class CheckReportGithub(Check_Report):
 class CheckReportM365(Check_Report):
     """Contains the M365 Check's finding information."""
 
+    __slots__ = ("resource_name", "resource_id", "location")
+
     resource_name: str
     resource_id: str
     location: str
@@ -655,6 +735,8 @@ class CheckReportM365(Check_Report):
 class CheckReportIAC(Check_Report):
     """Contains the IAC Check's finding information using Checkov."""
 
+    __slots__ = ("resource_name", "resource_path", "resource_line_range")
+
     resource_name: str
     resource_path: str
     resource_line_range: str
@@ -677,6 +759,8 @@ class CheckReportIAC(Check_Report):
 class CheckReportNHN(Check_Report):
     """Contains the NHN Check's finding information."""
 
+    __slots__ = ("resource_name", "resource_id", "location")
+
     resource_name: str
     resource_id: str
     location: str
@@ -1,9 +1,15 @@
 import importlib
+import os
 import sys
-from pkgutil import walk_packages
+from importlib.machinery import FileFinder
+from importlib.util import find_spec
+from pkgutil import ModuleInfo, walk_packages
 
 from prowler.lib.logger import logger
 
+# Checks manifest of every provider with the fingerprint of its services folders, see get_checks_manifest
+_checks_manifests = {}
+
 
 def recover_checks_from_provider(
     provider: str, service: str = None, include_fixers: bool = False
@@ -44,16 +50,92 @@ def recover_checks_from_provider(
         return checks
 
 
+def _get_services_fingerprint(services_path: str) -> tuple:
+    """
+    Returns the modification times of the services folder and every service folder.
+
+    Adding or removing a check (e.g. the custom checks copied from --checks-folder) changes the modification time of its service folder.
+    """
+    fingerprint = [os.stat(services_path).st_mtime_ns]
+    with os.scandir(services_path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                fingerprint.append((entry.name, entry.stat().st_mtime_ns))
+    return tuple(sorted(fingerprint, key=str))
+
+
+def _build_checks_manifest(provider: str, services_path: str) -> dict:
+    """
+    Builds the manifest of the modules within the packages of every service, reading the folders without importing them.
+
+    Returns a dictionary with the format {service: [ModuleInfo]}, sorted as walk_packages does.
+    """
+    manifest = {}
+    for service in sorted(os.listdir(services_path)):
+        service_path = os.path.join(services_path, service)
+        if not os.path.isfile(os.path.join(service_path, "__init__.py")):
+            continue
+        service_modules = []
+        for package in sorted(os.listdir(service_path)):
+            package_path = os.path.join(service_path, package)
+            if not package.isidentifier() or not os.path.isfile(
+                os.path.join(package_path, "__init__.py")
+            ):
+                continue
+            module_finder = FileFinder(package_path)
+            for file_name in sorted(os.listdir(package_path)):
+                module, extension = os.path.splitext(file_name)
+                if (
+                    extension == ".py"
+                    and module != "__init__"
+                    and module.isidentifier()
+                ):
+                    service_modules.append(
+                        ModuleInfo(
+                            module_finder=module_finder,
+                            name=f"prowler.providers.{provider}.services.{service}.{package}.{module}",
+                            ispkg=False,
+                        )
+                    )
+        manifest[service] = service_modules
+    return manifest
+
+
+def get_checks_manifest(provider: str) -> dict:
+    """
+    Returns the checks manifest of the provider, it is only built again when a services folder changes.
+
+    Args:
+        provider (str): The provider name.
+
+    Returns:
+        dict: The modules within the packages of every service with the format {service: [ModuleInfo]}.
+    """
+    services_spec = find_spec(f"prowler.providers.{provider}.services")
+    if not services_spec:
+        raise ModuleNotFoundError(f"No module named 'prowler.providers.{provider}'")
+    services_path = services_spec.submodule_search_locations[0]
+    fingerprint = _get_services_fingerprint(services_path)
+    cached_manifest = _checks_manifests.get(services_path)
+    if not cached_manifest or cached_manifest[0] != fingerprint:
+        cached_manifest = (
+            fingerprint,
+            _build_checks_manifest(provider, services_path),
+        )
+        _checks_manifests[services_path] = cached_manifest
+    return cached_manifest[1]
+
+
 # List all available modules in the selected provider and service
 def list_modules(provider: str, service: str):
-    # This module path requires the full path including "prowler."
-    module_path = f"prowler.providers.{provider}.services"
-    if service:
-        module_path += f".{service}"
-    return walk_packages(
-        importlib.import_module(module_path).__path__,
-        importlib.import_module(module_path).__name__ + ".",
-    )
+    manifest = get_checks_manifest(provider)
+    if not service:
+        return [module for modules in manifest.values() for module in modules]
+    if service not in manifest:
+        raise ModuleNotFoundError(
+            f"No module named 'prowler.providers.{provider}.services.{service}'"
+        )
+    return manifest[service]
 
 
 def recover_checks_from_service(service_list: list, provider: str) -> set:
@@ -37,45 +37,15 @@ class GithubCIS(ComplianceOutput):
         for finding in findings:
             # Get the compliance requirements for the finding
             finding_requirements = finding.compliance.get(compliance_name, [])
-            for requirement in compliance.Requirements:
-                if requirement.Id in finding_requirements:
-                    for attribute in requirement.Attributes:
-                        compliance_row = GithubCISModel(
-                            Provider=finding.provider,
-                            Description=compliance.Description,
-                            Account_Id=finding.account_uid,
-                            Account_Name=finding.account_name,
-                            AssessmentDate=str(timestamp),
-                            Requirements_Id=requirement.Id,
-                            Requirements_Description=requirement.Description,
-                            Requirements_Attributes_Section=attribute.Section,
-                            Requirements_Attributes_Profile=attribute.Profile,
-                            Requirements_Attributes_AssessmentStatus=attribute.AssessmentStatus,
-                            Requirements_Attributes_Description=attribute.Description,
-                            Requirements_Attributes_RationaleStatement=attribute.RationaleStatement,
-                            Requirements_Attributes_ImpactStatement=attribute.ImpactStatement,
-                            Requirements_Attributes_RemediationProcedure=attribute.RemediationProcedure,
-                            Requirements_Attributes_AuditProcedure=attribute.AuditProcedure,
-                            Requirements_Attributes_AdditionalInformation=attribute.AdditionalInformation,
-                            Requirements_Attributes_References=attribute.References,
-                            Requirements_Attributes_DefaultValue=attribute.DefaultValue,
-                            Status=finding.status,
-                            StatusExtended=finding.status_extended,
-                            ResourceId=finding.resource_uid,
-                            ResourceName=finding.resource_name,
-                            CheckId=finding.check_id,
-                            Muted=finding.muted,
-                        )
-                        self._data.append(compliance_row)
-        # Add manual requirements to the compliance output
-        for requirement in compliance.Requirements:
-            if not requirement.Checks:
+            for requirement in self.get_finding_requirements(
+                compliance, finding_requirements
+            ):
                 for attribute in requirement.Attributes:
                     compliance_row = GithubCISModel(
-                        Provider=compliance.Provider.lower(),
+                        Provider=finding.provider,
                         Description=compliance.Description,
-                        Account_Id="",
-                        Account_Name="",
+                        Account_Id=finding.account_uid,
+                        Account_Name=finding.account_name,
                         AssessmentDate=str(timestamp),
                         Requirements_Id=requirement.Id,
                         Requirements_Description=requirement.Description,
@@ -90,11 +60,41 @@ class GithubCIS(ComplianceOutput):
                         Requirements_Attributes_AdditionalInformation=attribute.AdditionalInformation,
                         Requirements_Attributes_References=attribute.References,
                         Requirements_Attributes_DefaultValue=attribute.DefaultValue,
-                        Status="MANUAL",
-                        StatusExtended="Manual check",
-                        ResourceId="manual_check",
-                        ResourceName="Manual check",
-                        CheckId="manual",
-                        Muted=False,
+                        Status=finding.status,
+                        StatusExtended=finding.status_extended,
+                        ResourceId=finding.resource_uid,
+                        ResourceName=finding.resource_name,
+                        CheckId=finding.check_id,
+                        Muted=finding.muted,
                     )
                     self._data.append(compliance_row)
+        # Add manual requirements to the compliance output
+        for requirement in self.get_manual_requirements(compliance):
+            for attribute in requirement.Attributes:
+                compliance_row = GithubCISModel(
+                    Provider=compliance.Provider.lower(),
+                    Description=compliance.Description,
+                    Account_Id="",
+                    Account_Name="",
+                    AssessmentDate=str(timestamp),
+                    Requirements_Id=requirement.Id,
+                    Requirements_Description=requirement.Description,
+                    Requirements_Attributes_Section=attribute.Section,
+                    Requirements_Attributes_Profile=attribute.Profile,
+                    Requirements_Attributes_AssessmentStatus=attribute.AssessmentStatus,
+                    Requirements_Attributes_Description=attribute.Description,
+                    Requirements_Attributes_RationaleStatement=attribute.RationaleStatement,
+                    Requirements_Attributes_ImpactStatement=attribute.ImpactStatement,
+                    Requirements_Attributes_RemediationProcedure=attribute.RemediationProcedure,
+                    Requirements_Attributes_AuditProcedure=attribute.AuditProcedure,
+                    Requirements_Attributes_AdditionalInformation=attribute.AdditionalInformation,
+                    Requirements_Attributes_References=attribute.References,
+                    Requirements_Attributes_DefaultValue=attribute.DefaultValue,
+                    Status="MANUAL",
+                    StatusExtended="Manual check",
+                    ResourceId="manual_check",
+                    ResourceName="Manual check",
+                    CheckId="manual",
+                    Muted=False,
+                )
+                self._data.append(compliance_row)
@@ -8,6 +8,68 @@ from prowler.lib.outputs.finding import Finding
 from prowler.lib.outputs.output import Output
 
 
+class ComplianceRequirementsIndex:
+    """
+    This class indexes the requirements of a compliance framework to avoid looping over all of them for every finding.
+
+    Attributes:
+        manual_requirements (list): The requirements without checks, in the framework order.
+
+    Methods:
+        get_requirements: Returns the requirements matching the given requirement IDs, in the framework order.
+    """
+
+    def __init__(self, compliance: Compliance) -> None:
+        self._requirements_by_id = {}
+        self._requirements_by_ids = {}
+        self.manual_requirements = []
+        for position, requirement in enumerate(compliance.Requirements):
+            self._requirements_by_id.setdefault(requirement.Id, []).append(
+                (position, requirement)
+            )
+            if not requirement.Checks:
+                self.manual_requirements.append(requirement)
+
+    def get_requirements(self, requirement_ids: List[str]) -> list:
+        """
+        Returns the requirements matching the given requirement IDs, in the framework order.
+
+        Args:
+            requirement_ids (list): The requirement IDs of a finding for the framework.
+
+        Returns:
+            list: The matching requirements.
+        """
+        # Findings of the same check share the same requirement IDs
+        key = tuple(requirement_ids)
+        requirements = self._requirements_by_ids.get(key)
+        if requirements is None:
+            matched = []
+            for requirement_id in set(requirement_ids):
+                matched.extend(self._requirements_by_id.get(requirement_id, []))
+            requirements = [requirement for _, requirement in sorted(matched)]
+            self._requirements_by_ids[key] = requirements
+        return requirements
+
+
+def get_requirements_index(compliance: Compliance) -> ComplianceRequirementsIndex:
+    """
+    Returns the requirements index of the given compliance framework, building it only the first time.
+
+    Args:
+        compliance (Compliance): The compliance framework.
+
+    Returns:
+        ComplianceRequirementsIndex: The requirements index of the framework.
+    """
+    # The index is stored in the framework so it is released together with it
+    requirements_index = compliance._requirements_index
+    if requirements_index is None:
+        requirements_index = ComplianceRequirementsIndex(compliance)
+        compliance._requirements_index = requirements_index
+    return requirements_index
+
+
 class ComplianceOutput(Output):
     """
     This class represents an abstract base class for defining different types of outputs for findings.
@@ -23,6 +85,8 @@ class ComplianceOutput(Output):
         transform: Abstract method to transform findings into a specific format.
         batch_write_data_to_file: Abstract method to write data to a file in batches.
         create_file_descriptor: Method to create a file descriptor for writing data to a file.
+        get_finding_requirements: Returns the requirements of the framework that the finding belongs to.
+        get_manual_requirements: Returns the requirements of the framework without checks.
     """
 
     def __init__(
@@ -47,17 +111,50 @@ class ComplianceOutput(Output):
             self._file_extension = file_extension
             self.file_path = f"{file_path}{self.file_extension}"
 
+        # Get the compliance name of the model
+        self.compliance_name = (
+            compliance.Framework + "-" + compliance.Version
+            if compliance.Version
+            else compliance.Framework
+        )
         if findings:
-            # Get the compliance name of the model
-            compliance_name = (
-                compliance.Framework + "-" + compliance.Version
-                if compliance.Version
-                else compliance.Framework
-            )
-            self.transform(findings, compliance, compliance_name)
+            self.transform(findings, compliance, self.compliance_name)
             if not self._file_descriptor and file_path:
                 self.create_file_descriptor(self.file_path)
 
+    @staticmethod
+    def get_finding_requirements(
+        compliance: Compliance, finding_requirements: List[str]
+    ) -> list:
+        """
+        Returns the requirements of the framework that the finding belongs to, in the framework order.
+
+        Args:
+            compliance (Compliance): The compliance framework.
+            finding_requirements (list): The requirement IDs of the finding for the framework.
+
+        Returns:
+            list: The matching requirements.
+        """
+        if not finding_requirements:
+            return []
+        if isinstance(finding_requirements, str):
+            finding_requirements = [finding_requirements]
+        return get_requirements_index(compliance).get_requirements(finding_requirements)
+
+    @staticmethod
+    def get_manual_requirements(compliance: Compliance) -> list:
+        """
+        Returns the requirements of the framework without checks, in the framework order.
+
+        Args:
+            compliance (Compliance): The compliance framework.
+
+        Returns:
+            list: The manual requirements.
+        """
+        return get_requirements_index(compliance).manual_requirements
+
     def batch_write_data_to_file(self) -> None:
         """
         Writes the findings data to a CSV file in the specific compliance format.
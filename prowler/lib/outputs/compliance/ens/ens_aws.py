@@ -37,47 +37,15 @@ class AWSENS(ComplianceOutput):
         for finding in findings:
             # Get the compliance requirements for the finding
             finding_requirements = finding.compliance.get(compliance_name, [])
-            for requirement in compliance.Requirements:
-                if requirement.Id in finding_requirements:
-                    for attribute in requirement.Attributes:
-                        compliance_row = AWSENSModel(
-                            Provider=finding.provider,
-                            Description=compliance.Description,
-                            AccountId=finding.account_uid,
-                            Region=finding.region,
-                            AssessmentDate=str(timestamp),
-                            Requirements_Id=requirement.Id,
-                            Requirements_Description=requirement.Description,
-                            Requirements_Attributes_IdGrupoControl=attribute.IdGrupoControl,
-                            Requirements_Attributes_Marco=attribute.Marco,
-                            Requirements_Attributes_Categoria=attribute.Categoria,
-                            Requirements_Attributes_DescripcionControl=attribute.DescripcionControl,
-                            Requirements_Attributes_Nivel=attribute.Nivel,
-                            Requirements_Attributes_Tipo=attribute.Tipo,
-                            Requirements_Attributes_Dimensiones=",".join(
-                                attribute.Dimensiones
-                            ),
-                            Requirements_Attributes_ModoEjecucion=attribute.ModoEjecucion,
-                            Requirements_Attributes_Dependencias=",".join(
-                                attribute.Dependencias
-                            ),
-                            Status=finding.status,
-                            StatusExtended=finding.status_extended,
-                            ResourceId=finding.resource_uid,
-                            ResourceName=finding.resource_name,
-                            CheckId=finding.check_id,
-                            Muted=finding.muted,
-                        )
-                        self._data.append(compliance_row)
-        # Add manual requirements to the compliance output
-        for requirement in compliance.Requirements:
-            if not requirement.Checks:
+            for requirement in self.get_finding_requirements(
+                compliance, finding_requirements
+            ):
                 for attribute in requirement.Attributes:
                     compliance_row = AWSENSModel(
-                        Provider=compliance.Provider.lower(),
+                        Provider=finding.provider,
                         Description=compliance.Description,
-                        AccountId="",
-                        Region="",
+                        AccountId=finding.account_uid,
+                        Region=finding.region,
                         AssessmentDate=str(timestamp),
                         Requirements_Id=requirement.Id,
                         Requirements_Description=requirement.Description,
@@ -94,11 +62,41 @@ class AWSENS(ComplianceOutput):
                         Requirements_Attributes_Dependencias=",".join(
                             attribute.Dependencias
                         ),
-                        Status="MANUAL",
-                        StatusExtended="Manual check",
-                        ResourceId="manual_check",
-                        ResourceName="Manual check",
-                        CheckId="manual",
-                        Muted=False,
+                        Status=finding.status,
+                        StatusExtended=finding.status_extended,
+                        ResourceId=finding.resource_uid,
+                        ResourceName=finding.resource_name,
+                        CheckId=finding.check_id,
+                        Muted=finding.muted,
                     )
                     self._data.append(compliance_row)
+        # Add manual requirements to the compliance output
+        for requirement in self.get_manual_requirements(compliance):
+            for attribute in requirement.Attributes:
+                compliance_row = AWSENSModel(
+                    Provider=compliance.Provider.lower(),
+                    Description=compliance.Description,
+                    AccountId="",
+                    Region="",
+                    AssessmentDate=str(timestamp),
+                    Requirements_Id=requirement.Id,
+                    Requirements_Description=requirement.Description,
+                    Requirements_Attributes_IdGrupoControl=attribute.IdGrupoControl,
+                    Requirements_Attributes_Marco=attribute.Marco,
+                    Requirements_Attributes_Categoria=attribute.Categoria,
+                    Requirements_Attributes_DescripcionControl=attribute.DescripcionControl,
+                    Requirements_Attributes_Nivel=attribute.Nivel,
+                    Requirements_Attributes_Tipo=attribute.Tipo,
+                    Requirements_Attributes_Dimensiones=",".join(attribute.Dimensiones),
+                    Requirements_Attributes_ModoEjecucion=attribute.ModoEjecucion,
+                    Requirements_Attributes_Dependencias=",".join(
+                        attribute.Dependencias
+                    ),
+                    Status="MANUAL",
+                    StatusExtended="Manual check",
+                    ResourceId="manual_check",
+                    ResourceName="Manual check",
+                    CheckId="manual",
+                    Muted=False,
+                )
+                self._data.append(compliance_row)
@@ -36,40 +36,15 @@ class M365ISO27001(ComplianceOutput):
         """
         for finding in findings:
             finding_requirements = finding.compliance.get(compliance_name, [])
-            for requirement in compliance.Requirements:
-                if requirement.Id in finding_requirements:
-                    for attribute in requirement.Attributes:
-                        compliance_row = M365ISO27001Model(
-                            Provider=finding.provider,
-                            Description=compliance.Description,
-                            TenantId=finding.account_uid,
-                            Location=finding.region,
-                            AssessmentDate=str(timestamp),
-                            Requirements_Id=requirement.Id,
-                            Requirements_Description=requirement.Description,
-                            Requirements_Name=requirement.Name,
-                            Requirements_Attributes_Category=attribute.Category,
-                            Requirements_Attributes_Objetive_ID=attribute.Objetive_ID,
-                            Requirements_Attributes_Objetive_Name=attribute.Objetive_Name,
-                            Requirements_Attributes_Check_Summary=attribute.Check_Summary,
-                            Status=finding.status,
-                            StatusExtended=finding.status_extended,
-                            ResourceId=finding.resource_uid,
-                            CheckId=finding.check_id,
-                            Muted=finding.muted,
-                            ResourceName=finding.resource_name,
-                        )
-                        self._data.append(compliance_row)
-
-        # Add manual requirements to the compliance output
-        for requirement in compliance.Requirements:
-            if not requirement.Checks:
+            for requirement in self.get_finding_requirements(
+                compliance, finding_requirements
+            ):
                 for attribute in requirement.Attributes:
                     compliance_row = M365ISO27001Model(
-                        Provider=compliance.Provider.lower(),
+                        Provider=finding.provider,
                         Description=compliance.Description,
-                        TenantId="",
-                        Location="",
+                        TenantId=finding.account_uid,
+                        Location=finding.region,
                         AssessmentDate=str(timestamp),
                         Requirements_Id=requirement.Id,
                         Requirements_Description=requirement.Description,
@@ -78,11 +53,36 @@ class M365ISO27001(ComplianceOutput):
                         Requirements_Attributes_Objetive_ID=attribute.Objetive_ID,
                         Requirements_Attributes_Objetive_Name=attribute.Objetive_Name,
                         Requirements_Attributes_Check_Summary=attribute.Check_Summary,
-                        Status="MANUAL",
-                        StatusExtended="Manual check",
-                        ResourceId="manual_check",
-                        ResourceName="Manual check",
-                        CheckId="manual",
-                        Muted=False,
+                        Status=finding.status,
+                        StatusExtended=finding.status_extended,
+                        ResourceId=finding.resource_uid,
+                        CheckId=finding.check_id,
+                        Muted=finding.muted,
+                        ResourceName=finding.resource_name,
                     )
                     self._data.append(compliance_row)
+
+        # Add manual requirements to the compliance output
+        for requirement in self.get_manual_requirements(compliance):
+            for attribute in requirement.Attributes:
+                compliance_row = M365ISO27001Model(
+                    Provider=compliance.Provider.lower(),
+                    Description=compliance.Description,
+                    TenantId="",
+                    Location="",
+                    AssessmentDate=str(timestamp),
+                    Requirements_Id=requirement.Id,
+                    Requirements_Description=requirement.Description,
+                    Requirements_Name=requirement.Name,
+                    Requirements_Attributes_Category=attribute.Category,
+                    Requirements_Attributes_Objetive_ID=attribute.Objetive_ID,
+                    Requirements_Attributes_Objetive_Name=attribute.Objetive_Name,
+                    Requirements_Attributes_Check_Summary=attribute.Check_Summary,
+                    Status="MANUAL",
+                    StatusExtended="Manual check",
+                    ResourceId="manual_check",
+                    ResourceName="Manual check",
+                    CheckId="manual",
+                    Muted=False,
+                )
+                self._data.append(compliance_row)
@@ -37,42 +37,15 @@ class AWSKISAISMSP(ComplianceOutput):
         for finding in findings:
             # Get the compliance requirements for the finding
             finding_requirements = finding.compliance.get(compliance_name, [])
-            for requirement in compliance.Requirements:
-                if requirement.Id in finding_requirements:
-                    for attribute in requirement.Attributes:
-                        compliance_row = AWSKISAISMSPModel(
-                            Provider=finding.provider,
-                            Description=compliance.Description,
-                            AccountId=finding.account_uid,
-                            Region=finding.region,
-                            AssessmentDate=str(timestamp),
-                            Requirements_Id=requirement.Id,
-                            Requirements_Name=requirement.Name,
-                            Requirements_Description=requirement.Description,
-                            Requirements_Attributes_Domain=attribute.Domain,
-                            Requirements_Attributes_Subdomain=attribute.Subdomain,
-                            Requirements_Attributes_Section=attribute.Section,
-                            Requirements_Attributes_AuditChecklist=attribute.AuditChecklist,
-                            Requirements_Attributes_RelatedRegulations=attribute.RelatedRegulations,
-                            Requirements_Attributes_AuditEvidence=attribute.AuditEvidence,
-                            Requirements_Attributes_NonComplianceCases=attribute.NonComplianceCases,
-                            Status=finding.status,
-                            StatusExtended=finding.status_extended,
-                            ResourceId=finding.resource_uid,
-                            ResourceName=finding.resource_name,
-                            CheckId=finding.check_id,
-                            Muted=finding.muted,
-                        )
-                        self._data.append(compliance_row)
-        # Add manual requirements to the compliance output
-        for requirement in compliance.Requirements:
-            if not requirement.Checks:
+            for requirement in self.get_finding_requirements(
+                compliance, finding_requirements
+            ):
                 for attribute in requirement.Attributes:
                     compliance_row = AWSKISAISMSPModel(
-                        Provider=compliance.Provider.lower(),
+                        Provider=finding.provider,
                         Description=compliance.Description,
-                        AccountId="",
-                        Region="",
+                        AccountId=finding.account_uid,
+                        Region=finding.region,
                         AssessmentDate=str(timestamp),
                         Requirements_Id=requirement.Id,
                         Requirements_Name=requirement.Name,
@@ -84,11 +57,38 @@ class AWSKISAISMSP(ComplianceOutput):
                         Requirements_Attributes_RelatedRegulations=attribute.RelatedRegulations,
                         Requirements_Attributes_AuditEvidence=attribute.AuditEvidence,
                         Requirements_Attributes_NonComplianceCases=attribute.NonComplianceCases,
-                        Status="MANUAL",
-                        StatusExtended="Manual check",
-                        ResourceId="manual_check",
-                        ResourceName="Manual check",
-                        CheckId="manual",
-                        Muted=False,
+                        Status=finding.status,
+                        StatusExtended=finding.status_extended,
+                        ResourceId=finding.resource_uid,
+                        ResourceName=finding.resource_name,
+                        CheckId=finding.check_id,
+                        Muted=finding.muted,
                     )
                     self._data.append(compliance_row)
+        # Add manual requirements to the compliance output
+        for requirement in self.get_manual_requirements(compliance):
+            for attribute in requirement.Attributes:
+                compliance_row = AWSKISAISMSPModel(
+                    Provider=compliance.Provider.lower(),
+                    Description=compliance.Description,
+                    AccountId="",
+                    Region="",
+                    AssessmentDate=str(timestamp),
+                    Requirements_Id=requirement.Id,
+                    Requirements_Name=requirement.Name,
+                    Requirements_Description=requirement.Description,
+                    Requirements_Attributes_Domain=attribute.Domain,
+                    Requirements_Attributes_Subdomain=attribute.Subdomain,
+                    Requirements_Attributes_Section=attribute.Section,
+                    Requirements_Attributes_AuditChecklist=attribute.AuditChecklist,
+                    Requirements_Attributes_RelatedRegulations=attribute.RelatedRegulations,
+                    Requirements_Attributes_AuditEvidence=attribute.AuditEvidence,
+                    Requirements_Attributes_NonComplianceCases=attribute.NonComplianceCases,
+                    Status="MANUAL",
+                    StatusExtended="Manual check",
+                    ResourceId="manual_check",
+                    ResourceName="Manual check",
+                    CheckId="manual",
+                    Muted=False,
+                )
+                self._data.append(compliance_row)
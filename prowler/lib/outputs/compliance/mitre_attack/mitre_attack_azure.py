@@ -38,81 +38,75 @@ class AzureMitreAttack(ComplianceOutput):
         for finding in findings:
             # Get the compliance requirements for the finding
             finding_requirements = finding.compliance.get(compliance_name, [])
-            for requirement in compliance.Requirements:
-                if requirement.Id in finding_requirements:
-                    compliance_row = AzureMitreAttackModel(
-                        Provider=finding.provider,
-                        Description=compliance.Description,
-                        SubscriptionId=finding.account_uid,
-                        Location=finding.region,
-                        AssessmentDate=str(timestamp),
-                        Requirements_Id=requirement.Id,
-                        Requirements_Name=requirement.Name,
-                        Requirements_Description=requirement.Description,
-                        Requirements_Tactics=unroll_list(requirement.Tactics),
-                        Requirements_SubTechniques=unroll_list(
-                            requirement.SubTechniques
-                        ),
-                        Requirements_Platforms=unroll_list(requirement.Platforms),
-                        Requirements_TechniqueURL=requirement.TechniqueURL,
-                        Requirements_Attributes_Services=", ".join(
-                            attribute.AzureService
-                            for attribute in requirement.Attributes
-                        ),
-                        Requirements_Attributes_Categories=", ".join(
-                            attribute.Category for attribute in requirement.Attributes
-                        ),
-                        Requirements_Attributes_Values=", ".join(
-                            attribute.Value for attribute in requirement.Attributes
-                        ),
-                        Requirements_Attributes_Comments=", ".join(
-                            attribute.Comment for attribute in requirement.Attributes
-                        ),
-                        Status=finding.status,
-                        StatusExtended=finding.status_extended,
-                        ResourceId=finding.resource_uid,
-                        ResourceName=finding.resource_name,
-                        CheckId=finding.check_id,
-                        Muted=finding.muted,
-                    )
-                    self._data.append(compliance_row)
+            for requirement in self.get_finding_requirements(
+                compliance, finding_requirements
+            ):
+                compliance_row = AzureMitreAttackModel(
+                    Provider=finding.provider,
+                    Description=compliance.Description,
+                    SubscriptionId=finding.account_uid,
+                    Location=finding.region,
+                    AssessmentDate=str(timestamp),
+                    Requirements_Id=requirement.Id,
+                    Requirements_Name=requirement.Name,
+                    Requirements_Description=requirement.Description,
+                    Requirements_Tactics=unroll_list(requirement.Tactics),
+                    Requirements_SubTechniques=unroll_list(requirement.SubTechniques),
+                    Requirements_Platforms=unroll_list(requirement.Platforms),
+                    Requirements_TechniqueURL=requirement.TechniqueURL,
+                    Requirements_Attributes_Services=", ".join(
+                        attribute.AzureService for attribute in requirement.Attributes
+                    ),
+                    Requirements_Attributes_Categories=", ".join(
+                        attribute.Category for attribute in requirement.Attributes
+                    ),
+                    Requirements_Attributes_Values=", ".join(
+                        attribute.Value for attribute in requirement.Attributes
+                    ),
+                    Requirements_Attributes_Comments=", ".join(
+                        attribute.Comment for attribute in requirement.Attributes
+                    ),
+                    Status=finding.status,
+                    StatusExtended=finding.status_extended,
+                    ResourceId=finding.resource_uid,
+                    ResourceName=finding.resource_name,
+                    CheckId=finding.check_id,
+                    Muted=finding.muted,
+                )
+                self._data.append(compliance_row)
         # Add manual requirements to the compliance output
-        for requirement in compliance.Requirements:
-            if not requirement.Checks:
-                for attribute in requirement.Attributes:
-                    compliance_row = AzureMitreAttackModel(
-                        Provider=compliance.Provider.lower(),
-                        Description=compliance.Description,
-                        SubscriptionId="",
-                        Location="",
-                        AssessmentDate=str(timestamp),
-                        Requirements_Id=requirement.Id,
-                        Requirements_Name=requirement.Name,
-                        Requirements_Description=requirement.Description,
-                        Requirements_Tactics=unroll_list(requirement.Tactics),
-                        Requirements_SubTechniques=unroll_list(
-                            requirement.SubTechniques
-                        ),
-                        Requirements_Platforms=unroll_list(requirement.Platforms),
-                        Requirements_TechniqueURL=requirement.TechniqueURL,
-                        Requirements_Attributes_Services=", ".join(
-                            attribute.AzureService
-                            for attribute in requirement.Attributes
-                        ),
-                        Requirements_Attributes_Categories=", ".join(
-                            attribute.Category for attribute in requirement.Attributes
-                        ),
-                        Requirements_Attributes_Values=", ".join(
-                            attribute.Value for attribute in requirement.Attributes
-                        ),
-                        Requirements_Attributes_Comments=", ".join(
-                            attribute.Comment for attribute in requirement.Attributes
-                        ),
-                        Status="MANUAL",
-                        StatusExtended="Manual check",
-                        ResourceId="manual_check",
-                        ResourceName="Manual check",
-                        CheckId="manual",
-                        Muted=False,
-                    )
-                    self._data.append(compliance_row)
+        for requirement in self.get_manual_requirements(compliance):
+            for attribute in requirement.Attributes:
+                compliance_row = AzureMitreAttackModel(
+                    Provider=compliance.Provider.lower(),
+                    Description=compliance.Description,
+                    SubscriptionId="",
+                    Location="",
+                    AssessmentDate=str(timestamp),
+                    Requirements_Id=requirement.Id,
+                    Requirements_Name=requirement.Name,
+                    Requirements_Description=requirement.Description,
+                    Requirements_Tactics=unroll_list(requirement.Tactics),
+                    Requirements_SubTechniques=unroll_list(requirement.SubTechniques),
+                    Requirements_Platforms=unroll_list(requirement.Platforms),
+                    Requirements_TechniqueURL=requirement.TechniqueURL,
+                    Requirements_Attributes_Services=", ".join(
+                        attribute.AzureService for attribute in requirement.Attributes
+                    ),
+                    Requirements_Attributes_Categories=", ".join(
+                        attribute.Category for attribute in requirement.Attributes
+                    ),
+                    Requirements_Attributes_Values=", ".join(
+                        attribute.Value for attribute in requirement.Attributes
+                    ),
+                    Requirements_Attributes_Comments=", ".join(
+                        attribute.Comment for attribute in requirement.Attributes
+                    ),
+                    Status="MANUAL",
+                    StatusExtended="Manual check",
+                    ResourceId="manual_check",
+                    ResourceName="Manual check",
+                    CheckId="manual",
+                    Muted=False,
+                )
+                self._data.append(compliance_row)
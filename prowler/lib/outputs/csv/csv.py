@@ -1,13 +1,96 @@
-from csv import DictWriter
+from csv import writer
 from typing import List
 
+from prowler.lib.check.models import CheckMetadata
 from prowler.lib.logger import logger
 from prowler.lib.outputs.finding import Finding
 from prowler.lib.outputs.output import Output
 from prowler.lib.outputs.utils import unroll_dict, unroll_list
 
+CSV_COLUMNS = (
+    "AUTH_METHOD",
+    "TIMESTAMP",
+    "ACCOUNT_UID",
+    "ACCOUNT_NAME",
+    "ACCOUNT_EMAIL",
+    "ACCOUNT_ORGANIZATION_UID",
+    "ACCOUNT_ORGANIZATION_NAME",
+    "ACCOUNT_TAGS",
+    "FINDING_UID",
+    "PROVIDER",
+    "CHECK_ID",
+    "CHECK_TITLE",
+    "CHECK_TYPE",
+    "STATUS",
+    "STATUS_EXTENDED",
+    "MUTED",
+    "SERVICE_NAME",
+    "SUBSERVICE_NAME",
+    "SEVERITY",
+    "RESOURCE_TYPE",
+    "RESOURCE_UID",
+    "RESOURCE_NAME",
+    "RESOURCE_DETAILS",
+    "RESOURCE_TAGS",
+    "PARTITION",
+    "REGION",
+    "DESCRIPTION",
+    "RISK",
+    "RELATED_URL",
+    "REMEDIATION_RECOMMENDATION_TEXT",
+    "REMEDIATION_RECOMMENDATION_URL",
+    "REMEDIATION_CODE_NATIVEIAC",
+    "REMEDIATION_CODE_TERRAFORM",
+    "REMEDIATION_CODE_CLI",
+    "REMEDIATION_CODE_OTHER",
+    "COMPLIANCE",
+    "CATEGORIES",
+    "DEPENDS_ON",
+    "RELATED_TO",
+    "NOTES",
+    "PROWLER_VERSION",
+)
+
 
 class CSV(Output):
+    """
+    CSV output, the findings are kept as rows following the CSV_COLUMNS order and written with a single csv writer per file.
+
+    The columns that only depend on the check metadata are computed once per check, except the severity that can change per finding.
+    """
+
+    @property
+    def data(self) -> list[dict]:
+        return [dict(zip(CSV_COLUMNS, row)) for row in self._data]
+
+    def _get_check_columns(self, metadata: CheckMetadata) -> tuple:
+        """Returns the columns of a check that are the same for all its findings."""
+        check_columns = self._check_columns.get(metadata.CheckID)
+        if check_columns is None:
+            check_columns = self._check_columns[metadata.CheckID] = (
+                metadata.Provider,
+                metadata.CheckID,
+                metadata.CheckTitle,
+                unroll_list(metadata.CheckType),
+                metadata.ServiceName,
+                metadata.SubServiceName,
+                metadata.ResourceType,
+                metadata.Description,
+                metadata.Risk,
+                metadata.RelatedUrl,
+                metadata.Remediation.Recommendation.Text,
+                metadata.Remediation.Recommendation.Url,
+                metadata.Remediation.Code.NativeIaC,
+                metadata.Remediation.Code.Terraform,
+                metadata.Remediation.Code.CLI,
+                metadata.Remediation.Code.Other,
+                unroll_list(metadata.Categories),
+                unroll_list(metadata.DependsOn),
+                unroll_list(metadata.RelatedTo),
+                metadata.Notes,
+            )
+        return check_columns
+
     def transform(self, findings: List[Finding]) -> None:
         """Transforms the findings into the CSV format.
 
@@ -16,70 +99,77 @@ class CSV(Output):
 
         """
         try:
+            if not hasattr(self, "_check_columns"):
+                self._check_columns = {}
             for finding in findings:
-                finding_dict = {}
-                finding_dict["AUTH_METHOD"] = finding.auth_method
-                finding_dict["TIMESTAMP"] = finding.timestamp
-                finding_dict["ACCOUNT_UID"] = finding.account_uid
-                finding_dict["ACCOUNT_NAME"] = finding.account_name
-                finding_dict["ACCOUNT_EMAIL"] = finding.account_email
-                finding_dict["ACCOUNT_ORGANIZATION_UID"] = (
-                    finding.account_organization_uid
-                )
-                finding_dict["ACCOUNT_ORGANIZATION_NAME"] = (
-                    finding.account_organization_name
-                )
-                finding_dict["ACCOUNT_TAGS"] = unroll_dict(
-                    finding.account_tags, separator=":"
+                (
+                    provider,
+                    check_id,
+                    check_title,
+                    check_type,
+                    service_name,
+                    subservice_name,
+                    resource_type,
+                    description,
+                    risk,
+                    related_url,
+                    remediation_recommendation_text,
+                    remediation_recommendation_url,
+                    remediation_code_nativeiac,
+                    remediation_code_terraform,
+                    remediation_code_cli,
+                    remediation_code_other,
+                    categories,
+                    depends_on,
+                    related_to,
+                    notes,
+                ) = self._get_check_columns(finding.metadata)
+                self._data.append(
+                    (
+                        finding.auth_method,
+                        finding.timestamp,
+                        finding.account_uid,
+                        finding.account_name,
+                        finding.account_email,
+                        finding.account_organization_uid,
+                        finding.account_organization_name,
+                        unroll_dict(finding.account_tags, separator=":"),
+                        finding.uid,
+                        provider,
+                        check_id,
+                        check_title,
+                        check_type,
+                        finding.status.value,
+                        finding.status_extended,
+                        finding.muted,
+                        service_name,
+                        subservice_name,
+                        # Checks can set a different severity for each finding
+                        finding.metadata.Severity.value,
+                        resource_type,
+                        finding.resource_uid,
+                        finding.resource_name,
+                        finding.resource_details,
+                        unroll_dict(finding.resource_tags),
+                        finding.partition,
+                        finding.region,
+                        description,
+                        risk,
+                        related_url,
+                        remediation_recommendation_text,
+                        remediation_recommendation_url,
+                        remediation_code_nativeiac,
+                        remediation_code_terraform,
+                        remediation_code_cli,
+                        remediation_code_other,
+                        unroll_dict(finding.compliance, separator=": "),
+                        categories,
+                        depends_on,
+                        related_to,
+                        notes,
+                        finding.prowler_version,
+                    )
                 )
-                finding_dict["FINDING_UID"] = finding.uid
-                finding_dict["PROVIDER"] = finding.metadata.Provider
-                finding_dict["CHECK_ID"] = finding.metadata.CheckID
-                finding_dict["CHECK_TITLE"] = finding.metadata.CheckTitle
-                finding_dict["CHECK_TYPE"] = unroll_list(finding.metadata.CheckType)
-                finding_dict["STATUS"] = finding.status.value
-                finding_dict["STATUS_EXTENDED"] = finding.status_extended
-                finding_dict["MUTED"] = finding.muted
-                finding_dict["SERVICE_NAME"] = finding.metadata.ServiceName
-                finding_dict["SUBSERVICE_NAME"] = finding.metadata.SubServiceName
-                finding_dict["SEVERITY"] = finding.metadata.Severity.value
-                finding_dict["RESOURCE_TYPE"] = finding.metadata.ResourceType
-                finding_dict["RESOURCE_UID"] = finding.resource_uid
-                finding_dict["RESOURCE_NAME"] = finding.resource_name
-                finding_dict["RESOURCE_DETAILS"] = finding.resource_details
-                finding_dict["RESOURCE_TAGS"] = unroll_dict(finding.resource_tags)
-                finding_dict["PARTITION"] = finding.partition
-                finding_dict["REGION"] = finding.region
-                finding_dict["DESCRIPTION"] = finding.metadata.Description
-                finding_dict["RISK"] = finding.metadata.Risk
-                finding_dict["RELATED_URL"] = finding.metadata.RelatedUrl
-                finding_dict["REMEDIATION_RECOMMENDATION_TEXT"] = (
-                    finding.metadata.Remediation.Recommendation.Text
-                )
-                finding_dict["REMEDIATION_RECOMMENDATION_URL"] = (
-                    finding.metadata.Remediation.Recommendation.Url
-                )
-                finding_dict["REMEDIATION_CODE_NATIVEIAC"] = (
-                    finding.metadata.Remediation.Code.NativeIaC
-                )
-                finding_dict["REMEDIATION_CODE_TERRAFORM"] = (
-                    finding.metadata.Remediation.Code.Terraform
-                )
-                finding_dict["REMEDIATION_CODE_CLI"] = (
-                    finding.metadata.Remediation.Code.CLI
-                )
-                finding_dict["REMEDIATION_CODE_OTHER"] = (
-                    finding.metadata.Remediation.Code.Other
-                )
-                finding_dict["COMPLIANCE"] = unroll_dict(
-                    finding.compliance, separator=": "
-                )
-                finding_dict["CATEGORIES"] = unroll_list(finding.metadata.Categories)
-                finding_dict["DEPENDS_ON"] = unroll_list(finding.metadata.DependsOn)
-                finding_dict["RELATED_TO"] = unroll_list(finding.metadata.RelatedTo)
-                finding_dict["NOTES"] = finding.metadata.Notes
-                finding_dict["PROWLER_VERSION"] = finding.prowler_version
-                self._data.append(finding_dict)
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -93,15 +183,13 @@ class CSV(Output):
                 and not self._file_descriptor.closed
                 and self._data
             ):
-                csv_writer = DictWriter(
-                    self._file_descriptor,
-                    fieldnames=self._data[0].keys(),
-                    delimiter=";",
-                )
+                # The same csv writer is used for all the batches written to a file
+                if getattr(self, "_csv_writer_file", None) is not self._file_descriptor:
+                    self._csv_writer = writer(self._file_descriptor, delimiter=";")
+                    self._csv_writer_file = self._file_descriptor
                 if self._file_descriptor.tell() == 0:
-                    csv_writer.writeheader()
-                for finding in self._data:
-                    csv_writer.writerow(finding)
+                    self._csv_writer.writerow(CSV_COLUMNS)
+                self._csv_writer.writerows(self._data)
                 if self.close_file or self._from_cli:
                     self._file_descriptor.close()
         except Exception as error:
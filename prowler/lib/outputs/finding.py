@@ -97,9 +97,126 @@ class Finding(BaseModel):
         """
         return dict_to_lowercase(self.metadata.dict())
 
+    @staticmethod
+    def get_provider_output_data(provider: Provider) -> dict:
+        """Returns the output data that only depends on the provider, so it is the same for all the findings of a scan
+
+        Args:
+            provider (Provider): the provider object
+        Returns:
+            dict: the provider output data
+
+        """
+        output_data = {"provider": provider.type}
+        if provider.type == "aws":
+            output_data["account_uid"] = get_nested_attribute(
+                provider, "identity.account"
+            )
+            output_data["account_name"] = get_nested_attribute(
+                provider, "organizations_metadata.account_name"
+            )
+            output_data["account_email"] = get_nested_attribute(
+                provider, "organizations_metadata.account_email"
+            )
+            output_data["account_organization_uid"] = get_nested_attribute(
+                provider, "organizations_metadata.organization_arn"
+            )
+            output_data["account_organization_name"] = get_nested_attribute(
+                provider, "organizations_metadata.organization_id"
+            )
+            output_data["account_tags"] = get_nested_attribute(
+                provider, "organizations_metadata.account_tags"
+            )
+            output_data["partition"] = get_nested_attribute(
+                provider, "identity.partition"
+            )
+
+            # TODO: probably Organization UID is without the account id
+            output_data["auth_method"] = (
+                f"profile: {get_nested_attribute(provider, 'identity.profile')}"
+            )
+
+        elif provider.type == "azure":
+            # TODO: we should show the authentication method used I think
+            output_data["auth_method"] = (
+                f"{provider.identity.identity_type}: {provider.identity.identity_id}"
+            )
+            # Get the first tenant domain ID, just in case
+            output_data["account_organization_uid"] = get_nested_attribute(
+                provider, "identity.tenant_ids"
+            )[0]
+            # TODO: check the tenant_ids
+            # TODO: we have to get the account organization, the tenant is not that
+            output_data["account_organization_name"] = get_nested_attribute(
+                provider, "identity.tenant_domain"
+            )
+
+            output_data["partition"] = get_nested_attribute(
+                provider, "region_config.name"
+            )
+            # TODO: pending to get the subscription tags
+            # "account_tags": "organizations_metadata.account_details_tags",
+            # TODO: store subscription_name + id pairs
+            # "account_name": "organizations_metadata.account_details_name",
+            # "account_email": "organizations_metadata.account_details_email",
+
+        elif provider.type == "gcp":
+            output_data["auth_method"] = (
+                f"Principal: {get_nested_attribute(provider, 'identity.profile')}"
+            )
+
+        elif provider.type == "kubernetes":
+            if provider.identity.context == "In-Cluster":
+                output_data["auth_method"] = "in-cluster"
+            else:
+                output_data["auth_method"] = "kubeconfig"
+            output_data["account_name"] = f"context: {provider.identity.context}"
+            output_data["account_uid"] = get_nested_attribute(
+                provider, "identity.cluster"
+            )
+
+        elif provider.type == "github":
+            output_data["auth_method"] = provider.auth_method
+            output_data["account_name"] = provider.identity.account_name
+            output_data["account_uid"] = provider.identity.account_id
+
+        elif provider.type == "m365":
+            output_data["auth_method"] = (
+                f"{provider.identity.identity_type}: {provider.identity.identity_id}"
+            )
+            output_data["account_uid"] = get_nested_attribute(
+                provider, "identity.tenant_id"
+            )
+            output_data["account_name"] = get_nested_attribute(
+                provider, "identity.tenant_domain"
+            )
+
+        elif provider.type == "nhn":
+            output_data["auth_method"] = (
+                f"passwordCredentials: username={get_nested_attribute(provider, '_identity.username')}, "
+                f"tenantId={get_nested_attribute(provider, '_identity.tenant_id')}"
+            )
+            output_data["account_uid"] = get_nested_attribute(
+                provider, "identity.tenant_id"
+            )
+            output_data["account_name"] = get_nested_attribute(
+                provider, "identity.tenant_domain"
+            )
+
+        elif provider.type == "iac":
+            output_data["auth_method"] = provider.auth_method
+            output_data["account_uid"] = "iac"
+            output_data["account_name"] = "iac"
+
+        return output_data
+
     @classmethod
     def generate_output(
-        cls, provider: Provider, check_output: Check_Report, output_options
+        cls,
+        provider: Provider,
+        check_output: Check_Report,
+        output_options,
+        context: "FindingOutputContext" = None,
     ) -> "Finding":
         """Generates the output for a finding based on the provider and output options
 
@@ -107,73 +224,35 @@ class Finding(BaseModel):
             provider (Provider): the provider object
             check_output (Check_Report): the check output object
             output_options: the output options object, depending on the provider
+            context (FindingOutputContext): the output data shared by the findings of the scan, to generate many findings it has to be created once and passed to every call
         Returns:
             finding_output (Finding): the finding output object
 
         """
-        # TODO: move fill_common_finding_data
-        unix_timestamp = False
-        if hasattr(output_options, "unix_timestamp"):
-            unix_timestamp = output_options.unix_timestamp
+        if context is None:
+            context = FindingOutputContext(provider, output_options)
 
-        common_finding_data = fill_common_finding_data(check_output, unix_timestamp)
+        # TODO: move fill_common_finding_data
+        common_finding_data = fill_common_finding_data(
+            check_output, context.unix_timestamp
+        )
         output_data = {}
         output_data.update(common_finding_data)
 
         try:
             output_data["compliance"] = check_output.compliance
         except AttributeError:
-            bulk_checks_metadata = {}
-            if hasattr(output_options, "bulk_checks_metadata"):
-                bulk_checks_metadata = output_options.bulk_checks_metadata
-
-            output_data["compliance"] = get_check_compliance(
-                check_output, provider.type, bulk_checks_metadata
-            )
+            output_data["compliance"] = context.get_check_compliance(check_output)
         try:
-            output_data["provider"] = provider.type
+            output_data.update(context.get_provider_output_data())
             output_data["resource_metadata"] = check_output.resource
 
             if provider.type == "aws":
-                output_data["account_uid"] = get_nested_attribute(
-                    provider, "identity.account"
-                )
-                output_data["account_name"] = get_nested_attribute(
-                    provider, "organizations_metadata.account_name"
-                )
-                output_data["account_email"] = get_nested_attribute(
-                    provider, "organizations_metadata.account_email"
-                )
-                output_data["account_organization_uid"] = get_nested_attribute(
-                    provider, "organizations_metadata.organization_arn"
-                )
-                output_data["account_organization_name"] = get_nested_attribute(
-                    provider, "organizations_metadata.organization_id"
-                )
-                output_data["account_tags"] = get_nested_attribute(
-                    provider, "organizations_metadata.account_tags"
-                )
-                output_data["partition"] = get_nested_attribute(
-                    provider, "identity.partition"
-                )
-
-                # TODO: probably Organization UID is without the account id
-                output_data["auth_method"] = (
-                    f"profile: {get_nested_attribute(provider, 'identity.profile')}"
-                )
                 output_data["resource_name"] = check_output.resource_id
                 output_data["resource_uid"] = check_output.resource_arn
                 output_data["region"] = check_output.region
 
             elif provider.type == "azure":
-                # TODO: we should show the authentication method used I think
-                output_data["auth_method"] = (
-                    f"{provider.identity.identity_type}: {provider.identity.identity_id}"
-                )
-                # Get the first tenant domain ID, just in case
-                output_data["account_organization_uid"] = get_nested_attribute(
-                    provider, "identity.tenant_ids"
-                )[0]
                 output_data["account_uid"] = (
                     output_data["account_organization_uid"]
                     if "Tenant:" in check_output.subscription
@@ -183,25 +262,8 @@ class Finding(BaseModel):
                 output_data["resource_name"] = check_output.resource_name
                 output_data["resource_uid"] = check_output.resource_id
                 output_data["region"] = check_output.location
-                # TODO: check the tenant_ids
-                # TODO: we have to get the account organization, the tenant is not that
-                output_data["account_organization_name"] = get_nested_attribute(
-                    provider, "identity.tenant_domain"
-                )
-
-                output_data["partition"] = get_nested_attribute(
-                    provider, "region_config.name"
-                )
-                # TODO: pending to get the subscription tags
-                # "account_tags": "organizations_metadata.account_details_tags",
-                # TODO: store subscription_name + id pairs
-                # "account_name": "organizations_metadata.account_details_name",
-                # "account_email": "organizations_metadata.account_details_email",
 
             elif provider.type == "gcp":
-                output_data["auth_method"] = (
-                    f"Principal: {get_nested_attribute(provider, 'identity.profile')}"
-                )
                 output_data["account_uid"] = provider.projects[
                     check_output.project_id
                 ].id
@@ -233,59 +295,21 @@ class Finding(BaseModel):
                     ].organization.display_name
 
             elif provider.type == "kubernetes":
-                if provider.identity.context == "In-Cluster":
-                    output_data["auth_method"] = "in-cluster"
-                else:
-                    output_data["auth_method"] = "kubeconfig"
                 output_data["resource_name"] = check_output.resource_name
                 output_data["resource_uid"] = check_output.resource_id
-                output_data["account_name"] = f"context: {provider.identity.context}"
-                output_data["account_uid"] = get_nested_attribute(
-                    provider, "identity.cluster"
-                )
                 output_data["region"] = f"namespace: {check_output.namespace}"
 
             elif provider.type == "github":
-                output_data["auth_method"] = provider.auth_method
                 output_data["resource_name"] = check_output.resource_name
                 output_data["resource_uid"] = check_output.resource_id
-                output_data["account_name"] = provider.identity.account_name
-                output_data["account_uid"] = provider.identity.account_id
                 output_data["region"] = check_output.owner
 
-            elif provider.type == "m365":
-                output_data["auth_method"] = (
-                    f"{provider.identity.identity_type}: {provider.identity.identity_id}"
-                )
-                output_data["account_uid"] = get_nested_attribute(
-                    provider, "identity.tenant_id"
-                )
-                output_data["account_name"] = get_nested_attribute(
-                    provider, "identity.tenant_domain"
-                )
-                output_data["resource_name"] = check_output.resource_name
-                output_data["resource_uid"] = check_output.resource_id
-                output_data["region"] = check_output.location
-
-            elif provider.type == "nhn":
-                output_data["auth_method"] = (
-                    f"passwordCredentials: username={get_nested_attribute(provider, '_identity.username')}, "
-                    f"tenantId={get_nested_attribute(provider, '_identity.tenant_id')}"
-                )
-                output_data["account_uid"] = get_nested_attribute(
-                    provider, "identity.tenant_id"
-                )
-                output_data["account_name"] = get_nested_attribute(
-                    provider, "identity.tenant_domain"
-                )
+            elif provider.type in ("m365", "nhn"):
                 output_data["resource_name"] = check_output.resource_name
                 output_data["resource_uid"] = check_output.resource_id
                 output_data["region"] = check_output.location
 
             elif provider.type == "iac":
-                output_data["auth_method"] = provider.auth_method
-                output_data["account_uid"] = "iac"
-                output_data["account_name"] = "iac"
                 output_data["resource_name"] = check_output.resource_name
                 output_data["resource_uid"] = check_output.resource_name
                 output_data["region"] = check_output.resource_path
@@ -309,6 +333,20 @@ class Finding(BaseModel):
                     f"Check {check_output.check_metadata.CheckID} has no resource_name."
                 )
 
+            if not context.validate:
+                # Skip the validation, keeping only the model fields as the validation does
+                output_data["status"] = Status(output_data["status"])
+                if isinstance(output_data["timestamp"], str):
+                    output_data["timestamp"] = datetime.fromisoformat(
+                        output_data["timestamp"]
+                    )
+                return cls.construct(
+                    **{
+                        field: value
+                        for field, value in output_data.items()
+                        if field in cls.__fields__
+                    }
+                )
             return cls(**output_data)
         except ValidationError as validation_error:
             logger.error(
@@ -508,3 +546,42 @@ class Finding(BaseModel):
             "all_fails_are_muted": all_fails_are_muted,
         }
         return stats
+
+
+class FindingOutputContext:
+    """
+    FindingOutputContext keeps the output data shared by all the findings of a scan, so it is computed once instead of once per finding.
+
+    Attributes:
+        provider (Provider): the provider object
+        unix_timestamp (bool): whether the timestamps are unix timestamps
+        bulk_checks_metadata (dict): the bulk checks metadata used to get the checks compliance
+        validate (bool): whether the findings are validated, it can be disabled when the check outputs are known to be valid
+    """
+
+    def __init__(self, provider: Provider, output_options, validate: bool = True):
+        self.provider = provider
+        self.unix_timestamp = getattr(output_options, "unix_timestamp", False)
+        self.bulk_checks_metadata = getattr(output_options, "bulk_checks_metadata", {})
+        self.validate = validate
+        self._provider_output_data = None
+        self._checks_compliance = {}
+
+    def get_provider_output_data(self) -> dict:
+        """Returns the output data that only depends on the provider, computed on the first call"""
+        if self._provider_output_data is None:
+            self._provider_output_data = Finding.get_provider_output_data(self.provider)
+        return self._provider_output_data
+
+    def get_check_compliance(self, check_output: Check_Report) -> dict:
+        """Returns the compliance of the finding's check, computed once per check"""
+        check_id = check_output.check_metadata.CheckID
+        if check_id not in self._checks_compliance:
+            self._checks_compliance[check_id] = get_check_compliance(
+                check_output, self.provider.type, self.bulk_checks_metadata
+            )
+        # Every finding gets its own copy
+        return {
+            framework: list(requirements)
+            for framework, requirements in self._checks_compliance[check_id].items()
+        }
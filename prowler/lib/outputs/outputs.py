@@ -1,10 +1,11 @@
+from typing import Union
+
 from colorama import Fore, Style
 
 from prowler.config.config import orange_color
-from prowler.lib.check.models import Severity
 from prowler.lib.logger import logger
-from prowler.lib.outputs.common import Status
 from prowler.lib.outputs.finding import Finding
+from prowler.lib.outputs.statistics import FindingsColumns
 
 
 def stdout_report(finding, color, verbose, status, fix):
@@ -96,9 +97,11 @@ def set_report_color(status: str, muted: bool = False) -> str:
     return color
 
 
-def extract_findings_statistics(findings: list[Finding]) -> dict:
+def extract_findings_statistics(
+    findings: Union[list[Finding], FindingsColumns],
+) -> dict:
     """
-    extract_findings_statistics takes a list of findings and returns the following dict with the aggregated statistics
+    extract_findings_statistics takes a list of findings, or their FindingsColumns, and returns the following dict with the aggregated statistics
     {
         "total_pass": 0,
         "total_muted_pass": 0,
@@ -106,87 +109,15 @@ def extract_findings_statistics(findings: list[Finding]) -> dict:
         "total_muted_fail": 0,
         "resources_count": 0,
         "findings_count": 0,
-        "critical_failed_findings": [],
-        "critical_passed_findings": []
+        "total_critical_severity_fail": 0,
+        "total_critical_severity_pass": 0,
+        ...
+        "total_informational_severity_pass": 0,
+        "total_informational_severity_fail": 0,
         "all_fails_are_muted": False
     }
     """
     logger.info("Extracting audit statistics...")
-    stats = {}
-    total_pass = 0
-    total_fail = 0
-    muted_pass = 0
-    muted_fail = 0
-    resources = set()
-    findings_count = 0
-    all_fails_are_muted = True
-    critical_severity_pass = 0
-    critical_severity_fail = 0
-    high_severity_pass = 0
-    high_severity_fail = 0
-    medium_severity_pass = 0
-    medium_severity_fail = 0
-    low_severity_pass = 0
-    low_severity_fail = 0
-    informational_severity_pass = 0
-    informational_severity_fail = 0
-
-    for finding in findings:
-        resources.add(finding.resource_uid)
-
-        if finding.status == Status.PASS:
-            findings_count += 1
-            total_pass += 1
-            if finding.metadata.Severity == Severity.critical:
-                critical_severity_pass += 1
-            if finding.metadata.Severity == Severity.high:
-                high_severity_pass += 1
-            if finding.metadata.Severity == Severity.medium:
-                medium_severity_pass += 1
-            if finding.metadata.Severity == Severity.low:
-                low_severity_pass += 1
-            if finding.metadata.Severity == Severity.informational:
-                informational_severity_pass += 1
-
-            if finding.muted is True:
-                muted_pass += 1
-
-        if finding.status == Status.FAIL:
-            findings_count += 1
-            total_fail += 1
-            if finding.metadata.Severity == Severity.critical:
-                critical_severity_fail += 1
-            if finding.metadata.Severity == Severity.high:
-                high_severity_fail += 1
-            if finding.metadata.Severity == Severity.medium:
-                medium_severity_fail += 1
-            if finding.metadata.Severity == Severity.low:
-                low_severity_fail += 1
-            if finding.metadata.Severity == Severity.informational:
-                informational_severity_fail += 1
-
-            if finding.muted is True:
-                muted_fail += 1
-
-            if not finding.muted and all_fails_are_muted:
-                all_fails_are_muted = False
-
-    stats["total_pass"] = total_pass
-    stats["total_muted_pass"] = muted_pass
-    stats["total_fail"] = total_fail
-    stats["total_muted_fail"] = muted_fail
-    stats["resources_count"] = len(resources)
-    stats["findings_count"] = findings_count
-    stats["total_critical_severity_fail"] = critical_severity_fail
-    stats["total_critical_severity_pass"] = critical_severity_pass
-    stats["total_high_severity_fail"] = high_severity_fail
-    stats["total_high_severity_pass"] = high_severity_pass
-    stats["total_medium_severity_fail"] = medium_severity_fail
-    stats["total_medium_severity_pass"] = medium_severity_pass
-    stats["total_low_severity_fail"] = low_severity_fail
-    stats["total_low_severity_pass"] = low_severity_pass
-    stats["total_informational_severity_pass"] = informational_severity_pass
-    stats["total_informational_severity_fail"] = informational_severity_fail
-    stats["all_fails_are_muted"] = all_fails_are_muted
-
-    return stats
+    if not isinstance(findings, FindingsColumns):
+        findings = FindingsColumns.from_findings(findings)
+    return findings.get_statistics()
@@ -0,0 +1,180 @@
+from importlib import import_module
+
+# The output classes are registered by module path so only the ones for the requested provider and output formats are imported
+OUTPUT_OPTIONS_CLASSES = {
+    "aws": ("prowler.providers.aws.models", "AWSOutputOptions"),
+    "azure": ("prowler.providers.azure.models", "AzureOutputOptions"),
+    "gcp": ("prowler.providers.gcp.models", "GCPOutputOptions"),
+    "kubernetes": ("prowler.providers.kubernetes.models", "KubernetesOutputOptions"),
+    "github": ("prowler.providers.github.models", "GithubOutputOptions"),
+    "m365": ("prowler.providers.m365.models", "M365OutputOptions"),
+    "nhn": ("prowler.providers.nhn.models", "NHNOutputOptions"),
+    "iac": ("prowler.providers.iac.models", "IACOutputOptions"),
+}
+
+OUTPUT_FORMAT_CLASSES = {
+    "csv": ("prowler.lib.outputs.csv.csv", "CSV"),
+    "json-asff": ("prowler.lib.outputs.asff.asff", "ASFF"),
+    "json-ocsf": ("prowler.lib.outputs.ocsf.ocsf", "OCSF"),
+    "html": ("prowler.lib.outputs.html.html", "HTML"),
+}
+
+# The first compliance framework prefix matching the compliance name is used, the rest of frameworks use the generic compliance output
+COMPLIANCE_OUTPUT_CLASSES = {
+    "aws": [
+        ("cis_", "prowler.lib.outputs.compliance.cis.cis_aws", "AWSCIS"),
+        (
+            "mitre_attack_aws",
+            "prowler.lib.outputs.compliance.mitre_attack.mitre_attack_aws",
+            "AWSMitreAttack",
+        ),
+        ("ens_", "prowler.lib.outputs.compliance.ens.ens_aws", "AWSENS"),
+        (
+            "aws_well_architected_framework",
+            "prowler.lib.outputs.compliance.aws_well_architected.aws_well_architected",
+            "AWSWellArchitected",
+        ),
+        (
+            "iso27001_",
+            "prowler.lib.outputs.compliance.iso27001.iso27001_aws",
+            "AWSISO27001",
+        ),
+        (
+            "kisa",
+            "prowler.lib.outputs.compliance.kisa_ismsp.kisa_ismsp_aws",
+            "AWSKISAISMSP",
+        ),
+        (
+            "prowler_threatscore_aws",
+            "prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_aws",
+            "ProwlerThreatScoreAWS",
+        ),
+    ],
+    "azure": [
+        ("cis_", "prowler.lib.outputs.compliance.cis.cis_azure", "AzureCIS"),
+        (
+            "mitre_attack_azure",
+            "prowler.lib.outputs.compliance.mitre_attack.mitre_attack_azure",
+            "AzureMitreAttack",
+        ),
+        ("ens_", "prowler.lib.outputs.compliance.ens.ens_azure", "AzureENS"),
+        (
+            "iso27001_",
+            "prowler.lib.outputs.compliance.iso27001.iso27001_azure",
+            "AzureISO27001",
+        ),
+        (
+            "prowler_threatscore_azure",
+            "prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_azure",
+            "ProwlerThreatScoreAzure",
+        ),
+    ],
+    "gcp": [
+        ("cis_", "prowler.lib.outputs.compliance.cis.cis_gcp", "GCPCIS"),
+        (
+            "mitre_attack_gcp",
+            "prowler.lib.outputs.compliance.mitre_attack.mitre_attack_gcp",
+            "GCPMitreAttack",
+        ),
+        ("ens_", "prowler.lib.outputs.compliance.ens.ens_gcp", "GCPENS"),
+        (
+            "iso27001_",
+            "prowler.lib.outputs.compliance.iso27001.iso27001_gcp",
+            "GCPISO27001",
+        ),
+        (
+            "prowler_threatscore_gcp",
+            "prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_gcp",
+            "ProwlerThreatScoreGCP",
+        ),
+    ],
+    "kubernetes": [
+        (
+            "cis_",
+            "prowler.lib.outputs.compliance.cis.cis_kubernetes",
+            "KubernetesCIS",
+        ),
+        (
+            "iso27001_",
+            "prowler.lib.outputs.compliance.iso27001.iso27001_kubernetes",
+            "KubernetesISO27001",
+        ),
+    ],
+    "m365": [
+        ("cis_", "prowler.lib.outputs.compliance.cis.cis_m365", "M365CIS"),
+        (
+            "prowler_threatscore_m365",
+            "prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_m365",
+            "ProwlerThreatScoreM365",
+        ),
+        (
+            "iso27001_",
+            "prowler.lib.outputs.compliance.iso27001.iso27001_m365",
+            "M365ISO27001",
+        ),
+    ],
+    "nhn": [
+        (
+            "iso27001_",
+            "prowler.lib.outputs.compliance.iso27001.iso27001_nhn",
+            "NHNISO27001",
+        ),
+    ],
+    "github": [
+        ("cis_", "prowler.lib.outputs.compliance.cis.cis_github", "GithubCIS"),
+    ],
+}
+
+GENERIC_COMPLIANCE_OUTPUT_CLASS = (
+    "prowler.lib.outputs.compliance.generic.generic",
+    "GenericCompliance",
+)
+
+
+def _import_class(module_path: str, class_name: str) -> type:
+    return getattr(import_module(module_path), class_name)
+
+
+def get_output_options_class(provider: str) -> type:
+    """
+    Returns the output options class of a provider, importing only its module.
+
+    Args:
+        provider (str): The provider name.
+
+    Returns:
+        type: The output options class of the provider.
+    """
+    return _import_class(*OUTPUT_OPTIONS_CLASSES[provider])
+
+
+def get_output_format_class(output_format: str) -> type:
+    """
+    Returns the output class of an output format, importing only its module.
+
+    Args:
+        output_format (str): The output format (e.g. csv, json-asff, json-ocsf or html).
+
+    Returns:
+        type: The output class of the output format.
+    """
+    return _import_class(*OUTPUT_FORMAT_CLASSES[output_format])
+
+
+def get_compliance_output_class(provider: str, compliance_name: str) -> type:
+    """
+    Returns the compliance output class of a compliance framework, importing only its module.
+
+    Args:
+        provider (str): The provider name.
+        compliance_name (str): The compliance framework name (e.g. cis_2.0_aws).
+
+    Returns:
+        type: The compliance output class, the generic compliance output if the framework has no specific output.
+    """
+    for framework_prefix, module_path, class_name in COMPLIANCE_OUTPUT_CLASSES.get(
+        provider, []
+    ):
+        if compliance_name.startswith(framework_prefix):
+            return _import_class(module_path, class_name)
+    return _import_class(*GENERIC_COMPLIANCE_OUTPUT_CLASS)
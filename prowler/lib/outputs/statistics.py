@@ -0,0 +1,203 @@
+import numpy as np
+
+# Codes of the columns, the statuses and severities not listed here get the next code
+STATUS_CODES = {"PASS": 0, "FAIL": 1, "MANUAL": 2}
+SEVERITY_CODES = {
+    "critical": 0,
+    "high": 1,
+    "medium": 2,
+    "low": 3,
+    "informational": 4,
+}
+
+
+def _get_value(value) -> str:
+    # Status and Severity are str enums, their value is used as key
+    return getattr(value, "value", value)
+
+
+class FindingsColumns:
+    """
+    FindingsColumns keeps the fields needed by the findings statistics and summaries as columns of interned codes.
+
+    The columns are filled as the findings are added, and every statistic is computed with vectorized operations over them.
+    """
+
+    def __init__(self) -> None:
+        self._statuses = []
+        self._severities = []
+        self._muted = []
+        self._services = []
+        self._resources = []
+        self._service_codes = {}
+        self._resource_codes = {}
+        self._service_providers = []
+
+    def __len__(self) -> int:
+        return len(self._statuses)
+
+    @staticmethod
+    def from_findings(findings: list) -> "FindingsColumns":
+        """
+        Builds the columns of a list of findings, both Finding outputs and Check_Report findings are supported.
+
+        Args:
+            findings (list): The findings.
+
+        Returns:
+            FindingsColumns: The columns of the findings.
+        """
+        columns = FindingsColumns()
+        for finding in findings:
+            columns.add(finding)
+        return columns
+
+    def add(self, finding) -> None:
+        """
+        Adds a finding to the columns.
+
+        Args:
+            finding (Finding | Check_Report): The finding to add.
+        """
+        metadata = getattr(finding, "metadata", None) or finding.check_metadata
+        self.add_values(
+            status=finding.status,
+            severity=metadata.Severity,
+            muted=finding.muted,
+            service=metadata.ServiceName,
+            provider=metadata.Provider,
+            resource=getattr(finding, "resource_uid", None),
+        )
+
+    def add_values(
+        self,
+        status: str,
+        severity: str,
+        muted: bool,
+        service: str,
+        provider: str,
+        resource: str = None,
+    ) -> None:
+        """
+        Adds the values of a finding to the columns.
+
+        Args:
+            status (str): The finding status.
+            severity (str): The check severity.
+            muted (bool): Whether the finding is muted.
+            service (str): The check service.
+            provider (str): The check provider.
+            resource (str): The finding resource UID.
+        """
+        self._statuses.append(STATUS_CODES.get(_get_value(status), len(STATUS_CODES)))
+        self._severities.append(
+            SEVERITY_CODES.get(_get_value(severity), len(SEVERITY_CODES))
+        )
+        self._muted.append(muted is True)
+        service_code = self._service_codes.get(service)
+        if service_code is None:
+            service_code = self._service_codes[service] = len(self._service_codes)
+            self._service_providers.append(provider)
+        self._services.append(service_code)
+        self._resources.append(
+            self._resource_codes.setdefault(resource, len(self._resource_codes))
+        )
+
+    def _get_columns(self) -> tuple:
+        return (
+            np.array(self._statuses, dtype=np.int8),
+            np.array(self._severities, dtype=np.int8),
+            np.array(self._muted, dtype=bool),
+        )
+
+    def get_statistics(self) -> dict:
+        """
+        Returns the aggregated statistics of the findings, see extract_findings_statistics.
+
+        Returns:
+            dict: The aggregated statistics.
+        """
+        statuses, severities, muted = self._get_columns()
+        passed = statuses == STATUS_CODES["PASS"]
+        failed = statuses == STATUS_CODES["FAIL"]
+        severities_count = len(SEVERITY_CODES) + 1
+        passed_by_severity = np.bincount(severities[passed], minlength=severities_count)
+        failed_by_severity = np.bincount(severities[failed], minlength=severities_count)
+
+        stats = {
+            "total_pass": int(passed.sum()),
+            "total_muted_pass": int((passed & muted).sum()),
+            "total_fail": int(failed.sum()),
+            "total_muted_fail": int((failed & muted).sum()),
+            "resources_count": len(self._resource_codes),
+            "findings_count": int((passed | failed).sum()),
+        }
+        for severity, code in SEVERITY_CODES.items():
+            stats[f"total_{severity}_severity_fail"] = int(failed_by_severity[code])
+            stats[f"total_{severity}_severity_pass"] = int(passed_by_severity[code])
+        stats["all_fails_are_muted"] = not bool((failed & ~muted).any())
+        return stats
+
+    def get_status_counts(self) -> dict:
+        """
+        Returns the number of passed, failed and muted findings.
+
+        Returns:
+            dict: The counts with the format {"PASS": int, "FAIL": int, "MUTED": int}.
+        """
+        statuses, _, muted = self._get_columns()
+        return {
+            "PASS": int((statuses == STATUS_CODES["PASS"]).sum()),
+            "FAIL": int((statuses == STATUS_CODES["FAIL"]).sum()),
+            "MUTED": int(muted.sum()),
+        }
+
+    def get_services_summary(self) -> list[dict]:
+        """
+        Returns the summary of every run of consecutive findings of the same service, in the findings order.
+
+        Returns:
+            list: The summary of every service with the format {"Service", "Provider", "Total", "Pass", "Critical", "High", "Medium", "Low", "Muted"}.
+        """
+        if not len(self):
+            return []
+        statuses, severities, muted = self._get_columns()
+        services = np.array(self._services, dtype=np.int32)
+        failed = statuses == STATUS_CODES["FAIL"]
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(services)) + 1))
+        totals = np.diff(np.append(starts, len(services)))
+        counts = {
+            "Pass": np.add.reduceat(
+                (statuses == STATUS_CODES["PASS"]).astype(np.int64), starts
+            ),
+            "Muted": np.add.reduceat(muted.astype(np.int64), starts),
+        }
+        for column, severity in (
+            ("Critical", "critical"),
+            ("High", "high"),
+            ("Medium", "medium"),
+            ("Low", "low"),
+        ):
+            counts[column] = np.add.reduceat(
+                (failed & (severities == SEVERITY_CODES[severity])).astype(np.int64),
+                starts,
+            )
+
+        services_by_code = list(self._service_codes)
+        summary = []
+        for index, start in enumerate(starts):
+            service_code = services[start]
+            summary.append(
+                {
+                    "Service": services_by_code[service_code],
+                    "Provider": self._service_providers[service_code],
+                    "Total": int(totals[index]),
+                    "Pass": int(counts["Pass"][index]),
+                    "Critical": int(counts["Critical"][index]),
+                    "High": int(counts["High"][index]),
+                    "Medium": int(counts["Medium"][index]),
+                    "Low": int(counts["Low"][index]),
+                    "Muted": int(counts["Muted"][index]),
+                }
+            )
+        return summary
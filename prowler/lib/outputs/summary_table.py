@@ -1,4 +1,5 @@
 import sys
+from typing import Union
 
 from colorama import Fore, Style
 from tabulate import tabulate
@@ -11,11 +12,12 @@ from prowler.config.config import (
     orange_color,
 )
 from prowler.lib.logger import logger
+from prowler.lib.outputs.statistics import FindingsColumns
 from prowler.providers.github.models import GithubAppIdentityInfo, GithubIdentityInfo
 
 
 def display_summary_table(
-    findings: list,
+    findings: Union[list, FindingsColumns],
     provider,
     output_options,
 ):
@@ -62,19 +64,15 @@ def display_summary_table(
                 entity_type = "Directory"
                 audited_entities = provider.scan_path
 
+        if not isinstance(findings, FindingsColumns):
+            findings = FindingsColumns.from_findings(findings)
+        status_counts = findings.get_status_counts()
+        pass_count = status_counts["PASS"]
+        fail_count = status_counts["FAIL"]
+        muted_count = status_counts["MUTED"]
+
         # Check if there are findings and that they are not all MANUAL
-        if findings and not all(finding.status == "MANUAL" for finding in findings):
-            current = {
-                "Service": "",
-                "Provider": "",
-                "Total": 0,
-                "Pass": 0,
-                "Critical": 0,
-                "High": 0,
-                "Medium": 0,
-                "Low": 0,
-                "Muted": 0,
-            }
+        if pass_count or fail_count:
             findings_table = {
                 "Provider": [],
                 "Service": [],
@@ -85,43 +83,8 @@ def display_summary_table(
                 "Low": [],
                 "Muted": [],
             }
-            pass_count = fail_count = muted_count = 0
-            for finding in findings:
-                # If new service and not first, add previous row
-                if (
-                    current["Service"] != finding.check_metadata.ServiceName
-                    and current["Service"]
-                ):
-                    add_service_to_table(findings_table, current)
-
-                    current["Total"] = current["Pass"] = current["Muted"] = current[
-                        "Critical"
-                    ] = current["High"] = current["Medium"] = current["Low"] = 0
-
-                current["Service"] = finding.check_metadata.ServiceName
-                current["Provider"] = finding.check_metadata.Provider
-
-                current["Total"] += 1
-                if finding.muted:
-                    muted_count += 1
-                    current["Muted"] += 1
-                if finding.status == "PASS":
-                    pass_count += 1
-                    current["Pass"] += 1
-                elif finding.status == "FAIL":
-                    fail_count += 1
-                    if finding.check_metadata.Severity == "critical":
-                        current["Critical"] += 1
-                    elif finding.check_metadata.Severity == "high":
-                        current["High"] += 1
-                    elif finding.check_metadata.Severity == "medium":
-                        current["Medium"] += 1
-                    elif finding.check_metadata.Severity == "low":
-                        current["Low"] += 1
-
-            # Add final service
-
-            add_service_to_table(findings_table, current)
+            for service_summary in findings.get_services_summary():
+                add_service_to_table(findings_table, service_summary)
 
             print("\nOverview Results:")
             overview_table = [
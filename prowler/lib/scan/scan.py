@@ -11,10 +11,14 @@ from prowler.lib.check.check import (
 from prowler.lib.check.checks_loader import load_checks_to_execute
 from prowler.lib.check.compliance import update_checks_metadata_with_compliance
 from prowler.lib.check.compliance_models import Compliance
-from prowler.lib.check.models import CheckMetadata, Severity
+from prowler.lib.check.models import (
+    CheckMetadata,
+    Severity,
+    clear_resource_snapshots,
+)
 from prowler.lib.logger import logger
 from prowler.lib.outputs.common import Status
-from prowler.lib.outputs.finding import Finding
+from prowler.lib.outputs.finding import Finding, FindingOutputContext
 from prowler.lib.scan.exceptions.exceptions import (
     ScanInvalidCategoryError,
     ScanInvalidCheckError,
@@ -252,6 +256,8 @@ class Scan:
                 arguments=arguments,
                 bulk_checks_metadata=self.bulk_checks_metadata,
             )
+            # The provider data and checks compliance are computed once for all the findings
+            finding_output_context = FindingOutputContext(self.provider, output_options)
 
             checks_to_execute = self.checks_to_execute
             # Initialize the Audit Metadata
@@ -282,13 +288,15 @@ class Scan:
                             f"Check '{check_name}' was not found for the {self._provider.type.upper()} provider"
                         )
                         continue
-                    # Execute the check
-                    check_findings = execute(
-                        check,
-                        self._provider,
-                        custom_checks_metadata,
-                        output_options=None,
-                    )
+                    # Execute the check, its service clients use the services of the scan provider
+                    # so scans of other providers can run in other threads
+                    with Provider.scope(self._provider):
+                        check_findings = execute(
+                            check,
+                            self._provider,
+                            custom_checks_metadata,
+                            output_options=None,
+                        )
 
                     # Filter the findings by the status
                     if self._status:
@@ -323,6 +331,7 @@ class Scan:
                                     self.provider,
                                     finding,
                                     output_options=output_options,
+                                    context=finding_output_context,
                                 )
                             )
                         except Exception:
@@ -344,6 +353,9 @@ class Scan:
             logger.error(
                 f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
+        finally:
+            # The findings of the scan have been generated, the resources are not needed anymore
+            clear_resource_snapshots()
 
     def get_completed_services(self) -> set[str]:
         """
@@ -1,5 +1,104 @@
+import re
+from bisect import bisect_left
+from threading import Lock
+
 from prowler.lib.logger import logger
 
+# Separators of the ARN segments, e.g. arn:aws:s3:::bucket or arn:aws:iam::123456789012:user/name
+ARN_SEGMENTS_SEPARATORS = re.compile(r"[:/]")
+
+
+class AuditResourcesFilter:
+    """
+    AuditResourcesFilter is the compiled form of the audit resources used to filter the resources of the scan.
+
+    A resource is filtered if it is contained in any of the audit resources, like checking it against the string of the audit resources list,
+    but the lookups use the following indexes built once:
+        - The exact audit resources and their ARN segments (e.g. the bucket name or the instance ID), found in O(1).
+        - The sorted audit resources, where an ARN is found in O(len(resource) * log(n)) as the prefix of an audit resource.
+        - The string of the audit resources, only searched for the non-ARN resources that are not a segment (e.g. part of a name).
+    """
+
+    def __init__(self, audit_resources: list) -> None:
+        """
+        Args:
+            audit_resources (list): The resources to audit, usually ARNs.
+        """
+        self._audit_resources = frozenset(audit_resources)
+        self._segments = frozenset(
+            segment
+            for audit_resource in self._audit_resources
+            for segment in ARN_SEGMENTS_SEPARATORS.split(audit_resource)
+        )
+        self._sorted_audit_resources = sorted(self._audit_resources)
+        # An ARN can only be found at the start of the audit resources if no other ARN is inside them
+        self._arn_prefix_lookup = all(
+            "arn:" not in audit_resource[1:] for audit_resource in self._audit_resources
+        )
+        self._audit_resources_text = str(list(audit_resources))
+
+    def __len__(self) -> int:
+        return len(self._audit_resources)
+
+    def __contains__(self, resource: str) -> bool:
+        return self.is_filtered(resource)
+
+    def is_filtered(self, resource: str) -> bool:
+        """
+        Returns True if the resource is contained in any of the audit resources.
+
+        Args:
+            resource (str): The resource ARN, name or ID.
+
+        Returns:
+            bool: True if the resource is filtered.
+        """
+        if resource in self._audit_resources or resource in self._segments:
+            return True
+        if self._arn_prefix_lookup and resource.startswith("arn:"):
+            index = bisect_left(self._sorted_audit_resources, resource)
+            return index < len(
+                self._sorted_audit_resources
+            ) and self._sorted_audit_resources[index].startswith(resource)
+        return resource in self._audit_resources_text
+
+
+# Maximum number of audit resources lists compiled at the same time, one per provider
+AUDIT_RESOURCES_FILTERS_CACHE_SIZE = 8
+# {id(audit_resources): (audit_resources, len(audit_resources), filter)}, the list is kept so its id is not reused
+_audit_resources_filters = {}
+_audit_resources_filters_lock = Lock()
+
+
+def get_audit_resources_filter(audit_resources: list) -> AuditResourcesFilter:
+    """
+    Returns the AuditResourcesFilter of the audit resources list, compiled only the first time the list is used.
+
+    The audit resources are set once by the provider, a list changing its length is compiled again.
+
+    Args:
+        audit_resources (list): The resources to audit.
+
+    Returns:
+        AuditResourcesFilter: The compiled audit resources.
+    """
+    if isinstance(audit_resources, AuditResourcesFilter):
+        return audit_resources
+    cached = _audit_resources_filters.get(id(audit_resources))
+    if cached and cached[0] is audit_resources and cached[1] == len(audit_resources):
+        return cached[2]
+    audit_resources_filter = AuditResourcesFilter(audit_resources)
+    # The providers of concurrent scans share the cache
+    with _audit_resources_filters_lock:
+        if len(_audit_resources_filters) >= AUDIT_RESOURCES_FILTERS_CACHE_SIZE:
+            del _audit_resources_filters[next(iter(_audit_resources_filters))]
+        _audit_resources_filters[id(audit_resources)] = (
+            audit_resources,
+            len(audit_resources),
+            audit_resources_filter,
+        )
+    return audit_resources_filter
+
 
 def is_resource_filtered(resource: str, audit_resources: list) -> bool:
     """
@@ -8,9 +107,7 @@ def is_resource_filtered(resource: str, audit_resources: list) -> bool:
     Returns True if it is filtered and False if it does not match the input filters
     """
     try:
-        if resource in str(audit_resources):
-            return True
-        return False
+        return get_audit_resources_filter(audit_resources).is_filtered(resource)
     except Exception as error:
         logger.error(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error} ({resource})"
@@ -0,0 +1,250 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from functools import lru_cache
+from hashlib import sha256
+from io import StringIO
+from typing import Optional
+
+from detect_secrets import SecretsCollection
+from detect_secrets.core.scan import _process_line_based_plugins, get_transformed_file
+from detect_secrets.settings import transient_settings
+
+from prowler.lib.logger import logger
+
+# Name reported as filename for the secrets found in in-memory data
+IN_MEMORY_DATA_NAME = "data"
+# Minimum number of unique items and bytes to scan them using a process pool
+PROCESS_POOL_MIN_ITEMS = 8
+PROCESS_POOL_MIN_BYTES = 1024 * 1024
+# Maximum number of scan results kept per scanner to deduplicate identical content
+SCAN_RESULTS_CACHE_SIZE = 10000
+
+default_detect_secrets_filters = [
+    {"path": "detect_secrets.filters.common.is_invalid_file"},
+    {"path": "detect_secrets.filters.common.is_known_false_positive"},
+    {"path": "detect_secrets.filters.heuristic.is_likely_id_string"},
+    {"path": "detect_secrets.filters.heuristic.is_potential_secret"},
+]
+
+
+class _InMemoryFile(StringIO):
+    """Named in-memory file used by the detect-secrets transformers, newlines are translated as when reading a text file."""
+
+    def __init__(self, data: str, name: str) -> None:
+        super().__init__(data, newline=None)
+        self.name = name
+
+
+def build_detect_secrets_settings(
+    detect_secrets_plugins: list[dict], excluded_secrets: list[str] = None
+) -> dict:
+    """build_detect_secrets_settings returns the detect-secrets settings for the given plugins and excluded secrets.
+    Args:
+        detect_secrets_plugins (list): The detect-secrets plugins to use.
+        excluded_secrets (list): A list of regex patterns to exclude from the scan.
+    Returns:
+        dict: The detect-secrets settings.
+    """
+    settings = {
+        "plugins_used": detect_secrets_plugins,
+        "filters_used": list(default_detect_secrets_filters),
+    }
+    if excluded_secrets and len(excluded_secrets) > 0:
+        settings["filters_used"].append(
+            {
+                "path": "detect_secrets.filters.regex.should_exclude_line",
+                "pattern": excluded_secrets,
+            }
+        )
+    return settings
+
+
+def _scan_data(data: str) -> Optional[list[dict]]:
+    """_scan_data scans in-memory data with the active detect-secrets settings, the same way detect-secrets scans a file.
+    Args:
+        data (str): The data to scan for secrets.
+    Returns:
+        list: The secrets found or None if there are no secrets.
+    """
+    try:
+        # Keep the same decoding used when the data was written to a temporary file
+        data = bytes(data, encoding="raw_unicode_escape").decode("utf-8")
+    except UnicodeDecodeError:
+        # detect-secrets ignores binary files
+        return None
+
+    secrets = {}
+    for use_eager_transformers in (False, True):
+        data_file = _InMemoryFile(data, IN_MEMORY_DATA_NAME)
+        lines = get_transformed_file(
+            data_file, use_eager_transformers=use_eager_transformers
+        )
+        if not lines:
+            if use_eager_transformers:
+                break
+            lines = data_file.readlines()
+        # Lines are flagged as added so the code snippets are taken from them instead of re-reading a file
+        for secret in _process_line_based_plugins(
+            lines=[(number, line, True, False) for number, line in enumerate(lines, 1)],
+            filename=IN_MEMORY_DATA_NAME,
+        ):
+            secret.is_added = False
+            # The same secret is only reported once, as the SecretsCollection does
+            secrets.setdefault((secret.type, secret.secret_hash), secret)
+        if secrets:
+            break
+
+    if not secrets:
+        return None
+    return [
+        secret.json()
+        for secret in sorted(
+            secrets.values(),
+            key=lambda secret: (
+                getattr(secret, "line_number", 0),
+                secret.secret_hash,
+                secret.type,
+            ),
+        )
+    ]
+
+
+def _scan_data_items(settings: dict, data_items: list[str]) -> list:
+    """_scan_data_items scans several in-memory data items initializing the detect-secrets plugins just once.
+    Args:
+        settings (dict): The detect-secrets settings.
+        data_items (list): The data items to scan.
+    Returns:
+        list: The secrets found for every data item, None if there are no secrets.
+    """
+    with transient_settings(settings):
+        return [_scan_data(data) for data in data_items]
+
+
+class SecretsScanner:
+    """SecretsScanner scans in-memory data for secrets using the detect-secrets library.
+
+    The detect-secrets plugins are initialized once per batch, identical data is only scanned once and big batches are scanned in parallel using a process pool.
+    """
+
+    def __init__(
+        self,
+        detect_secrets_plugins: list[dict],
+        excluded_secrets: list[str] = None,
+        max_workers: int = None,
+    ) -> None:
+        self._settings = build_detect_secrets_settings(
+            detect_secrets_plugins, excluded_secrets
+        )
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._results = {}
+
+    def scan(self, data: str) -> Optional[list[dict]]:
+        """scan scans the data for secrets.
+        Args:
+            data (str): The data to scan for secrets.
+        Returns:
+            list: The secrets found or None if there are no secrets.
+        """
+        return self.scan_many([data])[0]
+
+    def scan_many(self, data_items: list[str]) -> list[Optional[list[dict]]]:
+        """scan_many scans several data items for secrets, keeping the order of the items.
+        Args:
+            data_items (list): The data items to scan for secrets.
+        Returns:
+            list: The secrets found for every data item, None if there are no secrets.
+        """
+        hashes = [
+            sha256(data.encode("utf-8", "surrogatepass")).hexdigest()
+            for data in data_items
+        ]
+        pending = {}
+        for data_hash, data in zip(hashes, data_items):
+            if data_hash not in self._results and data_hash not in pending:
+                pending[data_hash] = data
+
+        if pending:
+            pending_hashes = list(pending.keys())
+            results = self._scan_pending([pending[h] for h in pending_hashes])
+            if len(self._results) + len(results) > SCAN_RESULTS_CACHE_SIZE:
+                self._results.clear()
+            self._results.update(zip(pending_hashes, results))
+            scanned = dict(zip(pending_hashes, results))
+        else:
+            scanned = {}
+
+        return [
+            deepcopy(
+                scanned[data_hash] if data_hash in scanned else self._results[data_hash]
+            )
+            for data_hash in hashes
+        ]
+
+    def _scan_pending(self, data_items: list[str]) -> list:
+        """_scan_pending scans the given unique data items, using a process pool for big batches."""
+        use_process_pool = (
+            self._max_workers > 1
+            and len(data_items) >= PROCESS_POOL_MIN_ITEMS
+            and sum(len(data) for data in data_items) >= PROCESS_POOL_MIN_BYTES
+        )
+        if use_process_pool:
+            try:
+                workers = min(self._max_workers, len(data_items))
+                chunk_size = -(-len(data_items) // workers)
+                chunks = [
+                    data_items[index : index + chunk_size]
+                    for index in range(0, len(data_items), chunk_size)
+                ]
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    results = []
+                    for chunk_results in executor.map(
+                        _scan_data_items, [self._settings] * len(chunks), chunks
+                    ):
+                        results.extend(chunk_results)
+                    return results
+            except Exception as error:
+                logger.warning(
+                    f"Secrets scan process pool not available, scanning sequentially -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+        return _scan_data_items(self._settings, data_items)
+
+    def scan_file(self, file: str) -> Optional[list[dict]]:
+        """scan_file scans a local file for secrets.
+        Args:
+            file (str): The path of the file to scan for secrets.
+        Returns:
+            list: The secrets found or None if there are no secrets.
+        """
+        secrets = SecretsCollection()
+        with transient_settings(self._settings):
+            secrets.scan_file(file)
+        return secrets.json().get(file)
+
+
+@lru_cache(maxsize=32)
+def _get_secrets_scanner(
+    detect_secrets_plugins: str, excluded_secrets: tuple
+) -> SecretsScanner:
+    return SecretsScanner(
+        detect_secrets_plugins=json.loads(detect_secrets_plugins),
+        excluded_secrets=list(excluded_secrets),
+    )
+
+
+def get_secrets_scanner(
+    detect_secrets_plugins: list[dict], excluded_secrets: list[str] = None
+) -> SecretsScanner:
+    """get_secrets_scanner returns the shared SecretsScanner for the given plugins and excluded secrets, so scan results are reused across checks.
+    Args:
+        detect_secrets_plugins (list): The detect-secrets plugins to use.
+        excluded_secrets (list): A list of regex patterns to exclude from the scan.
+    Returns:
+        SecretsScanner: The secrets scanner.
+    """
+    return _get_secrets_scanner(
+        json.dumps(detect_secrets_plugins, sort_keys=True),
+        tuple(excluded_secrets or ()),
+    )
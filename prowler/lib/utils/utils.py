@@ -10,7 +10,6 @@ except ImportError:
 
 import re
 import sys
-import tempfile
 from datetime import datetime
 from hashlib import sha512
 from io import TextIOWrapper
@@ -20,11 +19,10 @@ from time import mktime
 from typing import Any, Optional
 
 from colorama import Style
-from detect_secrets import SecretsCollection
-from detect_secrets.settings import transient_settings
 
 from prowler.config.config import encoding_format_utf_8
 from prowler.lib.logger import logger
+from prowler.lib.utils.secrets_scanner import get_secrets_scanner
 
 default_detect_secrets_plugins = [
     {"name": "ArtifactoryDetector"},
@@ -134,51 +132,13 @@ def detect_secrets_scan(
         {'file.txt': [{'filename': 'file.txt', 'hashed_secret': 'f7c3bc1d808e04732adf679965ccc34ca7ae3441', 'is_verified': False, 'line_number': 1, 'type': 'Secret Keyword'}]}
     """
     try:
-        if not file:
-            temp_data_file = tempfile.NamedTemporaryFile(delete=False)
-            temp_data_file.write(bytes(data, encoding="raw_unicode_escape"))
-            temp_data_file.close()
-
-        secrets = SecretsCollection()
-
         if not detect_secrets_plugins:
             detect_secrets_plugins = default_detect_secrets_plugins
 
-        settings = {
-            "plugins_used": detect_secrets_plugins,
-            "filters_used": [
-                {"path": "detect_secrets.filters.common.is_invalid_file"},
-                {"path": "detect_secrets.filters.common.is_known_false_positive"},
-                {"path": "detect_secrets.filters.heuristic.is_likely_id_string"},
-                {"path": "detect_secrets.filters.heuristic.is_potential_secret"},
-            ],
-        }
-
-        if excluded_secrets and len(excluded_secrets) > 0:
-            settings["filters_used"].append(
-                {
-                    "path": "detect_secrets.filters.regex.should_exclude_line",
-                    "pattern": excluded_secrets,
-                }
-            )
-        with transient_settings(settings):
-            if file:
-                secrets.scan_file(file)
-            else:
-                secrets.scan_file(temp_data_file.name)
-
-        if not file:
-            os.remove(temp_data_file.name)
-
-        detect_secrets_output = secrets.json()
-
-        if detect_secrets_output:
-            if file:
-                return detect_secrets_output[file]
-            else:
-                return detect_secrets_output[temp_data_file.name]
-        else:
-            return None
+        secrets_scanner = get_secrets_scanner(detect_secrets_plugins, excluded_secrets)
+        if file:
+            return secrets_scanner.scan_file(file)
+        return secrets_scanner.scan(data)
     except Exception as e:
         logger.error(f"Error scanning for secrets: {e}")
         return None
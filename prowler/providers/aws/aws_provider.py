@@ -1,8 +1,10 @@
 import os
 import pathlib
 from datetime import datetime
+from functools import lru_cache
 from re import fullmatch
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 from boto3.session import Session
 from botocore.config import Config
@@ -21,6 +23,10 @@ from prowler.config.config import (
 )
 from prowler.lib.check.utils import list_modules, recover_checks_from_service
 from prowler.lib.logger import logger
+from prowler.lib.scan_filters.scan_filters import (
+    AuditResourcesFilter,
+    get_audit_resources_filter,
+)
 from prowler.lib.utils.utils import open_file, parse_json_file, print_boxes
 from prowler.providers.aws.config import (
     AWS_REGION_US_EAST_1,
@@ -393,6 +399,11 @@ class AwsProvider(Provider):
     def audit_resources(self):
         return self._audit_resources
 
+    @property
+    def audit_resources_filter(self) -> AuditResourcesFilter:
+        """The audit resources compiled for the resource lookups, see is_resource_filtered."""
+        return get_audit_resources_filter(self._audit_resources)
+
     @property
     def scan_unused_services(self):
         return self._scan_unused_services
@@ -765,8 +776,7 @@ class AwsProvider(Provider):
         Returns:
             - A set of strings representing the available regions for the given service and partition.
         """
-        data = read_aws_regions_file()
-        json_regions = set(data["services"][service]["regions"][partition])
+        json_regions = set(get_aws_regions_catalogue()[service][partition])
         if audited_regions:
             # Get common regions between input and json
             regions = json_regions.intersection(audited_regions)
@@ -1492,16 +1502,16 @@ class AwsProvider(Provider):
 
         try:
             regions = set()
-            data = read_aws_regions_file()
+            catalogue = get_aws_regions_catalogue()
 
             if partition is None:
-                for service in data["services"].values():
-                    for partition in service["regions"]:
-                        regions.update(service["regions"][partition])
+                for service_regions in catalogue.values():
+                    for partition_regions in service_regions.values():
+                        regions.update(partition_regions)
             else:
                 partition = Partition(partition)
-                for service in data["services"].values():
-                    regions.update(service["regions"][partition.value])
+                for service_regions in catalogue.values():
+                    regions.update(service_regions[partition.value])
 
             return regions
         except ValueError as value_error:
@@ -1540,6 +1550,42 @@ def read_aws_regions_file() -> dict:
     return data
 
 
+def build_aws_regions_catalogue(
+    data: dict,
+) -> Mapping[str, Mapping[str, frozenset[str]]]:
+    """
+    Builds a read-only service -> partition -> regions mapping from the parsed AWS services JSON file.
+
+    Args:
+        data (dict): The parsed data from the AWS services JSON file.
+
+    Returns:
+        Mapping[str, Mapping[str, frozenset[str]]]: The regions of every service per partition.
+    """
+    return MappingProxyType(
+        {
+            service: MappingProxyType(
+                {
+                    partition: frozenset(regions)
+                    for partition, regions in service_data["regions"].items()
+                }
+            )
+            for service, service_data in data["services"].items()
+        }
+    )
+
+
+@lru_cache(maxsize=None)
+def get_aws_regions_catalogue() -> Mapping[str, Mapping[str, frozenset[str]]]:
+    """
+    Returns the AWS services regions catalogue, the AWS services JSON file is only read once per process.
+
+    Returns:
+        Mapping[str, Mapping[str, frozenset[str]]]: The regions of every service per partition.
+    """
+    return build_aws_regions_catalogue(read_aws_regions_file())
+
+
 # TODO: This can be moved to another class since it doesn't need self
 def get_aws_region_for_sts(session_region: str, regions: set[str]) -> str:
     """
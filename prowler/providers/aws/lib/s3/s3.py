@@ -1,13 +1,18 @@
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from io import BytesIO, StringIO
 from os import path
 from tempfile import NamedTemporaryFile
 from typing import Optional
 
+from boto3.s3.transfer import TransferConfig
 from boto3.session import Session
 from botocore.exceptions import ClientError, NoCredentialsError, ProfileNotFound
 
+from prowler.config.config import output_file_timestamp
 from prowler.lib.logger import logger
+from prowler.lib.outputs.html.html import HTML
 from prowler.lib.outputs.output import Output
 from prowler.providers.aws.aws_provider import AwsProvider
 from prowler.providers.aws.config import (
@@ -48,6 +53,27 @@ from prowler.providers.aws.lib.session.aws_set_up_session import (
 from prowler.providers.aws.models import AWSAssumeRoleInfo, AWSIdentityInfo, AWSSession
 from prowler.providers.common.models import Connection
 
+# Maximum number of objects uploaded at the same time
+S3_TRANSFER_MAX_WORKERS = 10
+# Files bigger than this are sent using multipart uploads
+S3_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+S3_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+# Maximum number of parts uploaded at the same time for a single object
+S3_MULTIPART_MAX_CONCURRENCY = 4
+# Default botocore connection pool size, used when the client does not expose it
+BOTOCORE_DEFAULT_MAX_POOL_CONNECTIONS = 10
+
+
+class _OutputBuffer(StringIO):
+    """In-memory file descriptor that keeps its content after the output writer closes it."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__()
+        self.name = name
+
+    def close(self) -> None:
+        pass
+
 
 class S3:
     """
@@ -63,6 +89,9 @@ class S3:
     - get_object_path: Returns the object path within the S3 bucket based on the provided output directory.
     - generate_subfolder_name_by_extension: Generates a subfolder name based on the provided file extension.
     - send_to_bucket: Sends the provided outputs to the S3 bucket.
+    - get_transfer_config: Returns the transfer configuration used for the uploads.
+    - upload_objects: Uploads the provided objects concurrently to an S3 bucket.
+    - _get_stream_output_name: Returns a unique file name for a streamed output.
     """
 
     _session: AWSSession
@@ -168,15 +197,136 @@ class S3:
             subfolder_name = extension.lstrip(".")
         return subfolder_name
 
+    @staticmethod
+    def get_transfer_config() -> TransferConfig:
+        """
+        Return the transfer configuration used for the uploads, files bigger than S3_MULTIPART_THRESHOLD are sent using multipart uploads.
+
+        Returns:
+        - A TransferConfig object.
+        """
+        return TransferConfig(
+            multipart_threshold=S3_MULTIPART_THRESHOLD,
+            multipart_chunksize=S3_MULTIPART_CHUNKSIZE,
+            max_concurrency=S3_MULTIPART_MAX_CONCURRENCY,
+            use_threads=True,
+        )
+
+    @staticmethod
+    def upload_objects(
+        client,
+        bucket_name: str,
+        objects: list[dict],
+        max_workers: int = S3_TRANSFER_MAX_WORKERS,
+    ) -> dict[str, Optional[Exception]]:
+        """
+        Upload the provided objects concurrently to an S3 bucket.
+
+        Parameters:
+        - client: A boto3 S3 client, they are thread safe so the same client is shared by all the uploads.
+        - bucket_name: A string representing the name of the S3 bucket.
+        - objects: A list of dictionaries with the "Key" of the object, either the local "Filename" or a file-like "Fileobj" to upload and optionally the "ExtraArgs".
+        - max_workers: The maximum number of objects uploaded at the same time, it is capped so the parts uploaded at the same time fit in the client connection pool.
+
+        Returns:
+        - A dictionary where keys are the object keys and values are None if the upload succeeded or the raised exception otherwise.
+
+        Raises:
+        - ValueError: If several objects have the same key.
+        """
+        results = {}
+        if not objects:
+            return results
+
+        keys = [s3_object["Key"] for s3_object in objects]
+        if len(set(keys)) != len(keys):
+            duplicated_keys = {key for key in keys if keys.count(key) > 1}
+            raise ValueError(f"Duplicated S3 object keys: {sorted(duplicated_keys)}")
+
+        max_pool_connections = getattr(
+            getattr(getattr(client, "meta", None), "config", None),
+            "max_pool_connections",
+            None,
+        )
+        if not isinstance(max_pool_connections, int):
+            max_pool_connections = BOTOCORE_DEFAULT_MAX_POOL_CONNECTIONS
+        max_workers = min(
+            len(objects),
+            max_workers,
+            max(1, max_pool_connections // S3_MULTIPART_MAX_CONCURRENCY),
+        )
+
+        transfer_config = S3.get_transfer_config()
+
+        def upload_object(s3_object: dict) -> None:
+            if "Fileobj" in s3_object:
+                client.upload_fileobj(
+                    Fileobj=s3_object["Fileobj"],
+                    Bucket=bucket_name,
+                    Key=s3_object["Key"],
+                    ExtraArgs=s3_object.get("ExtraArgs"),
+                    Config=transfer_config,
+                )
+            else:
+                client.upload_file(
+                    Filename=s3_object["Filename"],
+                    Bucket=bucket_name,
+                    Key=s3_object["Key"],
+                    ExtraArgs=s3_object.get("ExtraArgs"),
+                    Config=transfer_config,
+                )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(upload_object, s3_object): s3_object["Key"]
+                for s3_object in objects
+            }
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    future.result()
+                    results[key] = None
+                except Exception as error:
+                    logger.error(
+                        f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}] -- {error}"
+                    )
+                    results[key] = error
+        return results
+
+    @staticmethod
+    def _get_stream_output_name(output: Output, used_names: set) -> str:
+        """
+        Return a unique file name for an output that is streamed without being written to a local file.
+
+        Parameters:
+        - output: The Output object to stream.
+        - used_names: A set with the names already used by other streamed outputs, the returned name is added to it.
+
+        Returns:
+        - A string with the file name of the output.
+        """
+        name = f"prowler-output-{output_file_timestamp}"
+        compliance_name = getattr(output, "compliance_name", None)
+        if compliance_name:
+            name = f"{name}_{compliance_name.lower()}"
+        stream_output_name = f"{name}{output.file_extension}"
+        suffix = 1
+        while stream_output_name in used_names:
+            stream_output_name = f"{name}-{suffix}{output.file_extension}"
+            suffix += 1
+        used_names.add(stream_output_name)
+        return stream_output_name
+
     # TODO: Review the logic behind in Microsoft Windows
     def send_to_bucket(
-        self, outputs: dict[str, list[Output]]
+        self, outputs: dict[str, list[Output]], stream_outputs: bool = False
     ) -> dict[str, dict[str, list[str]]]:
         """
-        Send the provided outputs to the S3 bucket.
+        Send the provided outputs to the S3 bucket. All the files are uploaded concurrently.
 
         Parameters:
         - outputs: A dictionary where keys are strings and values are lists of Output objects.
+        - stream_outputs: If True, the outputs not written to a file are serialized in memory and uploaded directly instead of using a local temporary file.
 
         Returns:
         - A dictionary containing two keys: "success" and "failure", each holding a dictionary where keys are strings and values are lists of strings representing the uploaded object names or tuples of object names and errors respectively.
@@ -189,15 +339,31 @@ class S3:
                 ".ocsf.json": "application/json",
                 ".asff.json": "application/json",
             }
+            bucket_directory = self.get_object_path(self._output_directory)
+            objects_to_upload = []
+            object_extensions = {}
+            stream_output_names = set()
             # Keys are regular and/or compliance
             for key, output_list in outputs.items():
                 for output in output_list:
+                    object_name = None
                     try:
+                        # HTML outputs need the provider and the stats to be written
+                        stream_output = (
+                            stream_outputs
+                            and not output.file_descriptor
+                            and not isinstance(output, HTML)
+                        )
+                        if stream_output:
+                            output.file_descriptor = _OutputBuffer(
+                                name=self._get_stream_output_name(
+                                    output, stream_output_names
+                                )
+                            )
                         # Object is not written to file so we need to temporarily write it
-                        if not output.file_descriptor:
+                        elif not output.file_descriptor:
                             output.file_descriptor = NamedTemporaryFile(mode="a")
 
-                        bucket_directory = self.get_object_path(self._output_directory)
                         basename = path.basename(output.file_descriptor.name)
                         file_extension = output.file_extension
 
@@ -209,38 +375,43 @@ class S3:
                             f"Sending output file {output.file_descriptor.name} to S3 bucket {self._bucket_name}"
                         )
 
-                        # TODO: This will need further optimization if some processes are calling this since the files are written
-                        # into the local filesystem because S3 upload file is the recommended way.
-                        # https://aws.amazon.com/blogs/developer/uploading-files-to-amazon-s3/
-                        self._session.upload_file(
-                            Filename=output.file_descriptor.name,
-                            Bucket=self._bucket_name,
-                            Key=object_name,
-                            ExtraArgs={
+                        s3_object = {
+                            "Key": object_name,
+                            "ExtraArgs": {
                                 "ContentType": extension_to_content_type[file_extension]
                             },
-                        )
-
-                        if output.file_extension in uploaded_objects["success"]:
-                            uploaded_objects["success"][output.file_extension].append(
-                                object_name
+                        }
+                        if stream_output:
+                            output.batch_write_data_to_file()
+                            s3_object["Fileobj"] = BytesIO(
+                                output.file_descriptor.getvalue().encode("utf-8")
                             )
                         else:
-                            uploaded_objects["success"] = {
-                                output.file_extension: [object_name]
-                            }
+                            # S3 upload file is the recommended way for files written into the local filesystem.
+                            # https://aws.amazon.com/blogs/developer/uploading-files-to-amazon-s3/
+                            s3_object["Filename"] = output.file_descriptor.name
+                        objects_to_upload.append(s3_object)
+                        object_extensions[object_name] = file_extension
                     except Exception as error:
                         logger.error(
                             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}] -- {error}"
                         )
-                        if output.file_extension in uploaded_objects["failure"]:
-                            uploaded_objects["failure"][output.file_extension].append(
-                                (object_name, error)
-                            )
-                        else:
-                            uploaded_objects["failure"] = {
-                                output.file_extension: [(object_name, error)]
-                            }
+                        uploaded_objects["failure"].setdefault(
+                            output.file_extension, []
+                        ).append((object_name, error))
+
+            for object_name, error in self.upload_objects(
+                self._session, self._bucket_name, objects_to_upload
+            ).items():
+                file_extension = object_extensions[object_name]
+                if error is None:
+                    uploaded_objects["success"].setdefault(file_extension, []).append(
+                        object_name
+                    )
+                else:
+                    uploaded_objects["failure"].setdefault(file_extension, []).append(
+                        (object_name, error)
+                    )
 
         except Exception as error:
             logger.error(
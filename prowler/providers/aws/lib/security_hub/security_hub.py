@@ -1,5 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Optional
 
 from boto3 import Session
 from botocore.client import ClientError
@@ -17,6 +18,8 @@ from prowler.providers.common.models import Connection
 
 SECURITY_HUB_INTEGRATION_NAME = "prowler/prowler"
 SECURITY_HUB_MAX_BATCH = 100
+# Maximum number of regions processed at the same time
+SECURITY_HUB_MAX_WORKERS = 10
 
 
 @dataclass
@@ -49,6 +52,7 @@ class SecurityHub:
         verify_enabled_per_region: Verifies and stores enabled regions with SecurityHub clients.
         batch_send_to_security_hub: Sends findings to Security Hub and returns the count of successfully sent findings.
         archive_previous_findings: Archives findings that are not present in the current execution.
+        _run_per_region: Runs a per-region function concurrently and returns the sum of the results.
         _send_findings_to_security_hub: Sends findings to AWS Security Hub in batches and returns the count of successfully sent findings.
     """
 
@@ -240,90 +244,139 @@ class SecurityHub:
                 )
         return enabled_regions
 
+    def _run_per_region(self, call: Callable[[str], int]) -> int:
+        """
+        Runs the given function for every region with findings using a bounded thread pool, one worker per region.
+
+        Args:
+            call (Callable[[str], int]): Function that receives the region and returns the number of successfully sent findings.
+
+        Returns:
+            int: Sum of the values returned for every region.
+        """
+        success_count = 0
+        regions = list(self._findings_per_region.keys())
+        if not regions:
+            return success_count
+        with ThreadPoolExecutor(
+            max_workers=min(len(regions), SECURITY_HUB_MAX_WORKERS)
+        ) as executor:
+            futures = {executor.submit(call, region): region for region in regions}
+            for future in as_completed(futures):
+                try:
+                    success_count += future.result()
+                except Exception as error:
+                    logger.error(
+                        f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {futures[future]}"
+                    )
+        return success_count
+
     def batch_send_to_security_hub(
         self,
     ) -> int:
         """
         Sends the findings to AWS Security Hub in batches for each region and returns the count of successfully sent findings.
 
+        Regions are processed concurrently.
+
         Returns:
             int: Number of successfully sent findings to AWS Security Hub.
         """
-        success_count = 0
-        try:
-            # Iterate findings by region
-            for region, findings in self._findings_per_region.items():
-                # Send findings to Security Hub
-                logger.info(
-                    f"Sending {len(findings)} findings to Security Hub in the region {region}"
-                )
+        return self._run_per_region(self._send_region_findings)
 
-                # Convert findings to dict
-                findings = [finding.dict(exclude_none=True) for finding in findings]
-                success_count += self._send_findings_in_batches(
-                    findings,
-                    region,
-                )
+    def _send_region_findings(self, region: str) -> int:
+        """
+        Sends the current findings of the given region to AWS Security Hub.
+
+        Args:
+            region (str): The AWS region where the findings will be sent.
+
+        Returns:
+            int: Number of successfully sent findings to AWS Security Hub.
+        """
+        try:
+            findings = self._findings_per_region[region]
+            # Send findings to Security Hub
+            logger.info(
+                f"Sending {len(findings)} findings to Security Hub in the region {region}"
+            )
 
+            # Convert findings to dict
+            findings = [finding.dict(exclude_none=True) for finding in findings]
+            return self._send_findings_in_batches(
+                findings,
+                region,
+            )
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
             )
-        return success_count
+            return 0
 
     def archive_previous_findings(self) -> int:
         """
         Checks previous findings in Security Hub to archive them.
 
+        Regions are processed concurrently.
+
         Returns:
             int: Number of successfully archived findings.
         """
         logger.info("Checking previous findings in Security Hub to archive them.")
-        success_count = 0
-        for region in self._findings_per_region.keys():
-            try:
-                current_findings = self._findings_per_region[region]
-                # Get current findings IDs
-                current_findings_ids = []
-                for finding in current_findings:
-                    current_findings_ids.append(finding.Id)
-                # Get findings of that region
-                findings_filter = {
-                    "ProductName": [{"Value": "Prowler", "Comparison": "EQUALS"}],
-                    "RecordState": [{"Value": "ACTIVE", "Comparison": "EQUALS"}],
-                    "AwsAccountId": [
-                        {"Value": self._aws_account_id, "Comparison": "EQUALS"}
-                    ],
-                    "Region": [{"Value": region, "Comparison": "EQUALS"}],
-                }
-                get_findings_paginator = self._enabled_regions[region].get_paginator(
-                    "get_findings"
-                )
-                findings_to_archive = []
-                for page in get_findings_paginator.paginate(
-                    Filters=findings_filter, PaginationConfig={"PageSize": 100}
-                ):
-                    # Archive findings that have not appear in this execution
-                    for finding in page["Findings"]:
-                        if finding["Id"] not in current_findings_ids:
-                            finding["RecordState"] = "ARCHIVED"
-                            finding["UpdatedAt"] = timestamp_utc.strftime(
-                                "%Y-%m-%dT%H:%M:%SZ"
-                            )
-
-                            findings_to_archive.append(finding)
-                logger.info(f"Archiving {len(findings_to_archive)} findings.")
-
-                # Send archive findings to SHub
-                success_count += self._send_findings_in_batches(
-                    findings_to_archive,
-                    region,
-                )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
-                )
-        return success_count
+        return self._run_per_region(self._archive_region_findings)
+
+    def _archive_region_findings(self, region: str) -> int:
+        """
+        Archives the active Prowler findings of the given region that are not present in the current execution.
+
+        Args:
+            region (str): The AWS region to archive the findings from.
+
+        Returns:
+            int: Number of successfully archived findings.
+        """
+        try:
+            # Get current findings IDs
+            current_findings_ids = {
+                finding.Id for finding in self._findings_per_region[region]
+            }
+            # Get findings of that region
+            findings_filter = {
+                "ProductName": [{"Value": "Prowler", "Comparison": "EQUALS"}],
+                "RecordState": [{"Value": "ACTIVE", "Comparison": "EQUALS"}],
+                "AwsAccountId": [
+                    {"Value": self._aws_account_id, "Comparison": "EQUALS"}
+                ],
+                "Region": [{"Value": region, "Comparison": "EQUALS"}],
+            }
+            get_findings_paginator = self._enabled_regions[region].get_paginator(
+                "get_findings"
+            )
+            updated_at = timestamp_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
+            findings_to_archive = []
+            for page in get_findings_paginator.paginate(
+                Filters=findings_filter, PaginationConfig={"PageSize": 100}
+            ):
+                # Archive findings that have not appear in this execution
+                for finding in page["Findings"]:
+                    if finding["Id"] not in current_findings_ids:
+                        finding["RecordState"] = "ARCHIVED"
+                        finding["UpdatedAt"] = updated_at
+
+                        findings_to_archive.append(finding)
+            logger.info(f"Archiving {len(findings_to_archive)} findings.")
+
+            # Findings are archived once the listing is complete to not alter
+            # the ACTIVE result set while it is being paginated
+            return self._send_findings_in_batches(
+                findings_to_archive,
+                region,
+            )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
+            )
+            return 0
 
     def _send_findings_in_batches(
         self, findings: list[AWSSecurityFindingFormat], region: str
@@ -1,4 +1,6 @@
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from random import uniform
+from time import monotonic, sleep
 
 from prowler.lib.logger import logger
 from prowler.providers.aws.aws_provider import AwsProvider
@@ -10,6 +12,11 @@ from prowler.providers.aws.aws_provider import AwsProvider
 # )
 
 MAX_WORKERS = 10
+# Seconds to wait before polling again a job in progress, doubled on every poll up to the maximum
+JOBS_INITIAL_POLL_DELAY = 1
+JOBS_MAX_POLL_DELAY = 30
+# Seconds to wait for the jobs before giving up
+JOBS_TIMEOUT = 900
 
 
 class AWSService:
@@ -102,6 +109,75 @@ class AWSService:
                 # Handle exceptions if necessary
                 pass  # Replace 'pass' with any additional exception handling logic. Currently handled within the called function
 
+        # Return the results in the same order as the items, None if the call failed
+        return [
+            future.result() if not future.exception() else None for future in futures
+        ]
+
+    def __run_jobs__(self, start_job, poll_job, items) -> list:
+        """
+        Starts a job for every item and polls all of them until they complete, e.g. for the APIs that generate a report asynchronously.
+
+        The jobs are started and polled concurrently through the thread pool, each job is polled right after being started and then
+        with a jittered exponential backoff, so the jobs in progress do not consume the API quota.
+
+        Args:
+            start_job: Called with an item, returns the job to poll or None if it could not be started.
+            poll_job: Called with a job, returns a tuple (completed, result) or None if the job failed.
+            items: The items to start a job for.
+
+        Returns:
+            list: The result of the job of each item, in the same order, None if the job failed or did not complete in JOBS_TIMEOUT seconds.
+        """
+        items = list(items)
+        results = [None] * len(items)
+        jobs = self.__threading_call__(start_job, items)
+        now = monotonic()
+        deadline = now + JOBS_TIMEOUT
+        # {item index: (job, next poll time, polls)}
+        pending_jobs = {
+            index: (job, now, 0) for index, job in enumerate(jobs) if job is not None
+        }
+        while pending_jobs:
+            now = monotonic()
+            if now > deadline:
+                logger.error(
+                    f"{self.service.upper()} - {len(pending_jobs)} jobs did not complete in {JOBS_TIMEOUT} seconds"
+                )
+                break
+            due_jobs = [
+                index
+                for index, (_, next_poll, _) in pending_jobs.items()
+                if next_poll <= now
+            ]
+            if not due_jobs:
+                sleep(min(next_poll for _, next_poll, _ in pending_jobs.values()) - now)
+                continue
+            polls = self.__threading_call__(
+                poll_job, [pending_jobs[index][0] for index in due_jobs]
+            )
+            now = monotonic()
+            for index, poll in zip(due_jobs, polls):
+                job, _, polls_count = pending_jobs[index]
+                if poll is None:
+                    del pending_jobs[index]
+                    continue
+                completed, result = poll
+                if completed:
+                    results[index] = result
+                    del pending_jobs[index]
+                else:
+                    delay = min(
+                        JOBS_MAX_POLL_DELAY, JOBS_INITIAL_POLL_DELAY * 2**polls_count
+                    )
+                    # Half of the delay is random so the jobs started together are not polled together
+                    pending_jobs[index] = (
+                        job,
+                        now + delay / 2 + uniform(0, delay / 2),
+                        polls_count + 1,
+                    )
+        return results
+
     def get_unknown_arn(self, resource_type: str = None, region: str = None) -> str:
         """
         Generate an unknown ARN for the service
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.acm.acm_service import ACM
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-acm_client = ACM(Provider.get_global_provider())
+acm_client = ServiceClient(ACM)
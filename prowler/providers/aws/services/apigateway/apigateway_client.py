@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.apigateway.apigateway_service import APIGateway
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-apigateway_client = APIGateway(Provider.get_global_provider())
+apigateway_client = ServiceClient(APIGateway)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.appstream.appstream_service import AppStream
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-appstream_client = AppStream(Provider.get_global_provider())
+appstream_client = ServiceClient(AppStream)
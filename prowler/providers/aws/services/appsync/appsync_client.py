@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.appsync.appsync_service import AppSync
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-appsync_client = AppSync(Provider.get_global_provider())
+appsync_client = ServiceClient(AppSync)
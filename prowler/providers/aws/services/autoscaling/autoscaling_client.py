@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.autoscaling.autoscaling_service import AutoScaling
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-autoscaling_client = AutoScaling(Provider.get_global_provider())
+autoscaling_client = ServiceClient(AutoScaling)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.awslambda.awslambda_service import Lambda
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-awslambda_client = Lambda(Provider.get_global_provider())
+awslambda_client = ServiceClient(Lambda)
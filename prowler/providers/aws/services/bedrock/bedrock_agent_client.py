@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.bedrock.bedrock_service import BedrockAgent
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-bedrock_agent_client = BedrockAgent(Provider.get_global_provider())
+bedrock_agent_client = ServiceClient(BedrockAgent)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.bedrock.bedrock_service import Bedrock
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-bedrock_client = Bedrock(Provider.get_global_provider())
+bedrock_client = ServiceClient(Bedrock)
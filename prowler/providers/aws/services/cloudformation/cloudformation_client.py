@@ -1,6 +1,6 @@
 from prowler.providers.aws.services.cloudformation.cloudformation_service import (
     CloudFormation,
 )
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-cloudformation_client = CloudFormation(Provider.get_global_provider())
+cloudformation_client = ServiceClient(CloudFormation)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.cloudfront.cloudfront_service import CloudFront
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-cloudfront_client = CloudFront(Provider.get_global_provider())
+cloudfront_client = ServiceClient(CloudFront)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.cloudtrail.cloudtrail_service import Cloudtrail
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-cloudtrail_client = Cloudtrail(Provider.get_global_provider())
+cloudtrail_client = ServiceClient(Cloudtrail)
@@ -1,4 +1,9 @@
-from datetime import datetime, timedelta
+import json
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from threading import Lock
+from time import monotonic, sleep
 from typing import Optional
 
 from botocore.client import ClientError
@@ -7,6 +12,32 @@ from pydantic.v1 import BaseModel
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.lib.service.service import AWSService
+from prowler.providers.aws.services.cloudtrail.lib.logs import (
+    LOG_FILES_BATCH_SIZE,
+    aggregate_log_files,
+    get_local_log_files,
+)
+
+# LookupEvents is limited to 2 requests per second per account and region
+LOOKUP_EVENTS_REQUESTS_PER_SECOND = 2
+
+
+class RateLimiter:
+    """Spaces the calls made from any thread so they do not exceed the given rate."""
+
+    def __init__(self, requests_per_second: float):
+        self._interval = 1 / requests_per_second
+        self._next_call = 0.0
+        self._lock = Lock()
+
+    def wait(self):
+        """Waits until the next call is allowed."""
+        with self._lock:
+            now = monotonic()
+            wait_time = self._next_call - now
+            self._next_call = max(now, self._next_call) + self._interval
+        if wait_time > 0:
+            sleep(wait_time)
 
 
 class Cloudtrail(AWSService):
@@ -15,6 +46,10 @@ class Cloudtrail(AWSService):
         super().__init__(__class__.__name__, provider)
         self.trail_arn_template = f"arn:{self.audited_partition}:cloudtrail:{self.region}:{self.audited_account}:trail"
         self.trails = {}
+        # {(region, event name): IngestedEvents} shared by the threat detection checks
+        self._events_index = {}
+        self._events_lock = Lock()
+        self._lookup_events_rate_limiters = {}
         self.__threading_call__(self._get_trails)
         if self.trails:
             self._get_trail_status()
@@ -61,6 +96,7 @@ class Cloudtrail(AWSService):
                         log_file_validation_enabled=trail["LogFileValidationEnabled"],
                         latest_cloudwatch_delivery_time=None,
                         s3_bucket=trail["S3BucketName"],
+                        s3_key_prefix=trail.get("S3KeyPrefix"),
                         kms_key=kms_key_id,
                         log_group_arn=log_group_arn,
                         data_events=[],
@@ -192,21 +228,198 @@ class Cloudtrail(AWSService):
             )
 
     def _lookup_events(self, trail, event_name, minutes):
+        """Returns all the events with the given name in the last minutes of the trail region, LookupEvents is called at the rate allowed per region."""
         logger.info("CloudTrail - Lookup Events...")
         try:
             regional_client = self.regional_clients[trail.region]
-            response = regional_client.lookup_events(
-                LookupAttributes=[
+            rate_limiter = self._get_lookup_events_rate_limiter(trail.region)
+            events = []
+            lookup_events_arguments = {
+                "LookupAttributes": [
                     {"AttributeKey": "EventName", "AttributeValue": event_name}
                 ],
-                StartTime=datetime.now() - timedelta(minutes=minutes),
-            )
-            return response.get("Events")
+                "StartTime": datetime.now() - timedelta(minutes=minutes),
+            }
+            while True:
+                rate_limiter.wait()
+                response = regional_client.lookup_events(**lookup_events_arguments)
+                events.extend(response.get("Events", []))
+                if not response.get("NextToken"):
+                    break
+                lookup_events_arguments["NextToken"] = response["NextToken"]
+            return events
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    def _get_lookup_events_rate_limiter(self, region: str) -> "RateLimiter":
+        with self._events_lock:
+            if region not in self._lookup_events_rate_limiters:
+                self._lookup_events_rate_limiters[region] = RateLimiter(
+                    LOOKUP_EVENTS_REQUESTS_PER_SECOND
+                )
+            return self._lookup_events_rate_limiters[region]
+
+    def _ingest_events(self, events_to_ingest):
+        """Looks up the events of a name in the trail region and indexes their principals, replacing the ones ingested before."""
+        trail, event_name, minutes = events_to_ingest
+        start_time = datetime.now(timezone.utc) - timedelta(minutes=minutes)
+        events = self._lookup_events(
+            trail=trail, event_name=event_name, minutes=minutes
+        )
+        if events is None:
+            return
+        principals_events = []
+        for event in events:
+            try:
+                event_log = json.loads(event["CloudTrailEvent"])
+                # Ignore event logs without ARN since they are AWS services
+                if "arn" not in event_log["userIdentity"]:
+                    continue
+                event_time = event.get("EventTime")
+                if event_time and not event_time.tzinfo:
+                    event_time = event_time.replace(tzinfo=timezone.utc)
+                principals_events.append(
+                    (
+                        event_time,
+                        (
+                            event_log["userIdentity"]["arn"],
+                            event_log["userIdentity"]["type"],
+                        ),
+                    )
+                )
+            except Exception as error:
+                logger.error(
+                    f"{trail.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+        with self._events_lock:
+            self._events_index[(trail.region, event_name)] = IngestedEvents(
+                start_time=start_time, principals_events=principals_events
+            )
+
+    def _ingest_log_files(self, trail, event_names, minutes):
+        """Reads the events of the given names from the CloudTrail log files of the trail S3 bucket or a local directory, instead of LookupEvents."""
+        logger.info("CloudTrail - Reading Log Files...")
+        try:
+            start_time = datetime.now(timezone.utc) - timedelta(minutes=minutes)
+            if self.audit_config.get("threat_detection_logs_source") == "local":
+                log_files = get_local_log_files(
+                    self.audit_config.get("threat_detection_logs_directory", "")
+                )
+            else:
+                log_files = self._get_s3_log_files(trail, start_time)
+            principals_events = {event_name: [] for event_name in event_names}
+            for (
+                principal_arn,
+                principal_type,
+                event_name,
+            ), event_time in aggregate_log_files(
+                log_files,
+                event_names,
+                start_time,
+                processes=self.audit_config.get("threat_detection_logs_processes"),
+            ).items():
+                principals_events[event_name].append(
+                    (event_time, (principal_arn, principal_type))
+                )
+            with self._events_lock:
+                for event_name, events in principals_events.items():
+                    self._events_index[(trail.region, event_name)] = IngestedEvents(
+                        start_time=start_time, principals_events=events
+                    )
+        except Exception as error:
+            logger.error(
+                f"{trail.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def _get_s3_log_files(self, trail, start_time):
+        """Yields the content of the trail log files delivered since the start time, downloaded in batches through the thread pool."""
+        s3_client = self.session.client("s3", trail.home_region or trail.region)
+        log_files_prefix = f"{trail.s3_key_prefix + '/' if trail.s3_key_prefix else ''}AWSLogs/{self.audited_account}/CloudTrail/"
+        if trail.is_multiregion:
+            regions = [
+                common_prefix["Prefix"][len(log_files_prefix) :].strip("/")
+                for page in s3_client.get_paginator("list_objects_v2").paginate(
+                    Bucket=trail.s3_bucket, Prefix=log_files_prefix, Delimiter="/"
+                )
+                for common_prefix in page.get("CommonPrefixes", [])
+            ]
+        else:
+            regions = [trail.region]
+
+        log_files = (
+            (s3_client, trail.s3_bucket, log_file["Key"])
+            for region in regions
+            for day in range(
+                (datetime.now(timezone.utc).date() - start_time.date()).days + 1
+            )
+            for page in s3_client.get_paginator("list_objects_v2").paginate(
+                Bucket=trail.s3_bucket,
+                Prefix=f"{log_files_prefix}{region}/{(start_time + timedelta(days=day)):%Y/%m/%d}/",
+            )
+            for log_file in page.get("Contents", [])
+        )
+        while batch := list(islice(log_files, LOG_FILES_BATCH_SIZE)):
+            for content in self.__threading_call__(self._get_s3_log_file, batch):
+                if content:
+                    yield content
+
+    def _get_s3_log_file(self, log_file) -> bytes:
+        s3_client, bucket, key = log_file
+        try:
+            return s3_client.get_object(Bucket=bucket, Key=key)["Body"].read()
+        except Exception as error:
+            logger.error(
+                f"{bucket}/{key} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def _get_principals_events(self, trail, event_names, minutes) -> dict:
+        """
+        Returns the principals that made any of the events in the last minutes of the trail region.
+
+        Each event name is looked up once per region, the events are indexed by principal and shared by all the threat detection checks.
+        The event names not ingested yet, or ingested for a shorter time window, are looked up concurrently,
+        or read from the trail log files if threat_detection_logs_source is s3 or local.
+
+        Args:
+            trail (Trail): The trail whose region is looked up.
+            event_names (list): The names of the events.
+            minutes (int): The time window of the events.
+
+        Returns:
+            dict: {(principal arn, principal type): set(event names)}
+        """
+        start_time = datetime.now(timezone.utc) - timedelta(minutes=minutes)
+        event_names = set(event_names)
+        events_to_ingest = []
+        for event_name in event_names:
+            ingested_events = self._events_index.get((trail.region, event_name))
+            # The time window ingested must include the requested one
+            if not ingested_events or ingested_events.start_time > start_time:
+                events_to_ingest.append((trail, event_name, minutes))
+        if events_to_ingest:
+            if self.audit_config.get(
+                "threat_detection_logs_source", "lookup_events"
+            ) in ("s3", "local"):
+                self._ingest_log_files(
+                    trail,
+                    [event_name for _, event_name, _ in events_to_ingest],
+                    minutes,
+                )
+            else:
+                self.__threading_call__(self._ingest_events, events_to_ingest)
+
+        principals_events = {}
+        for event_name in event_names:
+            ingested_events = self._events_index.get((trail.region, event_name))
+            if not ingested_events:
+                continue
+            for event_time, principal in ingested_events.principals_events:
+                if event_time is None or event_time >= start_time:
+                    principals_events.setdefault(principal, set()).add(event_name)
+        return principals_events
+
     def _list_tags_for_resource(self):
         logger.info("CloudTrail - List Tags...")
         try:
@@ -248,8 +461,17 @@ class Trail(BaseModel):
     log_file_validation_enabled: bool = None
     latest_cloudwatch_delivery_time: datetime = None
     s3_bucket: str = None
+    s3_key_prefix: str = None
     kms_key: str = None
     log_group_arn: str = None
     data_events: list[Event_Selector] = []
     tags: Optional[list] = []
     has_insight_selectors: str = None
+
+
+@dataclass
+class IngestedEvents:
+    # Start of the time window looked up
+    start_time: datetime
+    # [(event time, (principal arn, principal type))]
+    principals_events: list[tuple]
@@ -0,0 +1,138 @@
+import gzip
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from itertools import islice, repeat
+from typing import Iterable, Union
+
+from prowler.lib.logger import logger
+
+try:
+    # orjson parses the CloudTrail log files several times faster, it is optional
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+# Number of log files sent to the process pool at once, so only a batch of files is in memory
+LOG_FILES_BATCH_SIZE = 64
+
+
+def get_local_log_files(directory: str) -> list[str]:
+    """
+    Returns the CloudTrail log files of a directory and its subdirectories, as delivered to S3 (.json.gz) or decompressed (.json).
+
+    Args:
+        directory (str): The directory with the CloudTrail log files.
+
+    Returns:
+        list[str]: The paths of the log files, sorted.
+    """
+    log_files = []
+    for root, _, files in os.walk(directory):
+        for file in files:
+            if file.endswith(".json.gz") or file.endswith(".json"):
+                log_files.append(os.path.join(root, file))
+    return sorted(log_files)
+
+
+def parse_event_time(event_time: str) -> datetime:
+    """Parses the eventTime of a CloudTrail record, e.g. 2023-07-19T21:11:57Z."""
+    return datetime.fromisoformat(event_time.replace("Z", "+00:00"))
+
+
+def aggregate_log_file(
+    log_file: Union[str, bytes], event_names: frozenset, start_time: datetime
+) -> dict:
+    """
+    Aggregates the events with the given names since the start time of a CloudTrail log file.
+
+    Args:
+        log_file (str | bytes): The path of the log file or its content, gzip compressed or not.
+        event_names (frozenset): The names of the events.
+        start_time (datetime): The start of the time window, timezone aware.
+
+    Returns:
+        dict: {(principal arn, principal type, event name): latest event time}, the events without principal ARN are AWS services and ignored.
+    """
+    principals_events = {}
+    try:
+        if isinstance(log_file, bytes):
+            content = log_file
+        elif log_file.endswith(".gz"):
+            with gzip.open(log_file, "rb") as file:
+                content = file.read()
+        else:
+            with open(log_file, "rb") as file:
+                content = file.read()
+        if content[:2] == b"\x1f\x8b":
+            content = gzip.decompress(content)
+
+        for record in loads(content).get("Records", []):
+            event_name = record.get("eventName")
+            if event_name not in event_names:
+                continue
+            user_identity = record.get("userIdentity") or {}
+            if "arn" not in user_identity:
+                continue
+            event_time = parse_event_time(record["eventTime"])
+            if event_time < start_time:
+                continue
+            principal_event = (
+                user_identity["arn"],
+                user_identity.get("type"),
+                event_name,
+            )
+            if principals_events.get(principal_event, start_time) <= event_time:
+                principals_events[principal_event] = event_time
+    except Exception as error:
+        logger.error(
+            f"{log_file if isinstance(log_file, str) else 'S3 log file'} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+    return principals_events
+
+
+def aggregate_log_files(
+    log_files: Iterable[Union[str, bytes]],
+    event_names: Iterable[str],
+    start_time: datetime,
+    processes: int = None,
+) -> dict:
+    """
+    Aggregates the events with the given names since the start time of many CloudTrail log files, parsed in parallel by a process pool.
+
+    The files are read in batches and only the latest time of each principal event is kept, so the memory does not grow with the number of events.
+
+    Args:
+        log_files (Iterable[str | bytes]): The paths or contents of the log files, it can be a generator.
+        event_names (Iterable[str]): The names of the events.
+        start_time (datetime): The start of the time window.
+        processes (int): The number of processes, by default the number of CPUs. With 1 the files are parsed in this process.
+
+    Returns:
+        dict: {(principal arn, principal type, event name): latest event time}
+    """
+    event_names = frozenset(event_names)
+    if not start_time.tzinfo:
+        start_time = start_time.replace(tzinfo=timezone.utc)
+    principals_events = {}
+    log_files = iter(log_files)
+    executor = ProcessPoolExecutor(max_workers=processes) if processes != 1 else None
+    try:
+        while batch := list(islice(log_files, LOG_FILES_BATCH_SIZE)):
+            if executor:
+                results = executor.map(
+                    aggregate_log_file, batch, repeat(event_names), repeat(start_time)
+                )
+            else:
+                results = (
+                    aggregate_log_file(log_file, event_names, start_time)
+                    for log_file in batch
+                )
+            for file_principals_events in results:
+                for principal_event, event_time in file_principals_events.items():
+                    if principals_events.get(principal_event, start_time) <= event_time:
+                        principals_events[principal_event] = event_time
+    finally:
+        if executor:
+            executor.shutdown()
+    return principals_events
@@ -1,7 +1,8 @@
 from json import dumps, loads
 
 from prowler.lib.check.models import Check, Check_Report_AWS
-from prowler.lib.utils.utils import detect_secrets_scan
+from prowler.lib.utils.secrets_scanner import get_secrets_scanner
+from prowler.lib.utils.utils import default_detect_secrets_plugins
 from prowler.providers.aws.services.cloudwatch.cloudwatch_service import (
     convert_to_cloudwatch_timestamp_format,
 )
@@ -15,7 +16,39 @@ class cloudwatch_log_group_no_secrets_in_logs(Check):
             secrets_ignore_patterns = logs_client.audit_config.get(
                 "secrets_ignore_patterns", []
             )
-            for log_group in logs_client.log_groups.values():
+            detect_secrets_plugins = (
+                logs_client.audit_config.get("detect_secrets_plugins")
+                or default_detect_secrets_plugins
+            )
+            secrets_scanner = get_secrets_scanner(
+                detect_secrets_plugins, secrets_ignore_patterns
+            )
+            event_secrets_scanner = get_secrets_scanner(detect_secrets_plugins)
+            # All the log streams are scanned at once so big accounts are scanned in parallel
+            log_streams = [
+                (log_group_key, log_stream_name)
+                for log_group_key, log_group in logs_client.log_groups.items()
+                for log_stream_name in log_group.log_streams or {}
+            ]
+            log_streams_secrets_output = dict(
+                zip(
+                    log_streams,
+                    secrets_scanner.scan_many(
+                        [
+                            "\n".join(
+                                [
+                                    dumps(event["message"])
+                                    for event in logs_client.log_groups[
+                                        log_group_key
+                                    ].log_streams[log_stream_name]
+                                ]
+                            )
+                            for log_group_key, log_stream_name in log_streams
+                        ]
+                    ),
+                )
+            )
+            for log_group_key, log_group in logs_client.log_groups.items():
                 report = Check_Report_AWS(metadata=self.metadata(), resource=log_group)
                 report.status = "PASS"
                 report.status_extended = (
@@ -25,19 +58,9 @@ class cloudwatch_log_group_no_secrets_in_logs(Check):
                 if log_group.log_streams:
                     for log_stream_name in log_group.log_streams:
                         log_stream_secrets = {}
-                        log_stream_data = "\n".join(
-                            [
-                                dumps(event["message"])
-                                for event in log_group.log_streams[log_stream_name]
-                            ]
-                        )
-                        log_stream_secrets_output = detect_secrets_scan(
-                            data=log_stream_data,
-                            excluded_secrets=secrets_ignore_patterns,
-                            detect_secrets_plugins=logs_client.audit_config.get(
-                                "detect_secrets_plugins",
-                            ),
-                        )
+                        log_stream_secrets_output = log_streams_secrets_output[
+                            (log_group_key, log_stream_name)
+                        ]
 
                         if log_stream_secrets_output:
                             for secret in log_stream_secrets_output:
@@ -68,11 +91,8 @@ class cloudwatch_log_group_no_secrets_in_logs(Check):
                                 if len(log_event_data.split("\n")) > 1:
                                     # Can get more informative output if there is more than 1 line.
                                     # Will rescan just this event to get the type of secret and the line number
-                                    event_detect_secrets_output = detect_secrets_scan(
-                                        data=log_event_data,
-                                        detect_secrets_plugins=logs_client.audit_config.get(
-                                            "detect_secrets_plugins"
-                                        ),
+                                    event_detect_secrets_output = (
+                                        event_secrets_scanner.scan(log_event_data)
                                     )
                                     if event_detect_secrets_output:
                                         for secret in event_detect_secrets_output:
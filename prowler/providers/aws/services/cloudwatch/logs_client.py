@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.cloudwatch.cloudwatch_service import Logs
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-logs_client = Logs(Provider.get_global_provider())
+logs_client = ServiceClient(Logs)
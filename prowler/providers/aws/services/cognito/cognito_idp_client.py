@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.cognito.cognito_service import CognitoIDP
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-cognito_idp_client = CognitoIDP(Provider.get_global_provider())
+cognito_idp_client = ServiceClient(CognitoIDP)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.datasync.datasync_service import DataSync
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-datasync_client = DataSync(Provider.get_global_provider())
+datasync_client = ServiceClient(DataSync)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.documentdb.documentdb_service import DocumentDB
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-documentdb_client = DocumentDB(Provider.get_global_provider())
+documentdb_client = ServiceClient(DocumentDB)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.ec2.ec2_service import EC2
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-ec2_client = EC2(Provider.get_global_provider())
+ec2_client = ServiceClient(EC2)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.efs.efs_service import EFS
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-efs_client = EFS(Provider.get_global_provider())
+efs_client = ServiceClient(EFS)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.elasticache.elasticache_service import ElastiCache
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-elasticache_client = ElastiCache(Provider.get_global_provider())
+elasticache_client = ServiceClient(ElastiCache)
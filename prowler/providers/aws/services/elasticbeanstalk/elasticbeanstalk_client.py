@@ -1,6 +1,6 @@
 from prowler.providers.aws.services.elasticbeanstalk.elasticbeanstalk_service import (
     ElasticBeanstalk,
 )
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-elasticbeanstalk_client = ElasticBeanstalk(Provider.get_global_provider())
+elasticbeanstalk_client = ServiceClient(ElasticBeanstalk)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.elb.elb_service import ELB
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-elb_client = ELB(Provider.get_global_provider())
+elb_client = ServiceClient(ELB)
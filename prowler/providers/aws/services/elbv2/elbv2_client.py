@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.elbv2.elbv2_service import ELBv2
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-elbv2_client = ELBv2(Provider.get_global_provider())
+elbv2_client = ServiceClient(ELBv2)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.glacier.glacier_service import Glacier
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-glacier_client = Glacier(Provider.get_global_provider())
+glacier_client = ServiceClient(Glacier)
@@ -1,6 +1,6 @@
 from prowler.providers.aws.services.globalaccelerator.globalaccelerator_service import (
     GlobalAccelerator,
 )
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-globalaccelerator_client = GlobalAccelerator(Provider.get_global_provider())
+globalaccelerator_client = ServiceClient(GlobalAccelerator)
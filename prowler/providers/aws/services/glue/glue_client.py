@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.glue.glue_service import Glue
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-glue_client = Glue(Provider.get_global_provider())
+glue_client = ServiceClient(Glue)
@@ -1,4 +1,5 @@
 import csv
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from typing import Optional
 
@@ -10,6 +11,9 @@ from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.lib.service.service import AWSService
 
+# Number of IAM collection branches running at the same time, their calls share the service thread pool
+IAM_COLLECTION_BRANCHES = 8
+
 
 def is_service_role(role):
     try:
@@ -46,18 +50,165 @@ class IAM(AWSService):
         self.mfa_arn_template = (
             f"arn:{self.audited_partition}:iam::{self.audited_account}:mfa"
         )
+        self.users = []
+        self.roles = []
+        self.groups = []
+        self.account_summary = None
+        self.virtual_mfa_devices = []
+        self.credential_report = []
+        self.password_policy = None
+        self.entities_role_attached_to_support_policy = None
+        self.entities_role_attached_to_securityaudit_policy = None
+        self.entities_attached_to_cloudshell_policy = None
+        # List both Customer (attached and unattached) and AWS Managed (only attached) policies
+        self.policies = []
+        self.saml_providers = {}
+        self.server_certificates = []
+        self.access_keys_metadata = {}
+        self.last_accessed_services = {}
+        self.user_temporary_credentials_usage = {}
+        self.organization_features = []
+        # Inline policies of each kind of entity, they are added to the policies once collected
+        self._inline_policies = {"users": [], "groups": [], "roles": []}
+
+        # The branches that do not depend on each other are collected in parallel,
+        # the calls for each user, group, role and policy are made through the thread pool
+        self._run_collection_graph(
+            {
+                "users": (self._collect_users, ()),
+                "user_details": (self._collect_user_details, ("users",)),
+                "roles": (self._collect_roles, ()),
+                "role_details": (self._collect_role_details, ("roles",)),
+                "groups": (self._collect_groups, ()),
+                "group_details": (self._collect_group_details, ("groups",)),
+                "policies": (self._collect_policies, ()),
+                "account_summary": (self._collect_account_summary, ()),
+                "virtual_mfa_devices": (self._collect_virtual_mfa_devices, ()),
+                "credential_report": (self._collect_credential_report, ()),
+                "password_policy": (self._collect_password_policy, ()),
+                "policy_entities": (self._collect_policy_entities, ()),
+                "saml_providers": (self._collect_saml_providers, ()),
+                "server_certificates": (self._collect_server_certificates, ()),
+                "organization_features": (self._list_organizations_features, ()),
+            }
+        )
+        # Keep the same order of the policies regardless of which branch finished first
+        self.policies.extend(self._inline_policies["users"])
+        self.policies.extend(self._inline_policies["groups"])
+        self.policies.extend(self._inline_policies["roles"])
+        del self._inline_policies
+
+    def _run_collection_graph(self, graph: dict) -> None:
+        """
+        Runs the collection branches of the service, each one as soon as the branches it depends on are finished.
+
+        Args:
+            graph (dict): {name: (call, (dependencies names))}, the call receives no arguments.
+
+        The branches run in their own threads, so they can fan out their calls through the thread pool without waiting for each other.
+        """
+        pending = dict(graph)
+        finished = set()
+        running = {}
+        with ThreadPoolExecutor(
+            max_workers=IAM_COLLECTION_BRANCHES
+        ) as branches_executor:
+            while pending or running:
+                for name, (call, dependencies) in list(pending.items()):
+                    if all(dependency in finished for dependency in dependencies):
+                        running[branches_executor.submit(call)] = name
+                        del pending[name]
+                if not running:
+                    # The remaining branches depend on branches that failed
+                    logger.error(
+                        f"IAM - Skipping collection branches {', '.join(pending)}, they depend on failed branches"
+                    )
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    error = future.exception()
+                    if error:
+                        logger.error(
+                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                        )
+                    else:
+                        finished.add(name)
+
+    def _collect_users(self):
         self.users = self._get_users()
+
+    def _collect_user_details(self):
+        self.__threading_call__(self._list_mfa_devices, self.users)
+        self.__threading_call__(self._list_attached_user_policies, self.users)
+        self._inline_policies["users"] = [
+            policy
+            for user_policies in self.__threading_call__(
+                self._list_inline_user_policies, self.users
+            )
+            if user_policies
+            for policy in user_policies
+        ]
+        self.access_keys_metadata = {(user.name, user.arn): [] for user in self.users}
+        self.__threading_call__(self._get_access_keys_metadata, self.users)
+        self._get_last_accessed_services()
+        self._get_user_temporary_credentials_usage()
+        self.__threading_call__(self._list_tags, self.users)
+
+    def _collect_roles(self):
         self.roles = self._get_roles()
+
+    def _collect_role_details(self):
+        if self.roles:
+            self.__threading_call__(self._list_attached_role_policies, self.roles)
+            self._inline_policies["roles"] = [
+                policy
+                for role_policies in self.__threading_call__(
+                    self._list_inline_role_policies, self.roles
+                )
+                if role_policies
+                for policy in role_policies
+            ]
+            self.__threading_call__(self._list_tags, self.roles)
+
+    def _collect_groups(self):
+        self.groups = self._get_groups()
+
+    def _collect_group_details(self):
+        self.__threading_call__(self._get_group_users, self.groups)
+        self.__threading_call__(self._list_attached_group_policies, self.groups)
+        self._inline_policies["groups"] = [
+            policy
+            for group_policies in self.__threading_call__(
+                self._list_inline_group_policies, self.groups
+            )
+            if group_policies
+            for policy in group_policies
+        ]
+
+    def _collect_policies(self):
+        policies = self._list_policies("AWS")
+        policies.extend(self._list_policies("Local"))
+        self.__threading_call__(self._list_policies_version, policies)
+        self.__threading_call__(
+            self._list_tags,
+            [policy for policy in policies if policy.type == "Custom"],
+        )
+        self.policies = policies
+
+    def _collect_account_summary(self):
         self.account_summary = self._get_account_summary()
+
+    def _collect_virtual_mfa_devices(self):
         self.virtual_mfa_devices = self._list_virtual_mfa_devices()
+
+    def _collect_credential_report(self):
         self.credential_report = self._get_credential_report()
-        self.groups = self._get_groups()
-        self._get_group_users()
-        self._list_attached_group_policies()
-        self._list_attached_user_policies()
-        self._list_attached_role_policies()
-        self._list_mfa_devices()
+
+    def _collect_password_policy(self):
         self.password_policy = self._get_password_policy()
+
+    def _collect_policy_entities(self):
         support_policy_arn = (
             f"arn:{self.audited_partition}:iam::aws:policy/AWSSupportAccess"
         )
@@ -76,35 +227,16 @@ class IAM(AWSService):
         self.entities_attached_to_cloudshell_policy = self._list_entities_for_policy(
             cloudshell_admin_policy_arn
         )
-        # List both Customer (attached and unattached) and AWS Managed (only attached) policies
-        self.policies = []
-        self.policies.extend(self._list_policies("AWS"))
-        self.policies.extend(self._list_policies("Local"))
-        self._list_policies_version(self.policies)
-        self._list_inline_user_policies()
-        self._list_inline_group_policies()
-        self._list_inline_role_policies()
+
+    def _collect_saml_providers(self):
         self.saml_providers = self._list_saml_providers()
-        self.server_certificates = self._list_server_certificates()
-        self.access_keys_metadata = {}
-        self._get_access_keys_metadata()
-        self.last_accessed_services = {}
-        self._get_last_accessed_services()
-        self.user_temporary_credentials_usage = {}
-        self._get_user_temporary_credentials_usage()
-        self.organization_features = []
-        self._list_organizations_features()
-        # List missing tags
-        self.__threading_call__(self._list_tags, self.users)
-        self.__threading_call__(self._list_tags, self.roles)
-        self.__threading_call__(
-            self._list_tags,
-            [policy for policy in self.policies if policy.type == "Custom"],
-        )
-        self.__threading_call__(self._list_tags, self.server_certificates)
         if self.saml_providers is not None:
             self.__threading_call__(self._list_tags, self.saml_providers.values())
 
+    def _collect_server_certificates(self):
+        self.server_certificates = self._list_server_certificates()
+        self.__threading_call__(self._list_tags, self.server_certificates)
+
     def _get_client(self):
         return self.client
 
@@ -145,21 +277,33 @@ class IAM(AWSService):
 
     def _get_credential_report(self):
         logger.info("IAM - Get Credential Report...")
-        report_is_completed = False
         credential_list = []
         try:
-            while not report_is_completed:
-                report_status = self.client.generate_credential_report()
-                if report_status["State"] == "COMPLETE":
-                    report_is_completed = True
-            # Convert credential report to list of dictionaries
-            credential = self.client.get_credential_report()["Content"].decode(
-                encoding_format_utf_8
+            report_is_completed = self.__run_jobs__(
+                self._generate_credential_report,
+                self._get_credential_report_state,
+                [self.audited_account],
+            )[0]
+            if report_is_completed:
+                # Convert credential report to list of dictionaries
+                credential = self.client.get_credential_report()["Content"].decode(
+                    encoding_format_utf_8
+                )
+                credential_lines = credential.split("\n")
+                csv_reader = csv.DictReader(credential_lines, delimiter=",")
+                credential_list = list(csv_reader)
+
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
-            credential_lines = credential.split("\n")
-            csv_reader = csv.DictReader(credential_lines, delimiter=",")
-            credential_list = list(csv_reader)
+        finally:
+            return credential_list
 
+    def _generate_credential_report(self, _account=None):
+        """Starts the generation of the credential report, or checks its progress, returning its state."""
+        try:
+            return self.client.generate_credential_report()["State"]
         except ClientError as error:
             if error.response["Error"]["Code"] == "LimitExceededException":
                 logger.warning(
@@ -173,8 +317,13 @@ class IAM(AWSService):
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
-        finally:
-            return credential_list
+
+    def _get_credential_report_state(self, state):
+        if state != "COMPLETE":
+            state = self._generate_credential_report()
+            if state is None:
+                return None
+        return state == "COMPLETE", True
 
     def _get_groups(self):
         logger.info("IAM - Get Groups...")
@@ -285,26 +434,15 @@ class IAM(AWSService):
                     if not self.audit_resources or (
                         is_resource_filtered(user["Arn"], self.audit_resources)
                     ):
-                        try:
-                            user_login_profile = self.client.get_login_profile(
-                                UserName=user["UserName"]
-                            )
-                        except self.client.exceptions.NoSuchEntityException:
-                            user_login_profile = None
-                        except Exception as error:
-                            user_login_profile = None
-                            logger.error(
-                                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                            )
-
                         users.append(
                             User(
                                 name=user["UserName"],
                                 arn=user["Arn"],
                                 password_last_used=user.get("PasswordLastUsed", None),
-                                console_access=True if user_login_profile else False,
+                                console_access=False,
                             )
                         )
+            self.__threading_call__(self._get_login_profile, users)
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -312,6 +450,17 @@ class IAM(AWSService):
         finally:
             return users
 
+    def _get_login_profile(self, user):
+        try:
+            self.client.get_login_profile(UserName=user.name)
+            user.console_access = True
+        except self.client.exceptions.NoSuchEntityException:
+            user.console_access = False
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
     def _list_virtual_mfa_devices(self):
         logger.info("IAM - List Virtual MFA Devices...")
         try:
@@ -330,151 +479,162 @@ class IAM(AWSService):
         finally:
             return mfa_devices
 
-    def _list_attached_group_policies(self):
+    def _list_attached_group_policies(self, group):
         logger.info("IAM - List Attached Group Policies...")
         try:
-            for group in self.groups:
-                try:
-                    list_attached_group_policies_paginator = self.client.get_paginator(
-                        "list_attached_group_policies"
-                    )
-                    attached_group_policies = []
-                    for page in list_attached_group_policies_paginator.paginate(
-                        GroupName=group.name
-                    ):
-                        for attached_group_policy in page["AttachedPolicies"]:
-                            attached_group_policies.append(attached_group_policy)
+            list_attached_group_policies_paginator = self.client.get_paginator(
+                "list_attached_group_policies"
+            )
+            attached_group_policies = []
+            for page in list_attached_group_policies_paginator.paginate(
+                GroupName=group.name
+            ):
+                for attached_group_policy in page["AttachedPolicies"]:
+                    attached_group_policies.append(attached_group_policy)
 
-                    group.attached_policies = attached_group_policies
-                except Exception as error:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
+            group.attached_policies = attached_group_policies
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def _get_group_users(self):
+    def _get_group_users(self, group):
         logger.info("IAM - Get Group Users...")
         try:
-            for group in self.groups:
-                get_group_paginator = self.client.get_paginator("get_group")
-                group_users = []
-                for page in get_group_paginator.paginate(GroupName=group.name):
-                    for user in page["Users"]:
-                        if "PasswordLastUsed" not in user:
-                            group_users.append(
-                                User(name=user["UserName"], arn=user["Arn"])
-                            )
-                        else:
-                            group_users.append(
-                                User(
-                                    name=user["UserName"],
-                                    arn=user["Arn"],
-                                    password_last_used=user["PasswordLastUsed"],
-                                )
+            get_group_paginator = self.client.get_paginator("get_group")
+            group_users = []
+            for page in get_group_paginator.paginate(GroupName=group.name):
+                for user in page["Users"]:
+                    if "PasswordLastUsed" not in user:
+                        group_users.append(User(name=user["UserName"], arn=user["Arn"]))
+                    else:
+                        group_users.append(
+                            User(
+                                name=user["UserName"],
+                                arn=user["Arn"],
+                                password_last_used=user["PasswordLastUsed"],
                             )
-                group.users = group_users
+                        )
+            group.users = group_users
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def _list_mfa_devices(self):
+    def _list_mfa_devices(self, user):
         logger.info("IAM - List MFA Devices...")
         try:
-            for user in self.users:
-                try:
-                    list_mfa_devices_paginator = self.client.get_paginator(
-                        "list_mfa_devices"
-                    )
-                    mfa_devices = []
-                    for page in list_mfa_devices_paginator.paginate(UserName=user.name):
-                        for mfa_device in page["MFADevices"]:
-                            mfa_serial_number = mfa_device["SerialNumber"]
-                            try:
-                                mfa_type = mfa_serial_number.split(":")[5].split("/")[0]
-                            except IndexError:
-                                mfa_type = "hardware"
-                            mfa_devices.append(
-                                MFADevice(
-                                    serial_number=mfa_serial_number, type=mfa_type
-                                )
-                            )
-                    user.mfa_devices = mfa_devices
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntity":
-                        logger.warning(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                    else:
-                        logger.error(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-
-                except Exception as error:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            list_mfa_devices_paginator = self.client.get_paginator("list_mfa_devices")
+            mfa_devices = []
+            for page in list_mfa_devices_paginator.paginate(UserName=user.name):
+                for mfa_device in page["MFADevices"]:
+                    mfa_serial_number = mfa_device["SerialNumber"]
+                    try:
+                        mfa_type = mfa_serial_number.split(":")[5].split("/")[0]
+                    except IndexError:
+                        mfa_type = "hardware"
+                    mfa_devices.append(
+                        MFADevice(serial_number=mfa_serial_number, type=mfa_type)
                     )
+            user.mfa_devices = mfa_devices
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def _list_attached_user_policies(self):
+    def _list_attached_user_policies(self, user):
         logger.info("IAM - List Attached User Policies...")
         try:
-            for user in self.users:
-                try:
-                    attached_user_policies = []
-                    get_user_attached_policies_paginator = self.client.get_paginator(
-                        "list_attached_user_policies"
-                    )
-                    for page in get_user_attached_policies_paginator.paginate(
-                        UserName=user.name
-                    ):
-                        for policy in page["AttachedPolicies"]:
-                            attached_user_policies.append(policy)
+            attached_user_policies = []
+            get_user_attached_policies_paginator = self.client.get_paginator(
+                "list_attached_user_policies"
+            )
+            for page in get_user_attached_policies_paginator.paginate(
+                UserName=user.name
+            ):
+                for policy in page["AttachedPolicies"]:
+                    attached_user_policies.append(policy)
 
-                    user.attached_policies = attached_user_policies
+            user.attached_policies = attached_user_policies
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntity":
-                        logger.warning(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                    else:
-                        logger.error(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
+    def _list_attached_role_policies(self, role):
+        logger.info("IAM - List Attached Role Policies...")
+        try:
+            attached_role_policies = []
+            list_attached_role_policies_paginator = self.client.get_paginator(
+                "list_attached_role_policies"
+            )
+            for page in list_attached_role_policies_paginator.paginate(
+                RoleName=role.name
+            ):
+                for policy in page["AttachedPolicies"]:
+                    attached_role_policies.append(policy)
 
-                except Exception as error:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
+            role.attached_policies = attached_role_policies
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def _list_attached_role_policies(self):
-        logger.info("IAM - List Attached Role Policies...")
+    def _list_inline_user_policies(self, user):
+        """Lists the inline policies of the user, returns them so they are added to the policies."""
+        logger.info("IAM - List Inline User Policies...")
+        policies = []
         try:
-            if self.roles:
-                for role in self.roles:
+            inline_user_policies = []
+            get_user_inline_policies_paginator = self.client.get_paginator(
+                "list_user_policies"
+            )
+            for page in get_user_inline_policies_paginator.paginate(UserName=user.name):
+                for policy in page["PolicyNames"]:
                     try:
-                        attached_role_policies = []
-                        list_attached_role_policies_paginator = (
-                            self.client.get_paginator("list_attached_role_policies")
+                        inline_user_policies.append(policy)
+                        # Get inline policies & their policy documents here
+                        inline_policy = self.client.get_user_policy(
+                            UserName=user.name, PolicyName=policy
+                        )
+                        policies.append(
+                            Policy(
+                                name=policy,
+                                arn=user.arn,
+                                entity=user.name,
+                                type="Inline",
+                                attached=True,
+                                version_id="v1",
+                                document=inline_policy["PolicyDocument"],
+                            )
                         )
-                        for page in list_attached_role_policies_paginator.paginate(
-                            RoleName=role.name
-                        ):
-                            for policy in page["AttachedPolicies"]:
-                                attached_role_policies.append(policy)
-
-                        role.attached_policies = attached_role_policies
                     except ClientError as error:
                         if error.response["Error"]["Code"] == "NoSuchEntity":
                             logger.warning(
@@ -484,197 +644,144 @@ class IAM(AWSService):
                             logger.error(
                                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                             )
-
                     except Exception as error:
                         logger.error(
                             f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                         )
-
+            user.inline_policies = inline_user_policies
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def _list_inline_user_policies(self):
-        logger.info("IAM - List Inline User Policies...")
-        for user in self.users:
-            try:
-                inline_user_policies = []
-                get_user_inline_policies_paginator = self.client.get_paginator(
-                    "list_user_policies"
-                )
-                for page in get_user_inline_policies_paginator.paginate(
-                    UserName=user.name
-                ):
-                    for policy in page["PolicyNames"]:
-                        try:
-                            inline_user_policies.append(policy)
-                            # Get inline policies & their policy documents here
-                            inline_policy = self.client.get_user_policy(
-                                UserName=user.name, PolicyName=policy
+        return policies
+
+    def _list_inline_group_policies(self, group):
+        """Lists the inline policies of the group, returns them so they are added to the policies."""
+        logger.info("IAM - List Inline Group Policies...")
+        policies = []
+        try:
+            inline_group_policies = []
+            get_group_inline_policies_paginator = self.client.get_paginator(
+                "list_group_policies"
+            )
+            for page in get_group_inline_policies_paginator.paginate(
+                GroupName=group.name
+            ):
+                for policy in page["PolicyNames"]:
+                    try:
+                        inline_group_policies.append(policy)
+                        # Get inline policies & their policy documents here
+                        inline_policy = self.client.get_group_policy(
+                            GroupName=group.name, PolicyName=policy
+                        )
+                        policies.append(
+                            Policy(
+                                name=policy,
+                                arn=group.arn,
+                                entity=group.name,
+                                type="Inline",
+                                attached=True,
+                                version_id="v1",
+                                document=inline_policy["PolicyDocument"],
                             )
-                            inline_user_policy_doc = inline_policy["PolicyDocument"]
-                            self.policies.append(
-                                Policy(
-                                    name=policy,
-                                    arn=user.arn,
-                                    entity=user.name,
-                                    type="Inline",
-                                    attached=True,
-                                    version_id="v1",
-                                    document=inline_user_policy_doc,
-                                )
+                        )
+                    except ClientError as error:
+                        if error.response["Error"]["Code"] == "NoSuchEntity":
+                            logger.warning(
+                                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                             )
-                        except ClientError as error:
-                            if error.response["Error"]["Code"] == "NoSuchEntity":
-                                logger.warning(
-                                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                                )
-                            else:
-                                logger.error(
-                                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                                )
-                        except Exception as error:
+                        else:
                             logger.error(
                                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                             )
-                user.inline_policies = inline_user_policies
-            except ClientError as error:
-                if error.response["Error"]["Code"] == "NoSuchEntity":
-                    logger.warning(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
-                else:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
-            except Exception as error:
+                    except Exception as error:
+                        logger.error(
+                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                        )
+            group.inline_policies = inline_group_policies
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
                 logger.error(
                     f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
-    def _list_inline_group_policies(self):
-        logger.info("IAM - List Inline Group Policies...")
-        for group in self.groups:
-            try:
-                inline_group_policies = []
-                get_group_inline_policies_paginator = self.client.get_paginator(
-                    "list_group_policies"
-                )
-                for page in get_group_inline_policies_paginator.paginate(
-                    GroupName=group.name
-                ):
-                    for policy in page["PolicyNames"]:
-                        try:
-                            inline_group_policies.append(policy)
-                            # Get inline policies & their policy documents here:
-                            inline_policy = self.client.get_group_policy(
-                                GroupName=group.name, PolicyName=policy
+        return policies
+
+    def _list_inline_role_policies(self, role):
+        """Lists the inline policies of the role, returns them so they are added to the policies."""
+        logger.info("IAM - List Inline Role Policies...")
+        policies = []
+        try:
+            inline_role_policies = []
+            get_role_inline_policies_paginator = self.client.get_paginator(
+                "list_role_policies"
+            )
+            for page in get_role_inline_policies_paginator.paginate(RoleName=role.name):
+                for policy in page["PolicyNames"]:
+                    try:
+                        inline_role_policies.append(policy)
+                        # Get inline policies & their policy documents here
+                        inline_policy = self.client.get_role_policy(
+                            RoleName=role.name, PolicyName=policy
+                        )
+                        policies.append(
+                            Policy(
+                                name=policy,
+                                arn=role.arn,
+                                entity=role.name,
+                                type="Inline",
+                                attached=True,
+                                version_id="v1",
+                                document=inline_policy["PolicyDocument"],
                             )
-                            inline_group_policy_doc = inline_policy["PolicyDocument"]
-                            self.policies.append(
-                                Policy(
-                                    name=policy,
-                                    arn=group.arn,
-                                    entity=group.name,
-                                    type="Inline",
-                                    attached=True,
-                                    version_id="v1",
-                                    document=inline_group_policy_doc,
-                                )
+                        )
+                    except ClientError as error:
+                        if error.response["Error"]["Code"] == "NoSuchEntity":
+                            logger.warning(
+                                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                             )
-                        except ClientError as error:
-                            if error.response["Error"]["Code"] == "NoSuchEntity":
-                                logger.warning(
-                                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                                )
-                            else:
-                                logger.error(
-                                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                                )
-
-                        except Exception as error:
+                        else:
                             logger.error(
                                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                             )
-                group.inline_policies = inline_group_policies
-            except ClientError as error:
-                if error.response["Error"]["Code"] == "NoSuchEntity":
-                    logger.warning(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
-                else:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
-
-            except Exception as error:
-                logger.error(
-                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
-
-    def _list_inline_role_policies(self):
-        logger.info("IAM - List Inline Role Policies...")
-        if self.roles:
-            for role in self.roles:
-                try:
-                    inline_role_policies = []
-                    get_role_inline_policies_paginator = self.client.get_paginator(
-                        "list_role_policies"
-                    )
-                    for page in get_role_inline_policies_paginator.paginate(
-                        RoleName=role.name
-                    ):
-                        for policy in page["PolicyNames"]:
-                            try:
-                                inline_role_policies.append(policy)
-                                # Get inline policies & their policy documents here:
-                                inline_policy = self.client.get_role_policy(
-                                    RoleName=role.name, PolicyName=policy
-                                )
-                                inline_role_policy_doc = inline_policy["PolicyDocument"]
-                                self.policies.append(
-                                    Policy(
-                                        name=policy,
-                                        arn=role.arn,
-                                        entity=role.name,
-                                        type="Inline",
-                                        attached=True,
-                                        version_id="v1",
-                                        document=inline_role_policy_doc,
-                                    )
-                                )
-                            except ClientError as error:
-                                if error.response["Error"]["Code"] == "NoSuchEntity":
-                                    logger.warning(
-                                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                                    )
-                                else:
-                                    logger.error(
-                                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                                    )
-
-                            except Exception as error:
-                                logger.error(
-                                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                                )
-
-                    role.inline_policies = inline_role_policies
-
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntity":
-                        logger.warning(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                    else:
+                    except Exception as error:
                         logger.error(
                             f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                         )
+            role.inline_policies = inline_role_policies
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
-                except Exception as error:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
+        return policies
 
     def _list_entities_role_for_policy(self, policy_arn):
         logger.info("IAM - List Entities Role For Policy...")
@@ -770,25 +877,22 @@ class IAM(AWSService):
         finally:
             return policies
 
-    def _list_policies_version(self, policies):
+    def _list_policies_version(self, policy):
         logger.info("IAM - List Policies Version...")
         try:
-            for policy in policies:
-                try:
-                    policy_version = self.client.get_policy_version(
-                        PolicyArn=policy.arn, VersionId=policy.version_id
-                    )
-                    policy.document = policy_version["PolicyVersion"]["Document"]
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntity":
-                        logger.warning(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                    else:
-                        logger.error(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                    continue
+            policy_version = self.client.get_policy_version(
+                PolicyArn=policy.arn, VersionId=policy.version_id
+            )
+            policy.document = policy_version["PolicyVersion"]["Document"]
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -880,67 +984,82 @@ class IAM(AWSService):
                 )
 
     def _get_last_accessed_services(self):
+        """Generates the last accessed services report of every user concurrently and waits for all of them."""
         logger.info("IAM - Getting Last Accessed Services ...")
         try:
-            for user in self.users:
-                try:
-                    details = self.client.generate_service_last_accessed_details(
-                        Arn=user.arn
-                    )
-                    response = self.client.get_service_last_accessed_details(
-                        JobId=details["JobId"]
-                    )
-                    while response["JobStatus"] == "IN_PROGRESS":
-                        response = self.client.get_service_last_accessed_details(
-                            JobId=details["JobId"]
-                        )
-                    self.last_accessed_services[(user.name, user.arn)] = response.get(
-                        "ServicesLastAccessed", {}
+            for user, services_last_accessed in zip(
+                self.users,
+                self.__run_jobs__(
+                    self._generate_service_last_accessed_details,
+                    self._get_service_last_accessed_details,
+                    self.users,
+                ),
+            ):
+                if services_last_accessed is not None:
+                    self.last_accessed_services[(user.name, user.arn)] = (
+                        services_last_accessed
                     )
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntity":
-                        logger.warning(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                    else:
-                        logger.error(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                except Exception as error:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
+    def _generate_service_last_accessed_details(self, user):
+        try:
+            return self.client.generate_service_last_accessed_details(Arn=user.arn)[
+                "JobId"
+            ]
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
+    def _get_service_last_accessed_details(self, job_id):
+        try:
+            response = self.client.get_service_last_accessed_details(JobId=job_id)
+            return response["JobStatus"] != "IN_PROGRESS", response.get(
+                "ServicesLastAccessed", {}
+            )
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def _get_access_keys_metadata(self):
+    def _get_access_keys_metadata(self, user):
         logger.info("IAM - Getting Access Keys Metadata ...")
         try:
-            for user in self.users:
-                try:
-                    paginator = self.client.get_paginator("list_access_keys")
-                    self.access_keys_metadata[(user.name, user.arn)] = []
-                    for response in paginator.paginate(UserName=user.name):
-                        self.access_keys_metadata[(user.name, user.arn)] = response[
-                            "AccessKeyMetadata"
-                        ]
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntity":
-                        logger.warning(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                    else:
-                        logger.error(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                except Exception as error:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
+            paginator = self.client.get_paginator("list_access_keys")
+            for response in paginator.paginate(UserName=user.name):
+                self.access_keys_metadata[(user.name, user.arn)] = response[
+                    "AccessKeyMetadata"
+                ]
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -0,0 +1,219 @@
+from functools import lru_cache
+
+from py_iam_expand.actions import InvalidActionHandling, expand_actions
+
+# Maximum number of expanded action patterns kept in memory
+ACTION_PATTERNS_CACHE_SIZE = 4096
+# Maximum number of effective actions bitsets kept in memory, every bitset takes around 3KB
+EFFECTIVE_ACTIONS_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=None)
+def get_all_actions() -> frozenset[str]:
+    """
+    Returns every known IAM action, it is only expanded once per process.
+
+    Returns:
+        frozenset[str]: All the IAM actions.
+    """
+    return frozenset(expand_actions("*", InvalidActionHandling.REMOVE))
+
+
+@lru_cache(maxsize=None)
+def _get_actions_index() -> tuple[tuple[str, ...], dict[str, int]]:
+    """
+    Returns the ordered IAM actions and the bit position of every action within the actions bitsets.
+
+    Returns:
+        tuple: The ordered IAM actions and a dictionary with the bit position of every action.
+    """
+    actions = tuple(sorted(get_all_actions()))
+    return actions, {action: position for position, action in enumerate(actions)}
+
+
+@lru_cache(maxsize=ACTION_PATTERNS_CACHE_SIZE)
+def expand_action_pattern(pattern: str) -> frozenset[str]:
+    """
+    Expands an IAM action pattern (e.g. "s3:Get*") into the matching IAM actions, removing the invalid ones.
+
+    Args:
+        pattern (str): The IAM action pattern.
+
+    Returns:
+        frozenset[str]: The matching IAM actions.
+    """
+    if pattern == "*":
+        return get_all_actions()
+    return frozenset(expand_actions(pattern, InvalidActionHandling.REMOVE))
+
+
+def get_all_actions_bitset() -> int:
+    """
+    Returns the bitset with every known IAM action.
+
+    Returns:
+        int: The bitset with all the IAM actions.
+    """
+    return (1 << len(_get_actions_index()[0])) - 1
+
+
+def actions_to_bitset(actions: set[str]) -> int:
+    """
+    Converts a set of IAM actions into a bitset, the unknown actions are ignored.
+
+    Args:
+        actions (set[str]): The IAM actions.
+
+    Returns:
+        int: The bitset of the IAM actions.
+    """
+    positions = _get_actions_index()[1]
+    bitset = 0
+    for action in actions:
+        position = positions.get(action)
+        if position is not None:
+            bitset |= 1 << position
+    return bitset
+
+
+@lru_cache(maxsize=None)
+def _get_byte_bit_positions() -> tuple[tuple[int, ...], ...]:
+    """
+    Returns the positions of the set bits of every possible byte value.
+
+    Returns:
+        tuple: The set bit positions indexed by byte value.
+    """
+    return tuple(
+        tuple(bit for bit in range(8) if byte & (1 << bit)) for byte in range(256)
+    )
+
+
+def _decode_bitset(bitset: int) -> set[str]:
+    """
+    Returns the IAM actions of the set bits, only the non-zero bytes of the bitset are walked.
+
+    Args:
+        bitset (int): The bitset of IAM actions.
+
+    Returns:
+        set[str]: The IAM actions.
+    """
+    actions = _get_actions_index()[0]
+    decoded = set()
+    # Few set bits are extracted directly from the lowest set bit
+    if bitset.bit_length() <= 64 or bin(bitset).count("1") <= 16:
+        while bitset:
+            lowest_bit = bitset & -bitset
+            decoded.add(actions[lowest_bit.bit_length() - 1])
+            bitset ^= lowest_bit
+        return decoded
+    byte_bit_positions = _get_byte_bit_positions()
+    for byte_index, byte in enumerate(
+        bitset.to_bytes((bitset.bit_length() + 7) // 8, "little")
+    ):
+        if byte:
+            offset = byte_index * 8
+            for bit in byte_bit_positions[byte]:
+                decoded.add(actions[offset + bit])
+    return decoded
+
+
+def bitset_to_actions(bitset: int) -> set[str]:
+    """
+    Converts a bitset into the set of IAM actions it contains.
+
+    Args:
+        bitset (int): The bitset of IAM actions.
+
+    Returns:
+        set[str]: The IAM actions.
+    """
+    all_actions_bitset = get_all_actions_bitset()
+    bitset &= all_actions_bitset
+    # Dense bitsets (e.g. from NotAction) are built from their complement
+    if bin(bitset).count("1") > len(_get_actions_index()[0]) // 2:
+        return set(get_all_actions()).difference(
+            _decode_bitset(all_actions_bitset & ~bitset)
+        )
+    return _decode_bitset(bitset)
+
+
+@lru_cache(maxsize=ACTION_PATTERNS_CACHE_SIZE)
+def expand_action_pattern_bitset(pattern: str) -> int:
+    """
+    Expands an IAM action pattern into the bitset of the matching IAM actions.
+
+    Args:
+        pattern (str): The IAM action pattern.
+
+    Returns:
+        int: The bitset of the matching IAM actions.
+    """
+    if pattern == "*":
+        return get_all_actions_bitset()
+    return actions_to_bitset(expand_action_pattern(pattern))
+
+
+def expand_action_patterns_bitset(patterns: set[str]) -> int:
+    """
+    Expands several IAM action patterns into the bitset of all the matching IAM actions.
+
+    Args:
+        patterns (set[str]): The IAM action patterns.
+
+    Returns:
+        int: The bitset of the matching IAM actions.
+    """
+    bitset = 0
+    for pattern in patterns:
+        bitset |= expand_action_pattern_bitset(pattern)
+    return bitset
+
+
+@lru_cache(maxsize=EFFECTIVE_ACTIONS_CACHE_SIZE)
+def get_effective_actions_bitset(
+    statements: tuple[tuple[bool, frozenset[str], frozenset[str]], ...],
+) -> int:
+    """
+    Calculates the bitset of the effectively allowed IAM actions of a policy, applying the Deny > Allow precedence.
+
+    Args:
+        statements (tuple): Every Allow/Deny statement of the policy as a tuple of (is_allow, action_patterns, not_action_patterns).
+
+    Returns:
+        int: The bitset of the effectively allowed IAM actions.
+    """
+    directly_allowed = 0
+    directly_denied = 0
+    allow_not_action_exclusions = None
+    deny_not_action_exclusions = None
+    for is_allow, action_patterns, not_action_patterns in statements:
+        expanded = expand_action_patterns_bitset(action_patterns)
+        expanded_exclusions = (
+            expand_action_patterns_bitset(not_action_patterns)
+            if not_action_patterns
+            else None
+        )
+        if is_allow:
+            directly_allowed |= expanded
+            if expanded_exclusions is not None:
+                allow_not_action_exclusions = (
+                    allow_not_action_exclusions or 0
+                ) | expanded_exclusions
+        else:
+            directly_denied |= expanded
+            if expanded_exclusions is not None:
+                deny_not_action_exclusions = (
+                    deny_not_action_exclusions or 0
+                ) | expanded_exclusions
+
+    all_actions = get_all_actions_bitset()
+    # NotAction statements apply to every action but the excluded ones
+    potentially_allowed = directly_allowed
+    if allow_not_action_exclusions is not None:
+        potentially_allowed |= all_actions & ~allow_not_action_exclusions
+    potentially_denied = directly_denied
+    if deny_not_action_exclusions is not None:
+        potentially_denied |= all_actions & ~deny_not_action_exclusions
+    return potentially_allowed & ~potentially_denied
@@ -1,11 +1,22 @@
+import json
 import re
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from ipaddress import ip_address, ip_network
 from typing import Optional, Tuple
 
-from py_iam_expand.actions import InvalidActionHandling, expand_actions
-
 from prowler.lib.logger import logger
-from prowler.providers.aws.aws_provider import read_aws_regions_file
+from prowler.providers.aws.aws_provider import get_aws_regions_catalogue
+from prowler.providers.aws.services.iam.lib.actions import (
+    bitset_to_actions,
+    expand_action_pattern_bitset,
+    expand_action_patterns_bitset,
+    get_all_actions_bitset,
+    get_effective_actions_bitset,
+)
+
+# Maximum number of parsed policy documents kept in memory
+POLICY_DOCUMENTS_CACHE_SIZE = 4096
 
 
 def _get_patterns_from_standard_value(value):
@@ -21,6 +32,184 @@ def _get_patterns_from_standard_value(value):
     return patterns
 
 
+@dataclass(frozen=True)
+class PolicyStatement:
+    """PolicyStatement holds a normalized statement of an IAM policy document"""
+
+    statement: dict
+    effect: str
+    action_patterns: frozenset[str]
+    not_action_patterns: frozenset[str]
+    resources: tuple
+
+    @staticmethod
+    def from_statement(statement: dict) -> "PolicyStatement":
+        """
+        Normalizes a raw policy statement.
+
+        Args:
+            statement (dict): The raw policy statement.
+
+        Returns:
+            PolicyStatement: The normalized policy statement.
+        """
+        effect = statement.get("Effect", "")
+        resources = statement.get("Resource", [])
+        if isinstance(resources, str):
+            resources = [resources]
+        return PolicyStatement(
+            statement=statement,
+            effect=effect.strip().lower() if isinstance(effect, str) else "",
+            action_patterns=frozenset(
+                _get_patterns_from_standard_value(statement.get("Action"))
+            ),
+            not_action_patterns=frozenset(
+                _get_patterns_from_standard_value(statement.get("NotAction"))
+            ),
+            resources=tuple(resources) if isinstance(resources, list) else (),
+        )
+
+
+class PolicyDocument:
+    """
+    PolicyDocument holds a parsed IAM policy document and lazily caches the facts derived from it.
+
+    Documents are shared by content, so the same policy evaluated by several checks is only parsed and evaluated once.
+    """
+
+    def __init__(self, document: dict):
+        self.document = document
+        statements = document.get("Statement", [])
+        if not isinstance(statements, list):
+            statements = [statements]
+        self.statements = tuple(
+            PolicyStatement.from_statement(statement)
+            for statement in statements
+            if isinstance(statement, dict)
+        )
+        self._full_service_access = {}
+        self._public = {}
+
+    @staticmethod
+    def from_policy(policy: dict) -> "PolicyDocument":
+        """
+        Returns the PolicyDocument of a policy, built once per unique policy content.
+
+        Args:
+            policy (dict): The IAM policy document.
+
+        Returns:
+            PolicyDocument: The parsed policy document.
+        """
+        return _get_policy_document(json.dumps(policy, sort_keys=True, default=str))
+
+    @cached_property
+    def effective_actions_bitset(self) -> int:
+        """Bitset of the effectively allowed IAM actions, applying the Deny > Allow precedence."""
+        return get_effective_actions_bitset(
+            tuple(
+                (
+                    statement.effect == "allow",
+                    statement.action_patterns,
+                    statement.not_action_patterns,
+                )
+                for statement in self.statements
+                if statement.effect in ("allow", "deny")
+                and (statement.action_patterns or statement.not_action_patterns)
+            )
+        )
+
+    @cached_property
+    def effective_actions(self) -> frozenset[str]:
+        """Effectively allowed IAM actions, applying the Deny > Allow precedence."""
+        return frozenset(bitset_to_actions(self.effective_actions_bitset))
+
+    @cached_property
+    def has_admin_access(self) -> bool:
+        """Whether the policy allows admin access."""
+        return _check_admin_access(self.document)
+
+    def has_full_service_access(self, service: str) -> bool:
+        """
+        Determines if the policy grants full access to a specific AWS service on all resources ("*").
+
+        Args:
+            service (str): The AWS service name (e.g., 's3', 'ec2', or '*' for admin).
+
+        Returns:
+            bool: True if full access on all resources is granted, False otherwise.
+        """
+        if service not in self._full_service_access:
+            self._full_service_access[service] = self._check_full_service_access(
+                service
+            )
+        return self._full_service_access[service]
+
+    def _check_full_service_access(self, service: str) -> bool:
+        service_wildcard = f"{service}:*" if service != "*" else "*"
+        all_target_service_actions = expand_action_pattern_bitset(service_wildcard)
+
+        if (
+            all_target_service_actions & self.effective_actions_bitset
+            != all_target_service_actions
+        ):
+            return False
+
+        all_actions = get_all_actions_bitset()
+        actions_allowed_on_all_resources = 0
+        for statement in self.statements:
+            if statement.effect != "allow" or "*" not in statement.resources:
+                continue
+            actions_allowed_on_all_resources |= expand_action_patterns_bitset(
+                statement.action_patterns
+            )
+            if statement.not_action_patterns:
+                # Actions allowed by THIS NotAction statement
+                actions_allowed_on_all_resources |= all_actions & ~(
+                    expand_action_patterns_bitset(statement.not_action_patterns)
+                )
+
+        return (
+            all_target_service_actions & actions_allowed_on_all_resources
+            == all_target_service_actions
+        )
+
+    def is_public(
+        self,
+        source_account: str = "",
+        is_cross_account_allowed=True,
+        not_allowed_actions: list = [],
+        check_cross_service_confused_deputy=False,
+    ) -> bool:
+        """
+        Check if the policy allows public access to the resource, see is_policy_public.
+
+        Returns:
+            bool: True if the policy allows public access, False otherwise
+        """
+        key = (
+            source_account,
+            is_cross_account_allowed,
+            tuple(not_allowed_actions),
+            check_cross_service_confused_deputy,
+        )
+        if key not in self._public:
+            self._public[key] = _is_policy_public(
+                self.document,
+                source_account,
+                is_cross_account_allowed,
+                not_allowed_actions,
+                check_cross_service_confused_deputy,
+            )
+        return self._public[key]
+
+
+@lru_cache(maxsize=POLICY_DOCUMENTS_CACHE_SIZE)
+def _get_policy_document(policy_json: str) -> PolicyDocument:
+    # The document is parsed from its JSON so it does not share any object with the caller
+    return PolicyDocument(json.loads(policy_json))
+
+
 def get_effective_actions(policy: dict) -> set[str]:
     """
     Calculates the set of effectively allowed IAM actions from a policy document.
@@ -39,96 +228,7 @@ def get_effective_actions(policy: dict) -> set[str]:
     if not policy or "Statement" not in policy:
         return set()
 
-    directly_allowed_actions = set()
-    directly_denied_actions = set()
-    allow_not_action_exclusions = set()
-    deny_not_action_exclusions = set()
-    has_allow_not_action_statement = False
-    has_deny_not_action_statement = False
-
-    statements = policy.get("Statement", [])
-    if not isinstance(statements, list):
-        statements = [statements]
-
-    for statement in statements:
-        effect = statement.get("Effect", "")
-        if not isinstance(effect, str):
-            continue
-        effect = effect.strip().lower()
-
-        if effect not in ["allow", "deny"]:
-            continue
-
-        actions = statement.get("Action")
-        not_actions = statement.get("NotAction")
-
-        action_patterns_to_expand = _get_patterns_from_standard_value(actions)
-        if action_patterns_to_expand:
-            expanded = set()
-            for pattern in action_patterns_to_expand:
-                expanded.update(
-                    expand_actions(
-                        pattern,
-                        InvalidActionHandling.REMOVE,
-                    )
-                )
-            if effect == "allow":
-                directly_allowed_actions.update(expanded)
-            else:  # deny
-                directly_denied_actions.update(expanded)
-
-        not_action_patterns_to_expand = _get_patterns_from_standard_value(not_actions)
-        if not_action_patterns_to_expand:
-            expanded_exclusions = set()
-            for pattern in not_action_patterns_to_expand:
-                expanded_exclusions.update(
-                    expand_actions(
-                        pattern,
-                        InvalidActionHandling.REMOVE,
-                    )
-                )
-            if effect == "allow":
-                allow_not_action_exclusions.update(expanded_exclusions)
-                has_allow_not_action_statement = True
-            else:  # deny
-                deny_not_action_exclusions.update(expanded_exclusions)
-                has_deny_not_action_statement = True
-
-    all_actions = None
-
-    # Actions allowed by "Allow Action" statements
-    potentially_allowed = directly_allowed_actions
-
-    # Actions allowed by "Allow NotAction" statements
-    if has_allow_not_action_statement:
-        if all_actions is None:
-            all_actions = set(
-                expand_actions(
-                    "*",
-                    InvalidActionHandling.REMOVE,
-                )
-            )
-        allowed_by_not_action = all_actions.difference(allow_not_action_exclusions)
-        potentially_allowed.update(allowed_by_not_action)
-
-    # Actions denied by "Deny Action" statements
-    potentially_denied = directly_denied_actions
-
-    # Actions denied by "Deny NotAction" statements
-    if has_deny_not_action_statement:
-        if all_actions is None:
-            all_actions = set(
-                expand_actions(
-                    "*",
-                    InvalidActionHandling.REMOVE,
-                )
-            )
-        denied_by_not_action = all_actions.difference(deny_not_action_exclusions)
-        potentially_denied.update(denied_by_not_action)
-
-    effective_actions = potentially_allowed.difference(potentially_denied)
-
-    return effective_actions
+    return set(PolicyDocument.from_policy(policy).effective_actions)
 
 
 def check_full_service_access(service: str, policy: dict) -> bool:
@@ -146,81 +246,7 @@ def check_full_service_access(service: str, policy: dict) -> bool:
     if not policy or "Statement" not in policy:
         return False
 
-    service_wildcard = f"{service}:*" if service != "*" else "*"
-    all_target_service_actions = set(
-        expand_actions(
-            service_wildcard,
-            InvalidActionHandling.REMOVE,
-        )
-    )
-
-    effective_allowed_actions = get_effective_actions(policy)
-
-    if not all_target_service_actions.issubset(effective_allowed_actions):
-        return False
-
-    actions_allowed_on_all_resources = set()
-    statements = policy.get("Statement", [])
-    if not isinstance(statements, list):
-        statements = [statements]
-
-    all_aws_actions_for_inversion = None
-
-    for statement in statements:
-        effect = statement.get("Effect", "")
-        resources = statement.get("Resource", [])
-
-        if not isinstance(effect, str) or effect.strip().lower() != "allow":
-            continue
-        if isinstance(resources, str):
-            resources = [resources]
-        if "*" not in resources:
-            continue
-
-        actions = statement.get("Action")
-        not_actions = statement.get("NotAction")
-        statement_specific_allowed = set()
-
-        # Use the shared helper function instead of the duplicated one
-        action_patterns = _get_patterns_from_standard_value(actions)
-        for pattern in action_patterns:
-            statement_specific_allowed.update(
-                expand_actions(
-                    pattern,
-                    InvalidActionHandling.REMOVE,
-                )
-            )
-
-        not_action_patterns = _get_patterns_from_standard_value(not_actions)
-        if not_action_patterns:
-            if all_aws_actions_for_inversion is None:
-                all_aws_actions_for_inversion = set(
-                    expand_actions(
-                        "*",
-                        InvalidActionHandling.REMOVE,
-                    )
-                )
-
-            statement_exclusions = set()
-            for pattern in not_action_patterns:
-                statement_exclusions.update(
-                    expand_actions(
-                        pattern,
-                        InvalidActionHandling.REMOVE,
-                    )
-                )
-            # Actions allowed by THIS NotAction statement
-            statement_specific_allowed.update(
-                all_aws_actions_for_inversion.difference(statement_exclusions)
-            )
-
-        actions_allowed_on_all_resources.update(
-            action
-            for action in statement_specific_allowed
-            if action in all_target_service_actions
-        )
-
-    return all_target_service_actions.issubset(actions_allowed_on_all_resources)
+    return PolicyDocument.from_policy(policy).has_full_service_access(service)
 
 
 def is_condition_restricting_from_private_ip(condition_statement: dict) -> bool:
@@ -278,7 +304,6 @@ def is_condition_restricting_from_private_ip(condition_statement: dict) -> bool:
     return is_from_private_ip
 
 
-# TODO: Add logic for deny statements
 def is_policy_public(
     policy: dict,
     source_account: str = "",
@@ -298,6 +323,24 @@ def is_policy_public(
     Returns:
         bool: True if the policy allows public access, False otherwise
     """
+    if not policy:
+        return False
+    return PolicyDocument.from_policy(policy).is_public(
+        source_account,
+        is_cross_account_allowed,
+        not_allowed_actions,
+        check_cross_service_confused_deputy,
+    )
+
+
+# TODO: Add logic for deny statements
+def _is_policy_public(
+    policy: dict,
+    source_account: str,
+    is_cross_account_allowed,
+    not_allowed_actions: list,
+    check_cross_service_confused_deputy,
+) -> bool:
     is_public = False
     if policy:
         for statement in policy.get("Statement", []):
@@ -657,7 +700,11 @@ def check_admin_access(policy: dict) -> bool:
     Returns:
         bool: True if the policy allows admin access, False otherwise.
     """
+    if policy:
+        return PolicyDocument.from_policy(policy).has_admin_access
+
 
+def _check_admin_access(policy: dict) -> bool:
     if policy:
         allowed_actions = set()
         allowed_not_actions = set()
@@ -736,7 +783,7 @@ def is_valid_aws_service(service):
     Returns:
         bool: True if the service is valid, False otherwise.
     """
-    if service in read_aws_regions_file()["services"]:
+    if service in get_aws_regions_catalogue():
         return True
     return False
 
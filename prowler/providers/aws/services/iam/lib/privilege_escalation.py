@@ -1,7 +1,9 @@
+from functools import lru_cache
+
 from py_iam_expand.actions import expand_actions
 
 from prowler.lib.logger import logger
-from prowler.providers.aws.services.iam.lib.policy import get_effective_actions
+from prowler.providers.aws.services.iam.lib.policy import PolicyDocument
 
 # Does the tool analyze both users and roles, or just one or the other? --> Everything using AttachementCount.
 # Does the tool take a principal-centric or policy-centric approach? --> Policy-centric approach.
@@ -19,6 +21,18 @@ from prowler.providers.aws.services.iam.lib.policy import get_effective_actions
 # - https://github.com/RhinoSecurityLabs/Security-Research/blob/master/tools/aws-pentest-tools/aws_escalate.py
 # - https://rhinosecuritylabs.com/aws/aws-privilege-escalation-methods-mitigation/
 
+
+@lru_cache(maxsize=None)
+def _expand_required_action_pattern(action_pattern: str) -> frozenset[str]:
+    """
+    Expands a required action pattern of the privilege escalation combinations.
+
+    Invalid patterns raise an error instead of being removed, so a combination
+    is never matched with only part of its required actions.
+    """
+    return frozenset(expand_actions(action_pattern))
+
+
 privilege_escalation_policies_combination = {
     "OverPermissiveIAM": {"iam:*"},
     "IAMPut": {"iam:Put*"},
@@ -107,7 +121,7 @@ def check_privilege_escalation(policy: dict) -> str:
         return policies_affected
 
     try:
-        effective_allowed_actions = get_effective_actions(policy)
+        effective_allowed_actions = PolicyDocument.from_policy(policy).effective_actions
 
         matched_combo_actions = set()
         matched_combo_keys = set()
@@ -119,7 +133,9 @@ def check_privilege_escalation(policy: dict) -> str:
             # Expand the required actions for the current combo
             expanded_required_actions = set()
             for action_pattern in required_actions_patterns:
-                expanded_required_actions.update(expand_actions(action_pattern))
+                expanded_required_actions.update(
+                    _expand_required_action_pattern(action_pattern)
+                )
 
             # Check if all expanded required actions are present in the effective actions
             if expanded_required_actions and expanded_required_actions.issubset(
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.inspector2.inspector2_service import Inspector2
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-inspector2_client = Inspector2(Provider.get_global_provider())
+inspector2_client = ServiceClient(Inspector2)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.macie.macie_service import Macie
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-macie_client = Macie(Provider.get_global_provider())
+macie_client = ServiceClient(Macie)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.memorydb.memorydb_service import MemoryDB
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-memorydb_client = MemoryDB(Provider.get_global_provider())
+memorydb_client = ServiceClient(MemoryDB)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.neptune.neptune_service import Neptune
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-neptune_client = Neptune(Provider.get_global_provider())
+neptune_client = ServiceClient(Neptune)
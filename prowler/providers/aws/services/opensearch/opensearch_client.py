@@ -1,6 +1,6 @@
 from prowler.providers.aws.services.opensearch.opensearch_service import (
     OpenSearchService,
 )
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-opensearch_client = OpenSearchService(Provider.get_global_provider())
+opensearch_client = ServiceClient(OpenSearchService)
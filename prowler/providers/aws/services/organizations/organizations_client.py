@@ -1,6 +1,6 @@
 from prowler.providers.aws.services.organizations.organizations_service import (
     Organizations,
 )
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-organizations_client = Organizations(Provider.get_global_provider())
+organizations_client = ServiceClient(Organizations)
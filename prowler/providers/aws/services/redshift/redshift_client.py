@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.redshift.redshift_service import Redshift
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-redshift_client = Redshift(Provider.get_global_provider())
+redshift_client = ServiceClient(Redshift)
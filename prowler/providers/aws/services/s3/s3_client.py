@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.s3.s3_service import S3
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-s3_client = S3(Provider.get_global_provider())
+s3_client = ServiceClient(S3)
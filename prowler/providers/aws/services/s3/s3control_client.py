@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.s3.s3_service import S3Control
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-s3control_client = S3Control(Provider.get_global_provider())
+s3control_client = ServiceClient(S3Control)
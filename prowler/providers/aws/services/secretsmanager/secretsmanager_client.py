@@ -1,6 +1,6 @@
 from prowler.providers.aws.services.secretsmanager.secretsmanager_service import (
     SecretsManager,
 )
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-secretsmanager_client = SecretsManager(Provider.get_global_provider())
+secretsmanager_client = ServiceClient(SecretsManager)
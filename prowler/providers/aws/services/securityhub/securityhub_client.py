@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.securityhub.securityhub_service import SecurityHub
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-securityhub_client = SecurityHub(Provider.get_global_provider())
+securityhub_client = ServiceClient(SecurityHub)
@@ -1,6 +1,6 @@
 from prowler.providers.aws.services.servicecatalog.servicecatalog_service import (
     ServiceCatalog,
 )
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-servicecatalog_client = ServiceCatalog(Provider.get_global_provider())
+servicecatalog_client = ServiceClient(ServiceCatalog)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.ses.ses_service import SES
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-ses_client = SES(Provider.get_global_provider())
+ses_client = ServiceClient(SES)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.sns.sns_service import SNS
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-sns_client = SNS(Provider.get_global_provider())
+sns_client = ServiceClient(SNS)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.ssm.ssm_service import SSM
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-ssm_client = SSM(Provider.get_global_provider())
+ssm_client = ServiceClient(SSM)
@@ -1,6 +1,6 @@
 from prowler.providers.aws.services.stepfunctions.stepfunctions_service import (
     StepFunctions,
 )
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-stepfunctions_client = StepFunctions(Provider.get_global_provider())
+stepfunctions_client = ServiceClient(StepFunctions)
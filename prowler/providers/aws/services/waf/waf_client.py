@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.waf.waf_service import WAF
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-waf_client = WAF(Provider.get_global_provider())
+waf_client = ServiceClient(WAF)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.waf.waf_service import WAFRegional
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-wafregional_client = WAFRegional(Provider.get_global_provider())
+wafregional_client = ServiceClient(WAFRegional)
@@ -1,6 +1,6 @@
 from prowler.providers.aws.services.wellarchitected.wellarchitected_service import (
     WellArchitected,
 )
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-wellarchitected_client = WellArchitected(Provider.get_global_provider())
+wellarchitected_client = ServiceClient(WellArchitected)
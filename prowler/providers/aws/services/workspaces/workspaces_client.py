@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.workspaces.workspaces_service import WorkSpaces
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-workspaces_client = WorkSpaces(Provider.get_global_provider())
+workspaces_client = ServiceClient(WorkSpaces)
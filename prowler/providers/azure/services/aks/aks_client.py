@@ -1,4 +1,4 @@
 from prowler.providers.azure.services.aks.aks_service import AKS
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-aks_client = AKS(Provider.get_global_provider())
+aks_client = ServiceClient(AKS)
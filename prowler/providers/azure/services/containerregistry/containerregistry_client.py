@@ -1,6 +1,6 @@
 from prowler.providers.azure.services.containerregistry.containerregistry_service import (
     ContainerRegistry,
 )
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-containerregistry_client = ContainerRegistry(Provider.get_global_provider())
+containerregistry_client = ServiceClient(ContainerRegistry)
@@ -1,4 +1,4 @@
 from prowler.providers.azure.services.databricks.databricks_service import Databricks
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-databricks_client = Databricks(Provider.get_global_provider())
+databricks_client = ServiceClient(Databricks)
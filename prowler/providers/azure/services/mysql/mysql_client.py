@@ -1,4 +1,4 @@
 from prowler.providers.azure.services.mysql.mysql_service import MySQL
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-mysql_client = MySQL(Provider.get_global_provider())
+mysql_client = ServiceClient(MySQL)
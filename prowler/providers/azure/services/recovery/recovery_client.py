@@ -1,4 +1,4 @@
 from prowler.providers.azure.services.recovery.recovery_service import Recovery
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-recovery_client = Recovery(Provider.get_global_provider())
+recovery_client = ServiceClient(Recovery)
@@ -1,4 +1,4 @@
 from prowler.providers.azure.services.storage.storage_service import Storage
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-storage_client = Storage(Provider.get_global_provider())
+storage_client = ServiceClient(Storage)
@@ -1,4 +1,4 @@
 from prowler.providers.azure.services.vm.vm_service import VirtualMachines
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 
-vm_client = VirtualMachines(Provider.get_global_provider())
+vm_client = ServiceClient(VirtualMachines)
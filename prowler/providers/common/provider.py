@@ -3,8 +3,12 @@ import pkgutil
 import sys
 from abc import ABC, abstractmethod
 from argparse import Namespace
+from contextlib import contextmanager
+from contextvars import ContextVar
 from importlib import import_module
-from typing import Any, Optional
+from threading import Lock
+from typing import Any, Iterator, Optional
+from weakref import WeakKeyDictionary
 
 from prowler.config.config import load_and_validate_config_file
 from prowler.lib.logger import logger
@@ -12,6 +16,11 @@ from prowler.lib.mutelist.mutelist import Mutelist
 
 providers_path = "prowler.providers"
 
+# The provider of the scan running in the current thread, it takes precedence over the global provider
+_scoped_provider: ContextVar[Optional["Provider"]] = ContextVar(
+    "scoped_provider", default=None
+)
+
 
 # TODO: with this we can enforce that all classes ending with "Provider" needs to inherint from the Provider class
 # class ProviderMeta:
@@ -137,8 +146,43 @@ class Provider(ABC):
 
     @staticmethod
     def get_global_provider() -> "Provider":
+        """
+        get_global_provider returns the provider in scope in the current thread, or the global provider if there is none.
+        """
+        scoped_provider = _scoped_provider.get()
+        if scoped_provider is not None:
+            return scoped_provider
         return Provider._global
 
+    @staticmethod
+    @contextmanager
+    def scope(provider: "Provider") -> Iterator["Provider"]:
+        """
+        scope sets the provider returned by get_global_provider in the current thread, so the service clients use the services of this provider.
+
+        Example:
+            with Provider.scope(provider):
+                findings = check.execute()
+        """
+        token = _scoped_provider.set(provider)
+        try:
+            yield provider
+        finally:
+            _scoped_provider.reset(token)
+
+    @staticmethod
+    def get_service_registry(provider: "Provider") -> "ServiceRegistry":
+        """
+        get_service_registry returns the registry with the services of the provider, it is released with the provider.
+        """
+        with _service_registries_lock:
+            service_registry = _service_registries.get(provider)
+            if service_registry is None:
+                service_registry = _service_registries[provider] = ServiceRegistry(
+                    provider
+                )
+            return service_registry
+
     @staticmethod
     def set_global_provider(global_provider: "Provider") -> None:
         Provider._global = global_provider
@@ -290,3 +334,80 @@ class Provider(ABC):
             logger.error(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}] -- {error}"
             )
+
+
+class ServiceRegistry:
+    """
+    ServiceRegistry keeps the services of a provider, each service is created the first time it is used and shared by the checks of the provider.
+
+    Each provider has its own registry, so scans of different providers can run in threads of the same process.
+    """
+
+    def __init__(self, provider: Provider) -> None:
+        self._provider = provider
+        self._services = {}
+        self._services_locks = {}
+        self._lock = Lock()
+
+    def get(self, service_class: type) -> Any:
+        """
+        get returns the service of the provider, creating it if it is the first time.
+
+        Args:
+            service_class (type): The service class, e.g. EC2.
+
+        Returns:
+            Any: The service instance.
+        """
+        service = self._services.get(service_class)
+        if service is None:
+            with self._lock:
+                service_lock = self._services_locks.setdefault(service_class, Lock())
+            # Only the service being created is locked, since a service can use other services while it is created
+            with service_lock:
+                service = self._services.get(service_class)
+                if service is None:
+                    service = self._services[service_class] = service_class(
+                        self._provider
+                    )
+        return service
+
+    def clear(self) -> None:
+        """clear forgets the services of the provider, so they are created again the next time they are used."""
+        with self._lock:
+            self._services.clear()
+
+
+# {provider: ServiceRegistry}, the registry is removed when the provider is released
+_service_registries = WeakKeyDictionary()
+_service_registries_lock = Lock()
+
+
+class ServiceClient:
+    """
+    ServiceClient is the module-level client of a service imported by the checks, e.g. ec2_client = ServiceClient(EC2).
+
+    The attributes are read from the service of the provider in scope (see Provider.get_global_provider), taken from its ServiceRegistry.
+    """
+
+    __slots__ = ("_service_class",)
+
+    def __init__(self, service_class: type) -> None:
+        object.__setattr__(self, "_service_class", service_class)
+
+    def _resolve_service(self) -> Any:
+        return Provider.get_service_registry(Provider.get_global_provider()).get(
+            self._service_class
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve_service(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._resolve_service(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._resolve_service(), name)
+
+    def __repr__(self) -> str:
+        return f"ServiceClient({self._service_class.__name__})"
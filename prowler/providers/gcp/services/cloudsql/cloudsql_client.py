@@ -1,4 +1,4 @@
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 from prowler.providers.gcp.services.cloudsql.cloudsql_service import CloudSQL
 
-cloudsql_client = CloudSQL(Provider.get_global_provider())
+cloudsql_client = ServiceClient(CloudSQL)
@@ -1,4 +1,4 @@
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 from prowler.providers.gcp.services.dataproc.dataproc_service import Dataproc
 
-dataproc_client = Dataproc(Provider.get_global_provider())
+dataproc_client = ServiceClient(Dataproc)
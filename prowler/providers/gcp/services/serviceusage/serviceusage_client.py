@@ -1,6 +1,6 @@
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 from prowler.providers.gcp.services.serviceusage.serviceusage_service import (
     ServiceUsage,
 )
 
-serviceusage_client = ServiceUsage(Provider.get_global_provider())
+serviceusage_client = ServiceClient(ServiceUsage)
@@ -1,4 +1,4 @@
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 from prowler.providers.kubernetes.services.etcd.etcd_service import Etcd
 
-etcd_client = Etcd(Provider.get_global_provider())
+etcd_client = ServiceClient(Etcd)
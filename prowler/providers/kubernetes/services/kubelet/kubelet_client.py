@@ -1,4 +1,4 @@
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 from prowler.providers.kubernetes.services.kubelet.kubelet_service import Kubelet
 
-kubelet_client = Kubelet(Provider.get_global_provider())
+kubelet_client = ServiceClient(Kubelet)
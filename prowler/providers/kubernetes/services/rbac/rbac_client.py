@@ -1,4 +1,4 @@
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 from prowler.providers.kubernetes.services.rbac.rbac_service import Rbac
 
-rbac_client = Rbac(Provider.get_global_provider())
+rbac_client = ServiceClient(Rbac)
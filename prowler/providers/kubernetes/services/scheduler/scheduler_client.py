@@ -1,4 +1,4 @@
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 from prowler.providers.kubernetes.services.scheduler.scheduler_service import Scheduler
 
-scheduler_client = Scheduler(Provider.get_global_provider())
+scheduler_client = ServiceClient(Scheduler)
@@ -1,4 +1,4 @@
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 from prowler.providers.m365.services.defender.defender_service import Defender
 
-defender_client = Defender(Provider.get_global_provider())
+defender_client = ServiceClient(Defender)
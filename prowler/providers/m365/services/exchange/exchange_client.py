@@ -1,4 +1,4 @@
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 from prowler.providers.m365.services.exchange.exchange_service import Exchange
 
-exchange_client = Exchange(Provider.get_global_provider())
+exchange_client = ServiceClient(Exchange)
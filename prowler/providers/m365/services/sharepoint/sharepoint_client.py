@@ -1,4 +1,4 @@
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 from prowler.providers.m365.services.sharepoint.sharepoint_service import SharePoint
 
-sharepoint_client = SharePoint(Provider.get_global_provider())
+sharepoint_client = ServiceClient(SharePoint)
@@ -1,4 +1,4 @@
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.provider import ServiceClient
 from prowler.providers.nhn.services.network.network_service import NHNNetworkService
 
-network_client = NHNNetworkService(Provider.get_global_provider())
+network_client = ServiceClient(NHNNetworkService)
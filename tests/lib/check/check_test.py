@@ -6,6 +6,7 @@ from logging import ERROR
 from pkgutil import ModuleInfo
 from unittest import mock
 
+import pytest
 from boto3 import client
 from mock import Mock, patch
 from moto import mock_aws
@@ -44,165 +45,6 @@ from tests.providers.aws.utils import (
 # AWS_ACCOUNT_NUMBER = "123456789012"
 # AWS_REGION = "us-east-1"
 
-expected_packages = [
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/storage/storage_ensure_minimum_tls_version_12"
-        ),
-        name="prowler.providers.azure.services.storage.storage_ensure_minimum_tls_version_12.storage_ensure_minimum_tls_version_12",
-        ispkg=False,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/storage/storage_key_rotation_90_days"
-        ),
-        name="prowler.providers.azure.services.storage.storage_key_rotation_90_days.storage_key_rotation_90_days",
-        ispkg=False,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/storage/storage_ensure_private_endpoints_in_storage_accounts"
-        ),
-        name="prowler.providers.azure.services.storage.storage_ensure_private_endpoints_in_storage_accounts.storage_ensure_private_endpoints_in_storage_accounts",
-        ispkg=False,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/storage/storage_ensure_soft_delete_is_enabled"
-        ),
-        name="prowler.providers.azure.services.storage.storage_ensure_soft_delete_is_enabled.storage_ensure_soft_delete_is_enabled",
-        ispkg=False,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder("/root_dir/prowler/providers/azure/services/storage"),
-        name="prowler.providers.azure.services.storage.storage_ensure_encryption_with_customer_managed_keys",
-        ispkg=True,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/storage/storage_ensure_encryption_with_customer_managed_keys"
-        ),
-        name="prowler.providers.azure.services.storage.storage_ensure_encryption_with_customer_managed_keys.storage_ensure_encryption_with_customer_managed_keys",
-        ispkg=False,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_tde_encrypted_with_cmk",
-        ispkg=True,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver/sqlserver_tde_encrypted_with_cmk"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_tde_encrypted_with_cmk.sqlserver_tde_encrypted_with_cmk",
-        ispkg=False,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_tde_encryption_enabled",
-        ispkg=True,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver/sqlserver_tde_encryption_enabled"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_tde_encryption_enabled.sqlserver_tde_encryption_enabled",
-        ispkg=False,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_auditing_retention_90_days",
-        ispkg=True,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver/sqlserver_auditing_retention_90_days"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_auditing_retention_90_days.sqlserver_auditing_retention_90_days",
-        ispkg=False,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_vulnerability_assessment_enabled",
-        ispkg=True,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver/sqlserver_vulnerability_assessment_enabled"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_vulnerability_assessment_enabled.sqlserver_vulnerability_assessment_enabled",
-        ispkg=False,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_va_periodic_recurring_scans_enabled",
-        ispkg=True,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver/sqlserver_va_periodic_recurring_scans_enabled"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_va_periodic_recurring_scans_enabled.sqlserver_va_periodic_recurring_scans_enabled",
-        ispkg=False,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_va_scan_reports_configured",
-        ispkg=True,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver/sqlserver_va_scan_reports_configured"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_va_scan_reports_configured.sqlserver_va_scan_reports_configured",
-        ispkg=False,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_va_emails_notifications_admins_enabled",
-        ispkg=True,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver/sqlserver_va_emails_notifications_admins_enabled"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_va_emails_notifications_admins_enabled.sqlserver_va_emails_notifications_admins_enabled",
-        ispkg=False,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/postgresql"
-        ),
-        name="prowler.providers.azure.services.postgresql.postgresql_flexible_server_enforce_ssl_enabled",
-        ispkg=True,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/postgresql/postgresql_flexible_server_enforce_ssl_enabled"
-        ),
-        name="prowler.providers.azure.services.postgresql.postgresql_flexible_server_enforce_ssl_enabled.postgresql_flexible_server_enforce_ssl_enabled",
-        ispkg=False,
-    ),
-]
-
-
-def mock_walk_packages(*_):
-    return expected_packages
-
 
 def mock_list_modules(*_):
     modules = [
@@ -636,12 +478,71 @@ class TestCheck:
         returned_checks = recover_checks_from_provider(provider, service)
         assert returned_checks == expected_checks
 
-    @patch("prowler.lib.check.utils.walk_packages", new=mock_walk_packages)
-    def test_list_modules(self):
+    def test_list_modules(self, tmp_path):
         provider = "azure"
         service = "storage"
-        expected_modules = list_modules(provider, service)
-        assert expected_modules == expected_packages
+        services_path = tmp_path / "services"
+        for package in [
+            service,
+            f"{service}/storage_key_rotation_90_days",
+            f"{service}/lib",
+            "sqlserver",
+        ]:
+            (services_path / package).mkdir(parents=True)
+            (services_path / package / "__init__.py").touch()
+        (
+            services_path
+            / service
+            / "storage_key_rotation_90_days"
+            / "storage_key_rotation_90_days.py"
+        ).touch()
+        (
+            services_path
+            / service
+            / "storage_key_rotation_90_days"
+            / "storage_key_rotation_90_days.metadata.json"
+        ).touch()
+        (services_path / service / "lib" / "helpers.py").touch()
+        (services_path / service / "storage_service.py").touch()
+
+        with patch(
+            "prowler.lib.check.utils.find_spec",
+            return_value=Mock(submodule_search_locations=[str(services_path)]),
+        ):
+            modules = list_modules(provider, service)
+            assert [(module.name, module.module_finder.path) for module in modules] == [
+                (
+                    "prowler.providers.azure.services.storage.lib.helpers",
+                    str(services_path / service / "lib"),
+                ),
+                (
+                    "prowler.providers.azure.services.storage.storage_key_rotation_90_days.storage_key_rotation_90_days",
+                    str(services_path / service / "storage_key_rotation_90_days"),
+                ),
+            ]
+            assert list_modules(provider, "sqlserver") == []
+            with pytest.raises(ModuleNotFoundError):
+                list_modules(provider, "unknown")
+
+            # Custom checks copied into a service are discovered
+            custom_check_path = services_path / "sqlserver" / "sqlserver_custom_check"
+            custom_check_path.mkdir()
+            (custom_check_path / "__init__.py").touch()
+            (custom_check_path / "sqlserver_custom_check.py").touch()
+            os.utime(
+                services_path / "sqlserver",
+                ns=(0, os.stat(services_path / "sqlserver").st_mtime_ns + 1),
+            )
+            assert recover_checks_from_provider(provider) == [
+                (
+                    "sqlserver_custom_check",
+                    str(custom_check_path),
+                ),
+                (
+                    "storage_key_rotation_90_days",
+                    str(services_path / service / "storage_key_rotation_90_days"),
+                ),
+            ]
 
     @patch(
         "prowler.lib.check.utils.recover_checks_from_provider",
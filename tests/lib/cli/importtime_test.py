@@ -0,0 +1,48 @@
+import subprocess
+import sys
+
+# Cumulative import time budget of the CLI entrypoint, it took around 2.5 seconds when every provider was imported at startup
+PROWLER_MAIN_IMPORT_TIME_BUDGET_US = 2_000_000
+
+# Provider SDKs and integrations that must only be imported when they are requested
+DEFERRED_MODULES = [
+    "azure",
+    "boto3",
+    "google",
+    "kubernetes",
+    "msgraph",
+    "slack_sdk",
+]
+
+
+def get_import_times(module: str) -> dict:
+    """Returns the cumulative import time in microseconds of every module imported by the given module in a fresh interpreter"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, imported_module = line.split("|")
+        import_times[imported_module.strip()] = int(cumulative)
+    return import_times
+
+
+class Test_ImportTime:
+    def test_prowler_main_defers_provider_sdks(self):
+        import_times = get_import_times("prowler.__main__")
+
+        assert "prowler.__main__" in import_times
+        imported_deferred_modules = [
+            module for module in DEFERRED_MODULES if module in import_times
+        ]
+        assert imported_deferred_modules == []
+
+    def test_prowler_main_import_time(self):
+        import_times = get_import_times("prowler.__main__")
+
+        assert import_times["prowler.__main__"] < PROWLER_MAIN_IMPORT_TIME_BUDGET_US
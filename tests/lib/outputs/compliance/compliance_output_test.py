@@ -0,0 +1,43 @@
+from prowler.lib.outputs.compliance.compliance_output import (
+    ComplianceOutput,
+    get_requirements_index,
+)
+from tests.lib.outputs.compliance.fixtures import CIS_1_4_AWS
+
+
+class TestComplianceOutput:
+    def test_get_requirements_index_is_cached(self):
+        assert get_requirements_index(CIS_1_4_AWS) is get_requirements_index(
+            CIS_1_4_AWS
+        )
+
+    def test_get_finding_requirements(self):
+        requirements = ComplianceOutput.get_finding_requirements(CIS_1_4_AWS, ["2.1.3"])
+        assert len(requirements) == 1
+        assert requirements[0] is CIS_1_4_AWS.Requirements[0]
+
+    def test_get_finding_requirements_framework_order_and_no_duplicates(self):
+        requirements = ComplianceOutput.get_finding_requirements(
+            CIS_1_4_AWS, ["2.1.4", "2.1.3", "2.1.4"]
+        )
+        assert requirements == [
+            CIS_1_4_AWS.Requirements[0],
+            CIS_1_4_AWS.Requirements[1],
+        ]
+
+    def test_get_finding_requirements_not_present(self):
+        assert ComplianceOutput.get_finding_requirements(CIS_1_4_AWS, []) == []
+        assert (
+            ComplianceOutput.get_finding_requirements(CIS_1_4_AWS, ["not-present"])
+            == []
+        )
+
+    def test_get_manual_requirements(self):
+        assert ComplianceOutput.get_manual_requirements(CIS_1_4_AWS) == [
+            CIS_1_4_AWS.Requirements[1]
+        ]
+
+    def test_get_requirements_index_is_stored_in_the_framework(self):
+        requirements_index = get_requirements_index(CIS_1_4_AWS)
+        assert CIS_1_4_AWS._requirements_index is requirements_index
+        assert "_requirements_index" not in CIS_1_4_AWS.dict()
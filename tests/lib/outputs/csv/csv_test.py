@@ -118,6 +118,58 @@ class TestCSV:
 
         assert content == expected_csv
 
+    def test_csv_write_to_file_in_batches(self):
+        mock_file = StringIO()
+        output = CSV(
+            [generate_finding_output(status="PASS", resource_uid="resource-1")],
+            from_cli=False,
+        )
+        output._file_descriptor = mock_file
+        output.batch_write_data_to_file()
+        csv_writer = output._csv_writer
+        output._data.clear()
+
+        output.transform(
+            [generate_finding_output(status="FAIL", resource_uid="resource-2")]
+        )
+        output.batch_write_data_to_file()
+
+        # The same writer is used for all the batches and the header is written once
+        assert output._csv_writer is csv_writer
+        lines = mock_file.getvalue().splitlines()
+        assert len(lines) == 3
+        assert lines[0].startswith("AUTH_METHOD;TIMESTAMP;")
+        assert ";PASS;" in lines[1]
+        assert ";FAIL;" in lines[2]
+
+    def test_output_transform_check_columns_cached(self):
+        output = CSV(
+            [
+                generate_finding_output(
+                    check_id="service_check_a", resource_uid="resource-1"
+                ),
+                generate_finding_output(
+                    check_id="service_check_a",
+                    resource_uid="resource-2",
+                    severity="critical",
+                ),
+                generate_finding_output(check_id="service_check_b", severity="low"),
+            ]
+        )
+
+        assert list(output._check_columns) == ["service_check_a", "service_check_b"]
+        assert [row["CHECK_ID"] for row in output.data] == [
+            "service_check_a",
+            "service_check_a",
+            "service_check_b",
+        ]
+        assert [row["RESOURCE_UID"] for row in output.data[:2]] == [
+            "resource-1",
+            "resource-2",
+        ]
+        # The severity can change between the findings of a check
+        assert [row["SEVERITY"] for row in output.data] == ["high", "critical", "low"]
+
     def test_batch_write_data_to_file_without_findings(self):
         assert not CSV([])._file_descriptor
 
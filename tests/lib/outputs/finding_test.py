@@ -13,7 +13,7 @@ from prowler.lib.check.models import (
     Severity,
 )
 from prowler.lib.outputs.common import Status
-from prowler.lib.outputs.finding import Finding
+from prowler.lib.outputs.finding import Finding, FindingOutputContext
 from tests.lib.outputs.fixtures.fixtures import generate_finding_output
 
 
@@ -611,6 +611,87 @@ class TestFinding:
         with pytest.raises(ValidationError):
             Finding.generate_output(provider, check_output, output_options)
 
+    def _mock_aws_provider_and_check_output(self):
+        provider = MagicMock()
+        provider.type = "aws"
+        provider.identity.profile = "mock_auth"
+        provider.identity.account = "mock_account_uid"
+        provider.identity.partition = "aws"
+        provider.organizations_metadata.account_name = "mock_account_name"
+        provider.organizations_metadata.account_email = "mock_account_email"
+        provider.organizations_metadata.organization_arn = "mock_account_org_uid"
+        provider.organizations_metadata.organization_id = "mock_account_org_name"
+        provider.organizations_metadata.account_tags = {"tag1": "value1"}
+
+        check_output = MagicMock()
+        check_output.resource_id = "test_resource_id"
+        check_output.resource_arn = "test_resource_arn"
+        check_output.resource_details = "test_resource_details"
+        check_output.resource_tags = {"tag1": "value1"}
+        check_output.region = "us-west-1"
+        check_output.status = "FAIL"
+        check_output.status_extended = "mock_status_extended"
+        check_output.muted = False
+        check_output.check_metadata = mock_check_metadata(provider="aws")
+        check_output.resource = {"metadata": "mock_metadata"}
+        # The compliance is taken from the bulk checks metadata
+        del check_output.compliance
+        return provider, check_output
+
+    def test_generate_output_with_context(self):
+        provider, check_output = self._mock_aws_provider_and_check_output()
+        output_options = SimpleNamespace(unix_timestamp=False)
+        context = FindingOutputContext(provider, output_options)
+
+        with (
+            patch(
+                "prowler.lib.outputs.finding.get_check_compliance",
+                side_effect=mock_get_check_compliance,
+            ) as get_check_compliance,
+            patch.object(
+                Finding,
+                "get_provider_output_data",
+                wraps=Finding.get_provider_output_data,
+            ) as get_provider_output_data,
+        ):
+            finding_outputs = [
+                Finding.generate_output(provider, check_output, output_options, context)
+                for _ in range(3)
+            ]
+            expected_output = Finding.generate_output(
+                provider, check_output, output_options
+            )
+
+        # Computed once for the context and once for the call without context
+        assert get_provider_output_data.call_count == 2
+        assert get_check_compliance.call_count == 2
+        for finding_output in finding_outputs:
+            assert finding_output.dict() == expected_output.dict()
+        # Every finding gets its own compliance
+        finding_outputs[0].compliance["CIS-2.0"].append("1.13")
+        assert finding_outputs[1].compliance["CIS-2.0"] == ["1.12"]
+
+    def test_generate_output_without_validation(self):
+        provider, check_output = self._mock_aws_provider_and_check_output()
+        output_options = SimpleNamespace(unix_timestamp=False)
+
+        with patch(
+            "prowler.lib.outputs.finding.get_check_compliance",
+            side_effect=mock_get_check_compliance,
+        ):
+            finding_output = Finding.generate_output(
+                provider,
+                check_output,
+                output_options,
+                FindingOutputContext(provider, output_options, validate=False),
+            )
+            expected_output = Finding.generate_output(
+                provider, check_output, output_options
+            )
+
+        assert finding_output.status == Status.FAIL
+        assert finding_output.dict() == expected_output.dict()
+
     @patch(
         "prowler.lib.outputs.finding.get_check_compliance",
         new=mock_get_check_compliance,
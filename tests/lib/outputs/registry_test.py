@@ -0,0 +1,61 @@
+import pytest
+
+from prowler.lib.outputs.compliance.cis.cis_aws import AWSCIS
+from prowler.lib.outputs.compliance.generic.generic import GenericCompliance
+from prowler.lib.outputs.compliance.iso27001.iso27001_m365 import M365ISO27001
+from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_gcp import (
+    GCPMitreAttack,
+)
+from prowler.lib.outputs.csv.csv import CSV
+from prowler.lib.outputs.registry import (
+    COMPLIANCE_OUTPUT_CLASSES,
+    OUTPUT_FORMAT_CLASSES,
+    OUTPUT_OPTIONS_CLASSES,
+    get_compliance_output_class,
+    get_output_format_class,
+    get_output_options_class,
+)
+from prowler.providers.aws.models import AWSOutputOptions
+
+
+class TestOutputsRegistry:
+    def test_get_output_options_class(self):
+        assert get_output_options_class("aws") is AWSOutputOptions
+
+    def test_get_output_options_class_unknown_provider(self):
+        with pytest.raises(KeyError):
+            get_output_options_class("unknown")
+
+    def test_get_output_format_class(self):
+        assert get_output_format_class("csv") is CSV
+
+    @pytest.mark.parametrize(
+        "provider, compliance_name, compliance_output_class",
+        [
+            ("aws", "cis_2.0_aws", AWSCIS),
+            ("gcp", "mitre_attack_gcp", GCPMitreAttack),
+            ("m365", "iso27001_2022_m365", M365ISO27001),
+            ("aws", "soc2_aws", GenericCompliance),
+            ("github", "iso27001_2022_github", GenericCompliance),
+            ("iac", "cis_iac", GenericCompliance),
+        ],
+    )
+    def test_get_compliance_output_class(
+        self, provider, compliance_name, compliance_output_class
+    ):
+        assert (
+            get_compliance_output_class(provider, compliance_name)
+            is compliance_output_class
+        )
+
+    def test_registered_classes_exist(self):
+        for provider in OUTPUT_OPTIONS_CLASSES:
+            assert get_output_options_class(provider)
+        for output_format in OUTPUT_FORMAT_CLASSES:
+            assert get_output_format_class(output_format)
+        for provider, compliance_outputs in COMPLIANCE_OUTPUT_CLASSES.items():
+            for framework_prefix, _, class_name in compliance_outputs:
+                assert (
+                    get_compliance_output_class(provider, framework_prefix).__name__
+                    == class_name
+                )
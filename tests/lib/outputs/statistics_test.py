@@ -0,0 +1,134 @@
+from types import SimpleNamespace
+
+from prowler.lib.outputs.outputs import extract_findings_statistics
+from prowler.lib.outputs.statistics import FindingsColumns
+from tests.lib.outputs.fixtures.fixtures import generate_finding_output
+
+
+def generate_check_report(
+    status: str, severity: str, service: str, muted: bool = False
+) -> SimpleNamespace:
+    return SimpleNamespace(
+        status=status,
+        muted=muted,
+        check_metadata=SimpleNamespace(
+            Severity=severity, ServiceName=service, Provider="aws"
+        ),
+    )
+
+
+class TestFindingsColumns:
+    def test_empty(self):
+        columns = FindingsColumns()
+        assert len(columns) == 0
+        assert columns.get_services_summary() == []
+        assert columns.get_status_counts() == {"PASS": 0, "FAIL": 0, "MUTED": 0}
+        stats = columns.get_statistics()
+        assert stats["findings_count"] == 0
+        assert stats["resources_count"] == 0
+        assert stats["all_fails_are_muted"] is True
+
+    def test_get_statistics(self):
+        findings = [
+            generate_finding_output(
+                status="PASS", severity="critical", resource_uid="resource_1"
+            ),
+            generate_finding_output(
+                status="PASS", severity="low", resource_uid="resource_1", muted=True
+            ),
+            generate_finding_output(
+                status="FAIL", severity="high", resource_uid="resource_2"
+            ),
+            generate_finding_output(
+                status="FAIL",
+                severity="informational",
+                resource_uid="resource_3",
+                muted=True,
+            ),
+            generate_finding_output(
+                status="MANUAL", severity="medium", resource_uid="resource_4"
+            ),
+        ]
+
+        stats = FindingsColumns.from_findings(findings).get_statistics()
+
+        assert stats == {
+            "total_pass": 2,
+            "total_muted_pass": 1,
+            "total_fail": 2,
+            "total_muted_fail": 1,
+            # Resources of manual findings are also counted
+            "resources_count": 4,
+            "findings_count": 4,
+            "total_critical_severity_fail": 0,
+            "total_critical_severity_pass": 1,
+            "total_high_severity_fail": 1,
+            "total_high_severity_pass": 0,
+            "total_medium_severity_fail": 0,
+            "total_medium_severity_pass": 0,
+            "total_low_severity_fail": 0,
+            "total_low_severity_pass": 1,
+            "total_informational_severity_fail": 1,
+            "total_informational_severity_pass": 0,
+            "all_fails_are_muted": False,
+        }
+        assert all(type(value) is int for value in list(stats.values())[:-1])
+        assert stats == extract_findings_statistics(findings)
+
+    def test_get_statistics_all_fails_are_muted(self):
+        findings = [
+            generate_finding_output(status="FAIL", muted=True),
+            generate_finding_output(status="PASS", muted=False),
+        ]
+        assert extract_findings_statistics(findings)["all_fails_are_muted"] is True
+
+    def test_get_services_summary(self):
+        findings = [
+            generate_check_report("PASS", "high", "s3"),
+            generate_check_report("FAIL", "critical", "s3"),
+            generate_check_report("FAIL", "low", "s3", muted=True),
+            generate_check_report("MANUAL", "high", "s3"),
+            generate_check_report("FAIL", "medium", "ec2"),
+            generate_check_report("FAIL", "informational", "ec2"),
+            # A new run of an already seen service gets its own row
+            generate_check_report("PASS", "high", "s3"),
+        ]
+
+        columns = FindingsColumns.from_findings(findings)
+
+        assert columns.get_status_counts() == {"PASS": 2, "FAIL": 4, "MUTED": 1}
+        assert columns.get_services_summary() == [
+            {
+                "Service": "s3",
+                "Provider": "aws",
+                "Total": 4,
+                "Pass": 1,
+                "Critical": 1,
+                "High": 0,
+                "Medium": 0,
+                "Low": 1,
+                "Muted": 1,
+            },
+            {
+                "Service": "ec2",
+                "Provider": "aws",
+                "Total": 2,
+                "Pass": 0,
+                "Critical": 0,
+                "High": 0,
+                "Medium": 1,
+                "Low": 0,
+                "Muted": 0,
+            },
+            {
+                "Service": "s3",
+                "Provider": "aws",
+                "Total": 1,
+                "Pass": 1,
+                "Critical": 0,
+                "High": 0,
+                "Medium": 0,
+                "Low": 0,
+                "Muted": 0,
+            },
+        ]
@@ -75,7 +75,9 @@ def mock_generate_output():
     with mock.patch(
         "prowler.lib.outputs.finding.Finding.generate_output", autospec=True
     ) as mock_gen_output:
-        mock_gen_output.side_effect = lambda provider, finding, output_options: finding
+        mock_gen_output.side_effect = (
+            lambda provider, finding, output_options, context=None: finding
+        )
         yield mock_gen_output
 
 
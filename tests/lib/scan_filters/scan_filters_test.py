@@ -1,4 +1,8 @@
-from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from prowler.lib.scan_filters.scan_filters import (
+    AuditResourcesFilter,
+    get_audit_resources_filter,
+    is_resource_filtered,
+)
 
 
 class Test_Scan_Filters:
@@ -15,3 +19,49 @@ class Test_Scan_Filters:
         )
         assert is_resource_filtered("test_bucket", audit_resources)
         assert is_resource_filtered("arn:aws:s3:::test_bucket", audit_resources)
+
+    def test_is_resource_filtered_substrings(self):
+        audit_resources = [
+            "arn:aws:ec2:us-east-1:123456789012:instance/i-1234567890abcdef0",
+            "arn:aws:s3:::test_bucket",
+        ]
+        # ARN segments
+        assert is_resource_filtered("i-1234567890abcdef0", audit_resources)
+        assert is_resource_filtered("123456789012", audit_resources)
+        # ARN prefixes
+        assert is_resource_filtered(
+            "arn:aws:ec2:us-east-1:123456789012:instance", audit_resources
+        )
+        assert is_resource_filtered("arn:aws:s3:::test", audit_resources)
+        assert not is_resource_filtered("arn:aws:s3:::other_bucket", audit_resources)
+        assert not is_resource_filtered(
+            "arn:aws:ec2:us-east-1:123456789012:instance/i-1234567890abcdef0/other",
+            audit_resources,
+        )
+        # Part of a name
+        assert is_resource_filtered("test_buck", audit_resources)
+        assert not is_resource_filtered("other_bucket", audit_resources)
+
+    def test_is_resource_filtered_no_audit_resources(self):
+        assert not is_resource_filtered("arn:aws:s3:::test_bucket", [])
+        assert not is_resource_filtered("test_bucket", [])
+
+    def test_is_resource_filtered_audit_resources_changed(self):
+        audit_resources = ["arn:aws:s3:::test_bucket"]
+        assert not is_resource_filtered("arn:aws:s3:::other_bucket", audit_resources)
+        audit_resources.append("arn:aws:s3:::other_bucket")
+        assert is_resource_filtered("arn:aws:s3:::other_bucket", audit_resources)
+
+    def test_get_audit_resources_filter(self):
+        audit_resources = ["arn:aws:s3:::test_bucket"]
+        audit_resources_filter = get_audit_resources_filter(audit_resources)
+
+        assert isinstance(audit_resources_filter, AuditResourcesFilter)
+        assert get_audit_resources_filter(audit_resources) is audit_resources_filter
+        assert (
+            get_audit_resources_filter(audit_resources_filter) is audit_resources_filter
+        )
+        assert len(audit_resources_filter) == 1
+        assert "test_bucket" in audit_resources_filter
+        assert "other_bucket" not in audit_resources_filter
+        assert is_resource_filtered("test_bucket", audit_resources_filter)
@@ -0,0 +1,97 @@
+from unittest import mock
+
+from prowler.lib.utils import secrets_scanner
+from prowler.lib.utils.secrets_scanner import (
+    IN_MEMORY_DATA_NAME,
+    SecretsScanner,
+    get_secrets_scanner,
+)
+from prowler.lib.utils.utils import default_detect_secrets_plugins
+
+
+class Test_SecretsScanner:
+    def test_scan_data(self):
+        scanner = SecretsScanner(default_detect_secrets_plugins)
+        secrets_detected = scanner.scan('{\n"password": "hunter2"\n}')
+        assert len(secrets_detected) == 1
+        assert secrets_detected[0]["filename"] == IN_MEMORY_DATA_NAME
+        assert secrets_detected[0]["line_number"] == 2
+        assert secrets_detected[0]["type"] == "Secret Keyword"
+        assert secrets_detected[0]["is_added"] is False
+        assert secrets_detected[0]["is_removed"] is False
+
+    def test_scan_no_secrets(self):
+        scanner = SecretsScanner(default_detect_secrets_plugins)
+        assert scanner.scan("no secrets") is None
+        assert scanner.scan("") is None
+
+    def test_scan_same_secret_reported_once(self):
+        scanner = SecretsScanner(default_detect_secrets_plugins)
+        secrets_detected = scanner.scan(
+            '{\n"password": "hunter2",\n"db_password": "hunter2"\n}'
+        )
+        assert len(secrets_detected) == 1
+        assert secrets_detected[0]["line_number"] == 2
+
+    def test_scan_excluded_secrets(self):
+        scanner = SecretsScanner(
+            default_detect_secrets_plugins, excluded_secrets=[".*password.*"]
+        )
+        assert scanner.scan("password=password") is None
+
+    def test_scan_many_keeps_order_and_scans_duplicates_once(self):
+        scanner = SecretsScanner(default_detect_secrets_plugins, max_workers=1)
+        data_items = ["password=password", "no secrets", "password=password"]
+        with mock.patch(
+            "prowler.lib.utils.secrets_scanner._scan_data",
+            wraps=secrets_scanner._scan_data,
+        ) as scan_data:
+            results = scanner.scan_many(data_items)
+            assert scan_data.call_count == 2
+            # Already scanned data is not scanned again
+            assert scanner.scan("no secrets") is None
+            assert scan_data.call_count == 2
+
+        assert results[0][0]["type"] == "Secret Keyword"
+        assert results[1] is None
+        assert results[2] == results[0]
+        # Results are copies so callers can not alter the cached ones
+        results[0][0]["line_number"] = 10
+        assert scanner.scan("password=password")[0]["line_number"] == 1
+
+    def test_scan_many_process_pool(self):
+        scanner = SecretsScanner(default_detect_secrets_plugins, max_workers=2)
+        data_items = [f'{{\n"password": "hunter{index}"\n}}' for index in range(8)]
+        with (
+            mock.patch("prowler.lib.utils.secrets_scanner.PROCESS_POOL_MIN_BYTES", 0),
+            mock.patch(
+                "prowler.lib.utils.secrets_scanner.ProcessPoolExecutor"
+            ) as process_pool,
+        ):
+            process_pool.return_value.__enter__.return_value.map.side_effect = map
+            results = scanner.scan_many(data_items)
+
+        process_pool.assert_called_once_with(max_workers=2)
+        assert len(results) == 8
+        assert all(result[0]["line_number"] == 2 for result in results)
+
+    def test_scan_many_process_pool_not_available(self):
+        scanner = SecretsScanner(default_detect_secrets_plugins, max_workers=2)
+        data_items = [f"password=password{index}" for index in range(8)]
+        with (
+            mock.patch("prowler.lib.utils.secrets_scanner.PROCESS_POOL_MIN_BYTES", 0),
+            mock.patch(
+                "prowler.lib.utils.secrets_scanner.ProcessPoolExecutor",
+                side_effect=OSError("No semaphores"),
+            ),
+        ):
+            results = scanner.scan_many(data_items)
+
+        assert all(result[0]["type"] == "Secret Keyword" for result in results)
+
+    def test_get_secrets_scanner_is_shared(self):
+        scanner = get_secrets_scanner(default_detect_secrets_plugins, ["test"])
+        assert scanner is get_secrets_scanner(
+            list(default_detect_secrets_plugins), ["test"]
+        )
+        assert scanner is not get_secrets_scanner(default_detect_secrets_plugins)
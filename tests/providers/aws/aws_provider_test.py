@@ -16,7 +16,12 @@ from moto import mock_aws
 from pytest import raises
 from tzlocal import get_localzone
 
-from prowler.providers.aws.aws_provider import AwsProvider, get_aws_region_for_sts
+from prowler.providers.aws.aws_provider import (
+    AwsProvider,
+    build_aws_regions_catalogue,
+    get_aws_region_for_sts,
+    get_aws_regions_catalogue,
+)
 from prowler.providers.aws.config import (
     AWS_STS_GLOBAL_ENDPOINT_REGION,
     BOTO3_USER_AGENT_EXTRA,
@@ -964,34 +969,36 @@ aws:
         )
 
         with patch(
-            "prowler.providers.aws.aws_provider.parse_json_file",
-            return_value={
-                "services": {
-                    "ec2": {
-                        "regions": {
-                            "aws": [
-                                "af-south-1",
-                                "ca-central-1",
-                                "eu-central-1",
-                                "eu-central-2",
-                                "eu-north-1",
-                                "eu-south-1",
-                                "eu-south-2",
-                                AWS_REGION_EU_WEST_1,
-                                "eu-west-2",
-                                "eu-west-3",
-                                "me-central-1",
-                                "me-south-1",
-                                "sa-east-1",
-                                AWS_REGION_US_EAST_1,
-                                "us-east-2",
-                                "us-west-1",
-                                "us-west-2",
-                            ],
+            "prowler.providers.aws.aws_provider.get_aws_regions_catalogue",
+            return_value=build_aws_regions_catalogue(
+                {
+                    "services": {
+                        "ec2": {
+                            "regions": {
+                                "aws": [
+                                    "af-south-1",
+                                    "ca-central-1",
+                                    "eu-central-1",
+                                    "eu-central-2",
+                                    "eu-north-1",
+                                    "eu-south-1",
+                                    "eu-south-2",
+                                    AWS_REGION_EU_WEST_1,
+                                    "eu-west-2",
+                                    "eu-west-3",
+                                    "me-central-1",
+                                    "me-south-1",
+                                    "sa-east-1",
+                                    AWS_REGION_US_EAST_1,
+                                    "us-east-2",
+                                    "us-west-1",
+                                    "us-west-2",
+                                ],
+                            }
                         }
                     }
                 }
-            },
+            ),
         ):
             assert aws_provider.get_available_aws_service_regions(
                 "ec2", "aws", {AWS_REGION_US_EAST_1}
@@ -1002,34 +1009,36 @@ aws:
         aws_provider = AwsProvider()
 
         with patch(
-            "prowler.providers.aws.aws_provider.parse_json_file",
-            return_value={
-                "services": {
-                    "ec2": {
-                        "regions": {
-                            "aws": [
-                                "af-south-1",
-                                "ca-central-1",
-                                "eu-central-1",
-                                "eu-central-2",
-                                "eu-north-1",
-                                "eu-south-1",
-                                "eu-south-2",
-                                AWS_REGION_EU_WEST_1,
-                                "eu-west-2",
-                                "eu-west-3",
-                                "me-central-1",
-                                "me-south-1",
-                                "sa-east-1",
-                                AWS_REGION_US_EAST_1,
-                                "us-east-2",
-                                "us-west-1",
-                                "us-west-2",
-                            ],
+            "prowler.providers.aws.aws_provider.get_aws_regions_catalogue",
+            return_value=build_aws_regions_catalogue(
+                {
+                    "services": {
+                        "ec2": {
+                            "regions": {
+                                "aws": [
+                                    "af-south-1",
+                                    "ca-central-1",
+                                    "eu-central-1",
+                                    "eu-central-2",
+                                    "eu-north-1",
+                                    "eu-south-1",
+                                    "eu-south-2",
+                                    AWS_REGION_EU_WEST_1,
+                                    "eu-west-2",
+                                    "eu-west-3",
+                                    "me-central-1",
+                                    "me-south-1",
+                                    "sa-east-1",
+                                    AWS_REGION_US_EAST_1,
+                                    "us-east-2",
+                                    "us-west-1",
+                                    "us-west-2",
+                                ],
+                            }
                         }
                     }
                 }
-            },
+            ),
         ):
             assert (
                 len(aws_provider.get_available_aws_service_regions("ec2", "aws")) == 17
@@ -1605,6 +1614,17 @@ aws:
 
         assert recovered_checks == expected_checks
 
+    @mock_aws
+    def test_audit_resources_filter(self):
+        aws_provider = AwsProvider()
+        aws_provider._audit_resources = ["arn:aws:s3:::bucket-name"]
+
+        audit_resources_filter = aws_provider.audit_resources_filter
+        assert aws_provider.audit_resources_filter is audit_resources_filter
+        assert audit_resources_filter.is_filtered("arn:aws:s3:::bucket-name")
+        assert audit_resources_filter.is_filtered("bucket-name")
+        assert not audit_resources_filter.is_filtered("arn:aws:s3:::other-bucket")
+
     @mock_aws
     @patch(
         "prowler.lib.check.utils.recover_checks_from_provider",
@@ -1762,26 +1782,43 @@ aws:
     def test_get_regions_aws_count(self):
         assert len(AwsProvider.get_regions(partition="aws")) == 33
 
-    def test_get_all_regions(self):
+    def test_get_aws_regions_catalogue_is_loaded_once(self):
+        get_aws_regions_catalogue.cache_clear()
         with patch(
             "prowler.providers.aws.aws_provider.read_aws_regions_file",
-            return_value={
-                "services": {
-                    "acm": {
-                        "regions": {
-                            "aws": [
-                                "af-south-1",
-                            ],
-                            "aws-cn": [
-                                "cn-north-1",
-                            ],
-                            "aws-us-gov": [
-                                "us-gov-west-1",
-                            ],
+            return_value={"services": {"acm": {"regions": {"aws": ["af-south-1"]}}}},
+        ) as read_aws_regions_file:
+            catalogue = get_aws_regions_catalogue()
+            assert get_aws_regions_catalogue() is catalogue
+            read_aws_regions_file.assert_called_once()
+        get_aws_regions_catalogue.cache_clear()
+
+        assert catalogue["acm"]["aws"] == frozenset({"af-south-1"})
+        with pytest.raises(TypeError):
+            catalogue["acm"]["aws-cn"] = frozenset()
+
+    def test_get_all_regions(self):
+        with patch(
+            "prowler.providers.aws.aws_provider.get_aws_regions_catalogue",
+            return_value=build_aws_regions_catalogue(
+                {
+                    "services": {
+                        "acm": {
+                            "regions": {
+                                "aws": [
+                                    "af-south-1",
+                                ],
+                                "aws-cn": [
+                                    "cn-north-1",
+                                ],
+                                "aws-us-gov": [
+                                    "us-gov-west-1",
+                                ],
+                            }
                         }
                     }
                 }
-            },
+            ),
         ):
             assert AwsProvider.get_regions(partition=None) == {
                 "af-south-1",
@@ -1791,24 +1828,26 @@ aws:
 
     def test_get_regions_with_us_gov_partition(self):
         with patch(
-            "prowler.providers.aws.aws_provider.read_aws_regions_file",
-            return_value={
-                "services": {
-                    "acm": {
-                        "regions": {
-                            "aws": [
-                                "af-south-1",
-                            ],
-                            "aws-cn": [
-                                "cn-north-1",
-                            ],
-                            "aws-us-gov": [
-                                "us-gov-west-1",
-                            ],
+            "prowler.providers.aws.aws_provider.get_aws_regions_catalogue",
+            return_value=build_aws_regions_catalogue(
+                {
+                    "services": {
+                        "acm": {
+                            "regions": {
+                                "aws": [
+                                    "af-south-1",
+                                ],
+                                "aws-cn": [
+                                    "cn-north-1",
+                                ],
+                                "aws-us-gov": [
+                                    "us-gov-west-1",
+                                ],
+                            }
                         }
                     }
                 }
-            },
+            ),
         ):
             assert AwsProvider.get_regions("aws-us-gov") == {
                 "us-gov-west-1",
@@ -1816,24 +1855,26 @@ aws:
 
     def test_get_regions_with_aws_partition(self):
         with patch(
-            "prowler.providers.aws.aws_provider.read_aws_regions_file",
-            return_value={
-                "services": {
-                    "acm": {
-                        "regions": {
-                            "aws": [
-                                "af-south-1",
-                            ],
-                            "aws-cn": [
-                                "cn-north-1",
-                            ],
-                            "aws-us-gov": [
-                                "us-gov-west-1",
-                            ],
+            "prowler.providers.aws.aws_provider.get_aws_regions_catalogue",
+            return_value=build_aws_regions_catalogue(
+                {
+                    "services": {
+                        "acm": {
+                            "regions": {
+                                "aws": [
+                                    "af-south-1",
+                                ],
+                                "aws-cn": [
+                                    "cn-north-1",
+                                ],
+                                "aws-us-gov": [
+                                    "us-gov-west-1",
+                                ],
+                            }
                         }
                     }
                 }
-            },
+            ),
         ):
             assert AwsProvider.get_regions("aws") == {
                 "af-south-1",
@@ -1841,24 +1882,26 @@ aws:
 
     def test_get_regions_with_cn_partition(self):
         with patch(
-            "prowler.providers.aws.aws_provider.read_aws_regions_file",
-            return_value={
-                "services": {
-                    "acm": {
-                        "regions": {
-                            "aws": [
-                                "af-south-1",
-                            ],
-                            "aws-cn": [
-                                "cn-north-1",
-                            ],
-                            "aws-us-gov": [
-                                "us-gov-west-1",
-                            ],
+            "prowler.providers.aws.aws_provider.get_aws_regions_catalogue",
+            return_value=build_aws_regions_catalogue(
+                {
+                    "services": {
+                        "acm": {
+                            "regions": {
+                                "aws": [
+                                    "af-south-1",
+                                ],
+                                "aws-cn": [
+                                    "cn-north-1",
+                                ],
+                                "aws-us-gov": [
+                                    "us-gov-west-1",
+                                ],
+                            }
                         }
                     }
                 }
-            },
+            ),
         ):
             assert AwsProvider.get_regions("aws-cn") == {
                 "cn-north-1",
@@ -1866,24 +1909,26 @@ aws:
 
     def test_get_regions_with_unknown_partition(self):
         with patch(
-            "prowler.providers.aws.aws_provider.read_aws_regions_file",
-            return_value={
-                "services": {
-                    "acm": {
-                        "regions": {
-                            "aws": [
-                                "af-south-1",
-                            ],
-                            "aws-cn": [
-                                "cn-north-1",
-                            ],
-                            "aws-us-gov": [
-                                "us-gov-west-1",
-                            ],
+            "prowler.providers.aws.aws_provider.get_aws_regions_catalogue",
+            return_value=build_aws_regions_catalogue(
+                {
+                    "services": {
+                        "acm": {
+                            "regions": {
+                                "aws": [
+                                    "af-south-1",
+                                ],
+                                "aws-cn": [
+                                    "cn-north-1",
+                                ],
+                                "aws-us-gov": [
+                                    "us-gov-west-1",
+                                ],
+                            }
                         }
                     }
                 }
-            },
+            ),
         ):
             partition = "unknown"
             with pytest.raises(AWSInvalidPartitionError) as exception:
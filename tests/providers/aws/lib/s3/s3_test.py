@@ -1,18 +1,22 @@
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from os import path, remove
 from pathlib import Path
 
 import boto3
 import pytest
+from mock import MagicMock, patch
 from moto import mock_aws
 
+from prowler.lib.outputs.compliance.cis.cis_aws import AWSCIS
 from prowler.lib.outputs.compliance.iso27001.iso27001_aws import AWSISO27001
 from prowler.lib.outputs.csv.csv import CSV
 from prowler.lib.outputs.html.html import HTML
 from prowler.lib.outputs.ocsf.ocsf import OCSF
 from prowler.providers.aws.lib.s3.exceptions.exceptions import S3InvalidBucketNameError
-from prowler.providers.aws.lib.s3.s3 import S3
+from prowler.providers.aws.lib.s3.s3 import S3, S3_MULTIPART_MAX_CONCURRENCY
 from prowler.providers.common.models import Connection
-from tests.lib.outputs.compliance.fixtures import ISO27001_2013_AWS
+from tests.lib.outputs.compliance.fixtures import CIS_1_4_AWS, ISO27001_2013_AWS
 from tests.lib.outputs.fixtures.fixtures import generate_finding_output
 from tests.providers.aws.utils import AWS_REGION_US_EAST_1
 
@@ -294,6 +298,143 @@ class TestS3:
             == "text/csv"
         )
 
+    @mock_aws
+    def test_send_to_s3_bucket_stream_outputs(self):
+        # Create bucket
+        current_session = boto3.session.Session(region_name=AWS_REGION_US_EAST_1)
+        client = current_session.client("s3")
+        client.create_bucket(Bucket=S3_BUCKET_NAME)
+
+        s3 = S3(
+            session=current_session,
+            bucket_name=S3_BUCKET_NAME,
+            output_directory=CURRENT_DIRECTORY,
+        )
+
+        csv = CSV(
+            findings=[FINDING],
+            file_extension=".csv",
+        )
+        ocsf = OCSF(
+            findings=[FINDING],
+            file_extension=".ocsf.json",
+        )
+
+        s3_send_result = s3.send_to_bucket(
+            outputs={"regular": [csv, ocsf]}, stream_outputs=True
+        )
+
+        assert s3_send_result["failure"] == {}
+        assert len(s3_send_result["success"][".csv"]) == 1
+        assert len(s3_send_result["success"][".ocsf.json"]) == 1
+
+        uploaded_csv = client.get_object(
+            Bucket=S3_BUCKET_NAME,
+            Key=s3_send_result["success"][".csv"][0],
+        )
+        assert uploaded_csv["ContentType"] == "text/csv"
+        assert "resource-123" in uploaded_csv["Body"].read().decode("utf-8")
+
+    @mock_aws
+    def test_upload_objects(self):
+        current_session = boto3.session.Session(region_name=AWS_REGION_US_EAST_1)
+        client = current_session.client("s3")
+        client.create_bucket(Bucket=S3_BUCKET_NAME)
+
+        file_path = f"{CURRENT_DIRECTORY}/upload_objects_test.csv"
+        with open(file_path, "w") as file:
+            file.write("csv")
+
+        results = S3.upload_objects(
+            client,
+            S3_BUCKET_NAME,
+            [
+                {"Filename": file_path, "Key": "output/file.csv"},
+                {"Fileobj": BytesIO(b"json"), "Key": "output/file.json"},
+                {"Filename": f"{CURRENT_DIRECTORY}/missing.csv", "Key": "missing"},
+            ],
+        )
+        remove(file_path)
+
+        assert results["output/file.csv"] is None
+        assert results["output/file.json"] is None
+        assert isinstance(results["missing"], Exception)
+        assert (
+            client.get_object(Bucket=S3_BUCKET_NAME, Key="output/file.json")[
+                "Body"
+            ].read()
+            == b"json"
+        )
+
+    @mock_aws
+    def test_send_to_s3_bucket_stream_several_compliance_outputs(self):
+        # Create bucket
+        current_session = boto3.session.Session(region_name=AWS_REGION_US_EAST_1)
+        client = current_session.client("s3")
+        client.create_bucket(Bucket=S3_BUCKET_NAME)
+
+        s3 = S3(
+            session=current_session,
+            bucket_name=S3_BUCKET_NAME,
+            output_directory=CURRENT_DIRECTORY,
+        )
+
+        compliance_outputs = [
+            AWSISO27001(
+                findings=[FINDING],
+                compliance=ISO27001_2013_AWS,
+                file_extension=".csv",
+            ),
+            AWSCIS(findings=[FINDING], compliance=CIS_1_4_AWS, file_extension=".csv"),
+            AWSCIS(findings=[FINDING], compliance=CIS_1_4_AWS, file_extension=".csv"),
+        ]
+
+        s3_send_result = s3.send_to_bucket(
+            outputs={"compliance": compliance_outputs}, stream_outputs=True
+        )
+
+        assert s3_send_result["failure"] == {}
+        uploaded_object_names = s3_send_result["success"][".csv"]
+        assert len(uploaded_object_names) == 3
+        assert len(set(uploaded_object_names)) == 3
+        assert any("_iso27001-2013" in name for name in uploaded_object_names)
+        assert any("_cis-1.4" in name for name in uploaded_object_names)
+        assert len(client.list_objects_v2(Bucket=S3_BUCKET_NAME)["Contents"]) == 3
+
+    def test_upload_objects_duplicated_keys(self):
+        with pytest.raises(ValueError):
+            S3.upload_objects(
+                None,
+                S3_BUCKET_NAME,
+                [
+                    {"Fileobj": BytesIO(b"a"), "Key": "output/file.csv"},
+                    {"Fileobj": BytesIO(b"b"), "Key": "output/file.csv"},
+                ],
+            )
+
+    def test_upload_objects_workers_fit_in_connection_pool(self):
+        client = MagicMock()
+        client.meta.config.max_pool_connections = 10
+        objects = [
+            {"Fileobj": BytesIO(b"data"), "Key": f"output/file-{index}.csv"}
+            for index in range(20)
+        ]
+
+        with patch(
+            "prowler.providers.aws.lib.s3.s3.ThreadPoolExecutor",
+            wraps=ThreadPoolExecutor,
+        ) as thread_pool:
+            results = S3.upload_objects(client, S3_BUCKET_NAME, objects)
+
+        assert thread_pool.call_args.kwargs["max_workers"] == (
+            10 // S3_MULTIPART_MAX_CONCURRENCY
+        )
+        assert all(error is None for error in results.values())
+        assert client.upload_fileobj.call_count == 20
+
+    def test_upload_objects_empty(self):
+        assert S3.upload_objects(None, S3_BUCKET_NAME, []) == {}
+
     def test_get_get_object_path_with_prowler(self):
         output_directory = "/Users/admin/prowler/"
         assert (
@@ -47,6 +47,14 @@ def mock_make_api_call(self, operation_name, kwarg):
             ]
         }
 
+    if operation_name == "GetFindings":
+        return {
+            "Findings": [
+                {"Id": "prowler-current-finding"},
+                {"Id": "prowler-previous-finding"},
+            ]
+        }
+
     return make_api_call(self, operation_name, kwarg)
 
 
@@ -410,6 +418,42 @@ class TestSecurityHub:
 
         assert security_hub.batch_send_to_security_hub() == 2
 
+    @patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
+    def test_archive_previous_findings(self):
+        enabled_regions = [AWS_REGION_EU_WEST_1, AWS_REGION_EU_WEST_2]
+        findings = [
+            generate_finding_output(status="FAIL", region=AWS_REGION_EU_WEST_1),
+            generate_finding_output(status="FAIL", region=AWS_REGION_EU_WEST_2),
+        ]
+        asff = ASFF(findings=findings)
+        for finding in asff.data:
+            finding.Id = "prowler-current-finding"
+
+        security_hub = SecurityHub(
+            aws_session=session.Session(
+                region_name=AWS_REGION_EU_WEST_1,
+            ),
+            aws_account_id=AWS_ACCOUNT_NUMBER,
+            aws_partition=AWS_COMMERCIAL_PARTITION,
+            aws_security_hub_available_regions=enabled_regions,
+            findings=asff.data,
+        )
+
+        with patch.object(
+            security_hub,
+            "_send_findings_in_batches",
+            wraps=security_hub._send_findings_in_batches,
+        ) as send_findings:
+            # One previous finding archived per region
+            assert security_hub.archive_previous_findings() == 2
+
+        assert send_findings.call_count == 2
+        for call in send_findings.call_args_list:
+            archived_findings = call.args[0]
+            assert len(archived_findings) == 1
+            assert archived_findings[0]["Id"] == "prowler-previous-finding"
+            assert archived_findings[0]["RecordState"] == "ARCHIVED"
+
     @patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
     def test_security_hub_test_connection_success(self):
         session_mock = session.Session(region_name=AWS_REGION_EU_WEST_1)
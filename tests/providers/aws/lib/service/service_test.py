@@ -152,3 +152,56 @@ class TestAWSService:
             service.get_unknown_arn(region="eu-west-1", resource_type="bucket")
             == f"arn:aws:{service_name}:eu-west-1:{AWS_ACCOUNT_NUMBER}:bucket/unknown"
         )
+
+    def test_AWSService_threading_call_results_order(self):
+        provider = set_mocked_aws_provider()
+        service = AWSService("s3", provider)
+
+        def call(item):
+            if item == 2:
+                raise ValueError("failed item")
+            return item * 10
+
+        assert service.__threading_call__(call, [3, 2, 1]) == [30, None, 10]
+
+    @patch("prowler.providers.aws.lib.service.service.JOBS_INITIAL_POLL_DELAY", new=0)
+    def test_AWSService_run_jobs(self):
+        provider = set_mocked_aws_provider()
+        service = AWSService("s3", provider)
+        polls = {}
+
+        def start_job(item):
+            # The item 3 can not start its job
+            return None if item == 3 else f"job-{item}"
+
+        def poll_job(job):
+            polls[job] = polls.get(job, 0) + 1
+            # The job of the item 2 fails
+            if job == "job-2":
+                return None
+            # The job of the item 1 completes in the third poll
+            if job == "job-1" and polls[job] < 3:
+                return False, None
+            return True, f"{job}-result"
+
+        assert service.__run_jobs__(start_job, poll_job, [0, 1, 2, 3]) == [
+            "job-0-result",
+            "job-1-result",
+            None,
+            None,
+        ]
+        assert polls == {"job-0": 1, "job-1": 3, "job-2": 1}
+
+    @patch("prowler.providers.aws.lib.service.service.JOBS_INITIAL_POLL_DELAY", new=0)
+    @patch("prowler.providers.aws.lib.service.service.JOBS_TIMEOUT", new=0.1)
+    def test_AWSService_run_jobs_timeout(self):
+        provider = set_mocked_aws_provider()
+        service = AWSService("s3", provider)
+
+        def start_job(item):
+            return item
+
+        def poll_job(job):
+            return False, None
+
+        assert service.__run_jobs__(start_job, poll_job, ["job"]) == [None]
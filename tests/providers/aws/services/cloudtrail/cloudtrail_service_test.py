@@ -1,7 +1,16 @@
+import gzip
+from datetime import datetime, timedelta, timezone
+from json import dumps
+from unittest.mock import patch
+
+import botocore
 from boto3 import client
 from moto import mock_aws
 
-from prowler.providers.aws.services.cloudtrail.cloudtrail_service import Cloudtrail
+from prowler.providers.aws.services.cloudtrail.cloudtrail_service import (
+    Cloudtrail,
+    Trail,
+)
 from tests.providers.aws.utils import (
     AWS_ACCOUNT_NUMBER,
     AWS_REGION_EU_SOUTH_2,
@@ -10,6 +19,8 @@ from tests.providers.aws.utils import (
     set_mocked_aws_provider,
 )
 
+make_api_call = botocore.client.BaseClient._make_api_call
+
 
 class Test_Cloudtrail_Service:
     # Test Cloudtrail Service
@@ -343,3 +354,163 @@ class Test_Cloudtrail_Service:
             if trail.name:
                 if trail.name == trail_name_us:
                     assert trail.tags == [{"Key": "test", "Value": tag}]
+
+    @mock_aws
+    def test_get_principals_events(self):
+        attacker_arn = f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:user/Attacker"
+        lookup_events_calls = []
+
+        def mock_make_api_call(self, operation_name, kwargs):
+            if operation_name == "LookupEvents":
+                lookup_events_calls.append(kwargs)
+                event_name = kwargs["LookupAttributes"][0]["AttributeValue"]
+                attacker_event = {
+                    "EventTime": datetime.now(timezone.utc) - timedelta(minutes=30),
+                    "CloudTrailEvent": dumps(
+                        {
+                            "eventName": event_name,
+                            "userIdentity": {"type": "IAMUser", "arn": attacker_arn},
+                        }
+                    ),
+                }
+                service_event = {
+                    "EventTime": datetime.now(timezone.utc) - timedelta(minutes=30),
+                    "CloudTrailEvent": dumps(
+                        {
+                            "eventName": event_name,
+                            "userIdentity": {"type": "AWSService"},
+                        }
+                    ),
+                }
+                # The events of DescribeVpcs are in a second page
+                if event_name == "DescribeVpcs" and "NextToken" not in kwargs:
+                    return {"Events": [service_event], "NextToken": "token"}
+                return {"Events": [attacker_event]}
+            return make_api_call(self, operation_name, kwargs)
+
+        aws_provider = set_mocked_aws_provider([AWS_REGION_US_EAST_1])
+        with (
+            patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call),
+            patch(
+                "prowler.providers.aws.services.cloudtrail.cloudtrail_service.LOOKUP_EVENTS_REQUESTS_PER_SECOND",
+                new=1000,
+            ),
+        ):
+            cloudtrail = Cloudtrail(aws_provider)
+            trail = Trail(region=AWS_REGION_US_EAST_1)
+
+            assert cloudtrail._get_principals_events(
+                trail=trail, event_names=["DescribeVpcs", "ListUsers"], minutes=60
+            ) == {(attacker_arn, "IAMUser"): {"DescribeVpcs", "ListUsers"}}
+            assert len(lookup_events_calls) == 3
+
+            # The events already ingested are shared
+            assert cloudtrail._get_principals_events(
+                trail=trail, event_names=["ListUsers"], minutes=60
+            ) == {(attacker_arn, "IAMUser"): {"ListUsers"}}
+            assert len(lookup_events_calls) == 3
+
+            # Shorter time windows are filtered from the ingested events
+            assert (
+                cloudtrail._get_principals_events(
+                    trail=trail, event_names=["ListUsers"], minutes=10
+                )
+                == {}
+            )
+            assert len(lookup_events_calls) == 3
+
+            # Longer time windows are looked up again
+            cloudtrail._get_principals_events(
+                trail=trail, event_names=["ListUsers"], minutes=120
+            )
+            assert len(lookup_events_calls) == 4
+
+    @mock_aws
+    def test_get_principals_events_local_log_files(self, tmp_path):
+        attacker_arn = f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:user/Attacker"
+        event_time = datetime.now(timezone.utc) - timedelta(minutes=30)
+        (tmp_path / "log.json.gz").write_bytes(
+            gzip.compress(
+                dumps(
+                    {
+                        "Records": [
+                            {
+                                "eventName": "ListUsers",
+                                "eventTime": event_time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                                "userIdentity": {
+                                    "type": "IAMUser",
+                                    "arn": attacker_arn,
+                                },
+                            }
+                        ]
+                    }
+                ).encode()
+            )
+        )
+        aws_provider = set_mocked_aws_provider(
+            [AWS_REGION_US_EAST_1],
+            audit_config={
+                "threat_detection_logs_source": "local",
+                "threat_detection_logs_directory": str(tmp_path),
+                "threat_detection_logs_processes": 1,
+            },
+        )
+        cloudtrail = Cloudtrail(aws_provider)
+        trail = Trail(region=AWS_REGION_US_EAST_1)
+
+        assert cloudtrail._get_principals_events(
+            trail=trail, event_names=["ListUsers", "ListRoles"], minutes=60
+        ) == {(attacker_arn, "IAMUser"): {"ListUsers"}}
+        assert (
+            cloudtrail._get_principals_events(
+                trail=trail, event_names=["ListUsers"], minutes=10
+            )
+            == {}
+        )
+
+    @mock_aws
+    def test_get_principals_events_s3_log_files(self):
+        attacker_arn = f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:user/Attacker"
+        event_time = datetime.now(timezone.utc) - timedelta(minutes=30)
+        bucket_name = "bucket_test_us"
+        s3_client = client("s3", region_name=AWS_REGION_US_EAST_1)
+        s3_client.create_bucket(Bucket=bucket_name)
+        s3_client.put_object(
+            Bucket=bucket_name,
+            Key=f"prefix/AWSLogs/{AWS_ACCOUNT_NUMBER}/CloudTrail/{AWS_REGION_US_EAST_1}/{event_time:%Y/%m/%d}/log.json.gz",
+            Body=gzip.compress(
+                dumps(
+                    {
+                        "Records": [
+                            {
+                                "eventName": "ListUsers",
+                                "eventTime": event_time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                                "userIdentity": {
+                                    "type": "IAMUser",
+                                    "arn": attacker_arn,
+                                },
+                            }
+                        ]
+                    }
+                ).encode()
+            ),
+        )
+        aws_provider = set_mocked_aws_provider(
+            [AWS_REGION_US_EAST_1],
+            audit_config={
+                "threat_detection_logs_source": "s3",
+                "threat_detection_logs_processes": 1,
+            },
+        )
+        cloudtrail = Cloudtrail(aws_provider)
+        trail = Trail(
+            region=AWS_REGION_US_EAST_1,
+            home_region=AWS_REGION_US_EAST_1,
+            is_multiregion=True,
+            s3_bucket=bucket_name,
+            s3_key_prefix="prefix",
+        )
+
+        assert cloudtrail._get_principals_events(
+            trail=trail, event_names=["ListUsers"], minutes=60
+        ) == {(attacker_arn, "IAMUser"): {"ListUsers"}}
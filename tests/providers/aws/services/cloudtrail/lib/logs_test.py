@@ -0,0 +1,112 @@
+import gzip
+from datetime import datetime, timedelta, timezone
+from json import dumps
+
+from prowler.providers.aws.services.cloudtrail.lib.logs import (
+    aggregate_log_file,
+    aggregate_log_files,
+    get_local_log_files,
+    parse_event_time,
+)
+
+ATTACKER_ARN = "arn:aws:iam::123456789012:user/Attacker"
+START_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def log_file_content(records: list) -> bytes:
+    return gzip.compress(dumps({"Records": records}).encode())
+
+
+def record(event_name: str, event_time: datetime, arn: str = ATTACKER_ARN) -> dict:
+    user_identity = {"type": "IAMUser"}
+    if arn:
+        user_identity["arn"] = arn
+    return {
+        "eventName": event_name,
+        "eventTime": event_time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "userIdentity": user_identity,
+    }
+
+
+class Test_CloudTrail_Logs:
+    def test_parse_event_time(self):
+        assert parse_event_time("2024-01-01T10:00:00Z") == datetime(
+            2024, 1, 1, 10, tzinfo=timezone.utc
+        )
+
+    def test_get_local_log_files(self, tmp_path):
+        (tmp_path / "us-east-1").mkdir()
+        (tmp_path / "us-east-1" / "b.json.gz").write_bytes(log_file_content([]))
+        (tmp_path / "a.json").write_text("{}")
+        (tmp_path / "digest.txt").write_text("")
+
+        assert get_local_log_files(str(tmp_path)) == [
+            str(tmp_path / "a.json"),
+            str(tmp_path / "us-east-1" / "b.json.gz"),
+        ]
+
+    def test_aggregate_log_file(self, tmp_path):
+        log_file = tmp_path / "log.json.gz"
+        log_file.write_bytes(
+            log_file_content(
+                [
+                    record("ListUsers", START_TIME + timedelta(hours=1)),
+                    record("ListUsers", START_TIME + timedelta(hours=2)),
+                    # Out of the time window
+                    record("ListRoles", START_TIME - timedelta(hours=1)),
+                    # Not requested
+                    record("GetObject", START_TIME + timedelta(hours=1)),
+                    # AWS service
+                    record("ListUsers", START_TIME + timedelta(hours=3), arn=None),
+                ]
+            )
+        )
+        expected = {
+            (ATTACKER_ARN, "IAMUser", "ListUsers"): START_TIME + timedelta(hours=2)
+        }
+        event_names = frozenset(["ListUsers", "ListRoles"])
+
+        assert aggregate_log_file(str(log_file), event_names, START_TIME) == expected
+        assert (
+            aggregate_log_file(log_file.read_bytes(), event_names, START_TIME)
+            == expected
+        )
+
+    def test_aggregate_log_file_invalid(self, tmp_path):
+        log_file = tmp_path / "log.json"
+        log_file.write_text("not json")
+
+        assert aggregate_log_file(str(log_file), frozenset(), START_TIME) == {}
+
+    def test_aggregate_log_files(self, tmp_path):
+        log_files = []
+        for hour in range(5):
+            log_file = tmp_path / f"log_{hour}.json.gz"
+            log_file.write_bytes(
+                log_file_content(
+                    [record("ListUsers", START_TIME + timedelta(hours=hour))]
+                )
+            )
+            log_files.append(str(log_file))
+        expected = {
+            (ATTACKER_ARN, "IAMUser", "ListUsers"): START_TIME + timedelta(hours=4)
+        }
+
+        assert (
+            aggregate_log_files(log_files, ["ListUsers"], START_TIME, processes=1)
+            == expected
+        )
+        assert (
+            aggregate_log_files(iter(log_files), ["ListUsers"], START_TIME, processes=2)
+            == expected
+        )
+        # Naive start times are UTC
+        assert (
+            aggregate_log_files(
+                log_files,
+                ["ListUsers"],
+                START_TIME.replace(tzinfo=None) + timedelta(hours=5),
+                processes=1,
+            )
+            == {}
+        )
@@ -1010,6 +1010,39 @@ nTTxU4a7x1naFxzYXK1iQ1vMARKMjDb19QEJIEJKZlDK4uS7yMlf1nFS
 
         assert iam.user_temporary_credentials_usage[(username, user_arn)]
 
+    @mock_aws
+    def test_get_last_accessed_services_in_progress_jobs(self):
+        iam_client = client("iam")
+        user_names = ["test-user-1", "test-user-2", "test-user-3"]
+        for user_name in user_names:
+            iam_client.create_user(UserName=user_name)
+        # Every job is in progress the first time it is polled
+        polled_jobs = set()
+
+        def mock_make_api_call_in_progress(self, operation_name, kwargs):
+            if operation_name == "GetServiceLastAccessedDetails":
+                if kwargs["JobId"] not in polled_jobs:
+                    polled_jobs.add(kwargs["JobId"])
+                    return {"JobStatus": "IN_PROGRESS"}
+            return mock_make_api_call(self, operation_name, kwargs)
+
+        aws_provider = set_mocked_aws_provider([AWS_REGION_US_EAST_1])
+        with patch(
+            "botocore.client.BaseClient._make_api_call",
+            new=mock_make_api_call_in_progress,
+        ), patch(
+            "prowler.providers.aws.lib.service.service.JOBS_INITIAL_POLL_DELAY",
+            new=0,
+        ):
+            iam = IAM(aws_provider)
+
+        assert len(polled_jobs) == 3
+        assert [user_name for user_name, _ in iam.last_accessed_services] == [
+            user.name for user in iam.users
+        ]
+        for services_last_accessed in iam.last_accessed_services.values():
+            assert services_last_accessed == IAM_LAST_ACCESSED_SERVICES
+
     @mock_aws(config={"iam": {"load_aws_managed_policies": True}})
     def test_list_entities_attached_to_cloudshell_policy(self):
         iam_client = client("iam")
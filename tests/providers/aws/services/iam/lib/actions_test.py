@@ -0,0 +1,93 @@
+from prowler.providers.aws.services.iam.lib.actions import (
+    actions_to_bitset,
+    bitset_to_actions,
+    expand_action_pattern,
+    expand_action_pattern_bitset,
+    expand_action_patterns_bitset,
+    get_all_actions,
+    get_all_actions_bitset,
+    get_effective_actions_bitset,
+)
+
+
+class Test_Actions:
+    def test_get_all_actions_is_cached(self):
+        all_actions = get_all_actions()
+        assert get_all_actions() is all_actions
+        assert "s3:GetObject" in all_actions
+        assert "iam:PassRole" in all_actions
+
+    def test_expand_action_pattern(self):
+        expanded = expand_action_pattern("s3:GetObject*")
+        assert "s3:GetObject" in expanded
+        assert "s3:GetObjectAcl" in expanded
+        assert "s3:PutObject" not in expanded
+        assert expanded.issubset(get_all_actions())
+
+    def test_expand_action_pattern_all(self):
+        assert expand_action_pattern("*") is get_all_actions()
+
+    def test_expand_action_pattern_invalid(self):
+        assert expand_action_pattern("invalidservice:InvalidAction") == frozenset()
+
+    def test_bitset_round_trip_sparse(self):
+        actions = {"s3:GetObject", "ec2:RunInstances", "iam:PassRole"}
+        assert bitset_to_actions(actions_to_bitset(actions)) == actions
+
+    def test_bitset_round_trip_medium(self):
+        actions = set(expand_action_pattern("ec2:*"))
+        assert len(actions) > 64
+        assert bitset_to_actions(actions_to_bitset(actions)) == actions
+
+    def test_bitset_round_trip_dense(self):
+        actions = set(get_all_actions()) - {"s3:GetObject"}
+        assert bitset_to_actions(actions_to_bitset(actions)) == actions
+
+    def test_bitset_empty(self):
+        assert actions_to_bitset(set()) == 0
+        assert bitset_to_actions(0) == set()
+
+    def test_actions_to_bitset_ignores_unknown_actions(self):
+        assert actions_to_bitset({"invalidservice:InvalidAction"}) == 0
+
+    def test_all_actions_bitset(self):
+        assert bitset_to_actions(get_all_actions_bitset()) == set(get_all_actions())
+        assert expand_action_pattern_bitset("*") == get_all_actions_bitset()
+
+    def test_bitset_algebra(self):
+        s3_get = expand_action_patterns_bitset({"s3:Get*"})
+        s3_object = expand_action_patterns_bitset({"s3:*Object"})
+        assert bitset_to_actions(s3_get & s3_object) == set(
+            expand_action_pattern("s3:Get*")
+        ) & set(expand_action_pattern("s3:*Object"))
+        assert bitset_to_actions(s3_get & ~s3_object) == set(
+            expand_action_pattern("s3:Get*")
+        ) - set(expand_action_pattern("s3:*Object"))
+        assert bitset_to_actions(s3_get | s3_object) == set(
+            expand_action_pattern("s3:Get*")
+        ) | set(expand_action_pattern("s3:*Object"))
+
+    def test_get_effective_actions_bitset_allow_deny(self):
+        statements = (
+            (True, frozenset({"s3:GetObject", "s3:PutObject"}), frozenset()),
+            (False, frozenset({"s3:GetObject"}), frozenset()),
+        )
+        assert bitset_to_actions(get_effective_actions_bitset(statements)) == {
+            "s3:PutObject"
+        }
+
+    def test_get_effective_actions_bitset_allow_not_action(self):
+        statements = ((True, frozenset(), frozenset({"iam:*"})),)
+        effective_actions = bitset_to_actions(get_effective_actions_bitset(statements))
+        assert effective_actions == set(get_all_actions()) - set(
+            expand_action_pattern("iam:*")
+        )
+
+    def test_get_effective_actions_bitset_deny_not_action(self):
+        statements = (
+            (True, frozenset({"*"}), frozenset()),
+            (False, frozenset(), frozenset({"s3:GetObject"})),
+        )
+        assert bitset_to_actions(get_effective_actions_bitset(statements)) == {
+            "s3:GetObject"
+        }
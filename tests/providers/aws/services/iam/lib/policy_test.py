@@ -1,6 +1,9 @@
+from unittest import mock
+
 import pytest
 
 from prowler.providers.aws.services.iam.lib.policy import (
+    PolicyDocument,
     _get_patterns_from_standard_value,
     check_admin_access,
     check_full_service_access,
@@ -2451,3 +2454,100 @@ def test_has_codebuild_trusted_principal_list():
         ],
     }
     assert has_codebuild_trusted_principal(trust_policy) is True
+
+
+class Test_PolicyDocument:
+    policy = {
+        "Version": "2012-10-17",
+        "Statement": [
+            {
+                "Effect": "Allow",
+                "Principal": {"AWS": "*"},
+                "Action": "s3:*",
+                "Resource": "*",
+                "Condition": {
+                    "StringEquals": {"AWS:SourceAccount": TRUSTED_AWS_ACCOUNT_NUMBER}
+                },
+            },
+            {"Effect": "Deny", "Action": "s3:DeleteBucket", "Resource": "*"},
+        ],
+    }
+
+    def test_from_policy_shared_by_content(self):
+        policy_document = PolicyDocument.from_policy(self.policy)
+        same_content_policy = {
+            "Statement": [dict(statement) for statement in self.policy["Statement"]],
+            "Version": "2012-10-17",
+        }
+        assert PolicyDocument.from_policy(same_content_policy) is policy_document
+        assert (
+            PolicyDocument.from_policy({"Version": "2012-10-17", "Statement": []})
+            is not policy_document
+        )
+
+    def test_from_policy_does_not_alias_policy(self):
+        policy = {
+            "Statement": [
+                {
+                    "Effect": "Allow",
+                    "Principal": "*",
+                    "Action": "s3:GetObject",
+                    "Resource": "*",
+                    "Condition": {
+                        "StringEquals": {
+                            "AWS:SourceAccount": NON_TRUSTED_AWS_ACCOUNT_NUMBER
+                        }
+                    },
+                }
+            ]
+        }
+        assert not is_policy_public(policy, TRUSTED_AWS_ACCOUNT_NUMBER)
+        # The caller's policy is not modified while evaluating the conditions
+        assert (
+            "AWS:SourceAccount" in policy["Statement"][0]["Condition"]["StringEquals"]
+        )
+
+    def test_statements_normalized(self):
+        policy_document = PolicyDocument.from_policy(
+            {
+                "Statement": {
+                    "Effect": " Allow ",
+                    "Action": "s3:GetObject",
+                    "NotAction": ["iam:*"],
+                    "Resource": "*",
+                }
+            }
+        )
+        assert len(policy_document.statements) == 1
+        statement = policy_document.statements[0]
+        assert statement.effect == "allow"
+        assert statement.action_patterns == frozenset({"s3:GetObject"})
+        assert statement.not_action_patterns == frozenset({"iam:*"})
+        assert statement.resources == ("*",)
+
+    def test_effective_actions(self):
+        policy_document = PolicyDocument.from_policy(self.policy)
+        assert "s3:GetObject" in policy_document.effective_actions
+        assert "s3:DeleteBucket" not in policy_document.effective_actions
+        assert get_effective_actions(self.policy) == set(
+            policy_document.effective_actions
+        )
+
+    def test_facts_evaluated_once(self):
+        # A document not shared with other tests, so the mocked facts do not leak
+        policy_document = PolicyDocument(self.policy)
+        with mock.patch(
+            "prowler.providers.aws.services.iam.lib.policy._is_policy_public",
+            return_value=True,
+        ) as evaluate_is_policy_public:
+            for _ in range(2):
+                policy_document.is_public(
+                    "111111111111", not_allowed_actions=["s3:GetObject"]
+                )
+            assert evaluate_is_policy_public.call_count == 1
+            # Different arguments are evaluated on their own
+            policy_document.is_public("111111111111")
+            assert evaluate_is_policy_public.call_count == 2
+
+        assert policy_document.has_full_service_access("s3") is False
+        assert policy_document._full_service_access == {"s3": False}
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from prowler.providers.aws.services.iam.lib.privilege_escalation import (
     check_privilege_escalation,
     privilege_escalation_policies_combination,
@@ -168,3 +170,19 @@ class Test_PrivilegeEscalation:
                 assert (
                     f"'{pattern}'" in result
                 ), f"Expected pattern '{pattern}' not found in result: {result}"
+
+    def test_check_privilege_escalation_invalid_required_action_is_not_matched(
+        self,
+    ):
+        policy = {
+            "Version": "2012-10-17",
+            "Statement": [
+                {"Effect": "Allow", "Action": "iam:PassRole", "Resource": "*"}
+            ],
+        }
+        with patch.dict(
+            privilege_escalation_policies_combination,
+            {"PassRole+Invalid": {"iam:PassRole", "invalidservice:InvalidAction"}},
+            clear=True,
+        ):
+            assert check_privilege_escalation(policy) == ""
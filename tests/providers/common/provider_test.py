@@ -0,0 +1,79 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from unittest import mock
+
+from prowler.providers.common.provider import Provider, ServiceClient
+
+
+class Service:
+    def __init__(self, provider):
+        self.provider = provider
+        self.account = provider.identity.account
+        self.resources = []
+
+
+class TestProvider:
+    def test_get_global_provider_scope(self):
+        global_provider = mock.MagicMock()
+        scoped_provider = mock.MagicMock()
+        with mock.patch.object(Provider, "_global", global_provider):
+            assert Provider.get_global_provider() is global_provider
+            with Provider.scope(scoped_provider):
+                assert Provider.get_global_provider() is scoped_provider
+            assert Provider.get_global_provider() is global_provider
+
+    def test_get_service_registry(self):
+        provider = mock.MagicMock()
+        registry = Provider.get_service_registry(provider)
+
+        assert Provider.get_service_registry(provider) is registry
+        assert Provider.get_service_registry(mock.MagicMock()) is not registry
+
+        service = registry.get(Service)
+        assert service.provider is provider
+        assert registry.get(Service) is service
+
+        registry.clear()
+        assert registry.get(Service) is not service
+
+
+class TestServiceClient:
+    def test_service_client(self):
+        provider = mock.MagicMock()
+        provider.identity.account = "123456789012"
+        client = ServiceClient(Service)
+
+        with Provider.scope(provider):
+            assert client.account == "123456789012"
+            client.resources = ["resource"]
+            assert client.resources == ["resource"]
+            assert (
+                client._resolve_service()
+                is Provider.get_service_registry(provider).get(Service)
+            )
+        assert repr(client) == "ServiceClient(Service)"
+
+    def test_service_client_concurrent_providers(self):
+        providers = []
+        for account in ["111111111111", "222222222222", "333333333333"]:
+            provider = mock.MagicMock()
+            provider.identity.account = account
+            providers.append(provider)
+        client = ServiceClient(Service)
+        barrier = Barrier(len(providers))
+
+        def scan(provider):
+            with Provider.scope(provider):
+                # All the scans are running at the same time
+                barrier.wait()
+                client.resources.append(provider.identity.account)
+                return client.account, client.resources
+
+        with ThreadPoolExecutor(max_workers=len(providers)) as executor:
+            results = list(executor.map(scan, providers))
+
+        assert results == [
+            ("111111111111", ["111111111111"]),
+            ("222222222222", ["222222222222"]),
+            ("333333333333", ["333333333333"]),
+        ]